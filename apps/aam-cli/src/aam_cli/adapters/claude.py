@@ -21,7 +21,7 @@ import shutil
 from pathlib import Path
 
 from aam_cli.core.manifest import ArtifactRef
-from aam_cli.utils.naming import parse_package_name, to_filesystem_name
+from aam_cli.utils.naming import package_fs_name
 
 ################################################################################
 #                                                                              #
@@ -388,8 +388,7 @@ class ClaudeAdapter:
         convert to ``scope--name``. Otherwise, return as-is.
         """
         if artifact_name.startswith("@") and "/" in artifact_name:
-            scope, base = parse_package_name(artifact_name)
-            return to_filesystem_name(scope, base)
+            return package_fs_name(artifact_name)
         return artifact_name
 
     def _read_agent_content(self, agent_path: Path, agent_ref: ArtifactRef) -> str:
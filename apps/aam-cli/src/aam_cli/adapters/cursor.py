@@ -20,7 +20,7 @@ import shutil
 from pathlib import Path
 
 from aam_cli.core.manifest import AgentDefinition, ArtifactRef
-from aam_cli.utils.naming import parse_package_name, to_filesystem_name
+from aam_cli.utils.naming import package_fs_name
 from aam_cli.utils.yaml_utils import load_yaml
 
 ################################################################################
@@ -313,8 +313,7 @@ class CursorAdapter:
         convert to ``scope--name``. Otherwise, return as-is.
         """
         if artifact_name.startswith("@") and "/" in artifact_name:
-            scope, base = parse_package_name(artifact_name)
-            return to_filesystem_name(scope, base)
+            return package_fs_name(artifact_name)
         return artifact_name
 
     def _generate_agent_mdc(
@@ -14,7 +14,6 @@ import logging
 
 import click
 from rich.console import Console
-from rich.table import Table
 
 from aam_cli.core.config import load_config, save_global_config
 
@@ -165,6 +164,8 @@ def config_get(ctx: click.Context, key: str) -> None:
 @click.pass_context
 def config_list(ctx: click.Context) -> None:
     """List all configuration values."""
+    from rich.table import Table
+
     console: Console = ctx.obj["console"]
 
     cfg = load_config()
@@ -19,16 +19,18 @@ sources that have been registered with ``aam source add``.
 ################################################################################
 
 import logging
+import os
 import shutil
+from collections import Counter
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import click
+import yaml
 from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Confirm, Prompt
-from rich.table import Table
+from rich.text import Text
 
 from aam_cli.detection.scanner import (
     KNOWN_PLATFORMS,
@@ -36,7 +38,7 @@ from aam_cli.detection.scanner import (
     scan_project,
 )
 from aam_cli.utils.naming import format_invalid_package_name_message, validate_package_name
-from aam_cli.utils.yaml_utils import dump_yaml
+from aam_cli.utils.yaml_utils import dump_yaml, load_yaml
 
 ################################################################################
 #                                                                              #
@@ -56,6 +58,23 @@ logger = logging.getLogger(__name__)
 # Artifact type ordering for display
 TYPE_ORDER: list[str] = ["skill", "agent", "prompt", "instruction"]
 
+# Canonical package directory (and manifest section key) for each type
+TYPE_DIRS: dict[str, str] = {
+    "skill": "skills",
+    "agent": "agents",
+    "prompt": "prompts",
+    "instruction": "instructions",
+}
+
+# Group heading shown in the interactive selection list
+TYPE_LABELS: dict[str, str] = {t: t.capitalize() + "s" for t in TYPE_ORDER}
+
+# --type values (singular or plural, lower-cased) -> artifact type
+TYPE_ALIASES: dict[str, str] = {
+    **{t: t for t in TYPE_ORDER},
+    **{plural: t for t, plural in TYPE_DIRS.items()},
+}
+
 # Rich colour for each platform badge
 PLATFORM_COLORS: dict[str, str] = {
     "cursor": "bright_blue",
@@ -64,6 +83,73 @@ PLATFORM_COLORS: dict[str, str] = {
     "codex": "bright_magenta",
 }
 
+################################################################################
+#                                                                              #
+# EXISTING MANIFEST                                                            #
+#                                                                              #
+################################################################################
+
+
+@lru_cache(maxsize=16)
+def _read_manifest_artifacts(
+    manifest_path: str, mtime_ns: int
+) -> dict[str, list[dict[str, Any]]]:
+    """Parse the ``artifacts`` sections declared in an ``aam.yaml``.
+
+    ``mtime_ns`` is only part of the cache key, so an edited manifest is
+    re-parsed while an unchanged one is served from the cache.  The
+    result is shared between callers and must not be mutated.
+    """
+    data = load_yaml(Path(manifest_path))
+    sections = data.get("artifacts") or {}
+    if not isinstance(sections, dict):
+        return {}
+
+    return {
+        str(section): [ref for ref in refs if isinstance(ref, dict)]
+        for section, refs in sections.items()
+        if isinstance(refs, list)
+    }
+
+
+def _read_existing_manifest(project_path: Path) -> dict[str, list[dict[str, Any]]]:
+    """Return the artifact sections already declared in ``aam.yaml``.
+
+    Returns an empty dict when the project has no manifest or it cannot
+    be parsed.
+    """
+    manifest_path = project_path / "aam.yaml"
+    try:
+        mtime_ns = os.stat(manifest_path).st_mtime_ns
+    except FileNotFoundError:
+        return {}
+
+    try:
+        sections = _read_manifest_artifacts(str(manifest_path), mtime_ns)
+    except (OSError, yaml.YAMLError) as exc:
+        logger.warning(f"Could not read existing manifest '{manifest_path}': {exc}")
+        return {}
+
+    return {section: [dict(ref) for ref in refs] for section, refs in sections.items()}
+
+
+def _merge_existing_artifacts(
+    manifest_data: dict[str, Any],
+    existing: dict[str, list[dict[str, Any]]],
+) -> None:
+    """Keep *existing* artifact entries ahead of the newly generated ones.
+
+    Generated entries whose path is already declared are dropped, so a
+    re-run adds new artifacts without losing or duplicating old ones.
+    *existing* becomes the manifest's ``artifacts`` mapping.
+    """
+    for section, refs in manifest_data["artifacts"].items():
+        target = existing.setdefault(section, [])
+        declared = {Path(str(ref.get("path", ""))).as_posix() for ref in target}
+        target.extend(ref for ref in refs if Path(ref["path"]).as_posix() not in declared)
+    manifest_data["artifacts"] = existing
+
+
 ################################################################################
 #                                                                              #
 # INTERACTIVE SELECTION                                                        #
@@ -79,34 +165,54 @@ def _platform_badge(platform: str | None) -> str:
     return f" [{colour}][{platform}][/{colour}]"
 
 
-def _display_detected(
-    console: Console,
+def _group_artifacts(
     artifacts: list[DetectedArtifact],
-    selected: set[int],
-) -> None:
-    """Display detected artifacts grouped by type with selection checkboxes."""
+) -> dict[str, list[tuple[int, DetectedArtifact]]]:
+    """Group artifacts by type, keeping each artifact's index in the list.
+
+    Toggling a selection never changes group membership, so the result
+    can be built once and reused for every redraw.
+    """
     grouped: dict[str, list[tuple[int, DetectedArtifact]]] = {}
     for idx, art in enumerate(artifacts):
         grouped.setdefault(art.type, []).append((idx, art))
+    return grouped
+
+
+def _format_row(display_idx: int, art: DetectedArtifact, checked: bool) -> str:
+    """Format one selectable artifact row of the interactive list."""
+    check = "[green]x[/green]" if checked else " "
+    badge = _platform_badge(art.platform)
+    return (
+        f"    [{check}] {display_idx:>2}. [cyan]{art.name:<20}[/cyan]"
+        f" {art.source_path}{badge}"
+    )
+
+
+def _display_detected(
+    console: Console,
+    grouped: dict[str, list[tuple[int, DetectedArtifact]]],
+    selected: set[int],
+) -> None:
+    """Display detected artifacts grouped by type with selection checkboxes.
 
+    Rows are joined and printed in one call so Rich parses markup once
+    for the whole list instead of once per artifact.
+    """
+    lines: list[str] = []
     display_idx = 1
     for atype in TYPE_ORDER:
         group = grouped.get(atype, [])
         if not group:
             continue
 
-        label = atype.capitalize() + "s"
-        console.print(f"\n  [bold]{label} ({len(group)}):[/bold]")
-
+        lines.append(f"\n  [bold]{TYPE_LABELS[atype]} ({len(group)}):[/bold]")
         for real_idx, art in group:
-            check = "[green]x[/green]" if real_idx in selected else " "
-            badge = _platform_badge(art.platform)
-            console.print(
-                f"    [{check}] {display_idx:>2}. [cyan]{art.name:<20}[/cyan]"
-                f" {art.source_path}{badge}"
-            )
+            lines.append(_format_row(display_idx, art, real_idx in selected))
             display_idx += 1
 
+    console.print("\n".join(lines), highlight=False)
+
 
 def _interactive_select(
     console: Console,
@@ -125,6 +231,8 @@ def _interactive_select(
     Returns:
         list[DetectedArtifact]: The artifacts the user chose to keep.
     """
+    from rich.prompt import Prompt
+
     if not artifacts:
         return []
 
@@ -132,9 +240,10 @@ def _interactive_select(
     # All selected by default
     # -----
     selected: set[int] = set(range(len(artifacts)))
+    grouped = _group_artifacts(artifacts)
 
     console.print("\n[bold]Found artifacts:[/bold]")
-    _display_detected(console, artifacts, selected)
+    _display_detected(console, grouped, selected)
 
     console.print(
         "\n[dim]Enter numbers (space-separated) to toggle selection on/off.[/dim]"
@@ -146,17 +255,19 @@ def _interactive_select(
     )
 
     # -----
-    # Build display-index → real-index mapping
+    # Build display-index ↔ real-index mappings
     # -----
     display_to_real: dict[int, int] = {}
     display_idx = 1
     for atype in TYPE_ORDER:
-        for real_idx, art in enumerate(artifacts):
-            if art.type == atype:
-                display_to_real[display_idx] = real_idx
-                display_idx += 1
+        for real_idx, _art in grouped.get(atype, []):
+            display_to_real[display_idx] = real_idx
+            display_idx += 1
+    real_to_display = {real: disp for disp, real in display_to_real.items()}
 
     while True:
+        previous = set(selected)
+
         # -----
         # Show current selection count in the prompt so the user always
         # knows how many items are selected and what to do next.
@@ -174,10 +285,8 @@ def _interactive_select(
             break
         elif response == "a":
             selected = set(range(len(artifacts)))
-            _display_detected(console, artifacts, selected)
         elif response == "n":
             selected = set()
-            _display_detected(console, artifacts, selected)
         else:
             # -----
             # Toggle individual items and provide feedback
@@ -198,13 +307,26 @@ def _interactive_select(
                         console.print(
                             f"  [yellow]Unknown item: {disp}[/yellow]"
                         )
-            _display_detected(console, artifacts, selected)
             if toggled_labels:
                 console.print(
                     f"  [dim]Toggled: {', '.join(toggled_labels)} — "
                     f"{len(selected)}/{len(artifacts)} selected[/dim]"
                 )
 
+        # -----
+        # Redraw only the rows whose checkbox changed instead of
+        # re-printing the whole list after every command.
+        # -----
+        changed = sorted(previous ^ selected, key=real_to_display.__getitem__)
+        if changed:
+            console.print(
+                "\n".join(
+                    _format_row(real_to_display[real], artifacts[real], real in selected)
+                    for real in changed
+                ),
+                highlight=False,
+            )
+
     logger.info(
         f"Interactive selection complete: "
         f"{len(selected)}/{len(artifacts)} artifacts selected"
@@ -224,20 +346,17 @@ def _print_scan_summary(
     artifacts: list[DetectedArtifact],
 ) -> None:
     """Print a compact summary table of the scan results."""
+    from rich.table import Table
+
     # -----
     # Count by platform
     # -----
-    by_platform: dict[str, int] = {}
-    for art in artifacts:
-        key = art.platform or "generic"
-        by_platform[key] = by_platform.get(key, 0) + 1
+    by_platform = Counter(art.platform or "generic" for art in artifacts)
 
     # -----
     # Count by type
     # -----
-    by_type: dict[str, int] = {}
-    for art in artifacts:
-        by_type[art.type] = by_type.get(art.type, 0) + 1
+    by_type = Counter(art.type for art in artifacts)
 
     table = Table(show_header=False, box=None, padding=(0, 2))
     table.add_column("label", style="dim")
@@ -271,13 +390,7 @@ def _artifact_target_path(art: DetectedArtifact, organize: str) -> str:
         return str(art.source_path)
 
     # For copy / move: map into canonical AAM structure
-    type_dirs = {
-        "skill": "skills",
-        "agent": "agents",
-        "prompt": "prompts",
-        "instruction": "instructions",
-    }
-    base = type_dirs[art.type]
+    base = TYPE_DIRS[art.type]
 
     if art.type in ("skill", "agent"):
         return f"{base}/{art.name}/"
@@ -308,7 +421,7 @@ def _generate_manifest_dict(
             "path": target,
             "description": art.description or f"{art.type.capitalize()} {art.name}",
         }
-        grouped[art.type + "s"].append(ref)
+        grouped[TYPE_DIRS[art.type]].append(ref)
 
     data: dict[str, Any] = {
         "name": name,
@@ -332,6 +445,19 @@ def _generate_manifest_dict(
     return data
 
 
+def _print_manifest_preview(console: Console, manifest_data: dict[str, Any]) -> None:
+    """Print the would-be ``aam.yaml`` inside a panel for ``--dry-run``.
+
+    The YAML is wrapped in a plain :class:`Text` so Rich does not run
+    its markup parser and highlighter over the whole document (which is
+    slow for large manifests and mangles ``[...]`` in descriptions).
+    """
+    from rich.panel import Panel
+
+    content = yaml.safe_dump(manifest_data, default_flow_style=False, sort_keys=False)
+    console.print(Panel(Text(content), title="aam.yaml", border_style="blue"))
+
+
 ################################################################################
 #                                                                              #
 # FILE OPERATIONS                                                              #
@@ -418,6 +544,9 @@ def _create_from_source(
         output_dir: Directory to write package into.
         yes: Skip confirmation prompts.
     """
+    from rich.prompt import Confirm, Prompt
+    from rich.table import Table
+
     from aam_cli.services.source_service import scan_source
 
     logger.info(
@@ -452,7 +581,7 @@ def _create_from_source(
     # Step 2: Filter by type if requested
     # -----
     if artifact_types:
-        type_set = set(artifact_types)
+        type_set = {TYPE_ALIASES.get(t.lower(), t) for t in artifact_types}
         artifacts = [a for a in artifacts if a["type"] in type_set]
 
     # -----
@@ -565,7 +694,7 @@ def _create_from_source(
     }
     for art in artifacts:
         art_type = art["type"]
-        type_key = art_type + "s"
+        type_key = TYPE_DIRS[art_type]
 
         if art_type in ("skill", "agent"):
             target_path = f"{type_key}/{art['name']}/"
@@ -606,18 +735,14 @@ def _create_from_source(
         console.print("  aam.yaml (with provenance)")
         for art in artifacts:
             art_type = art["type"]
-            type_key = art_type + "s"
+            type_key = TYPE_DIRS[art_type]
             if art_type in ("skill", "agent"):
                 console.print(f"  {type_key}/{art['name']}/")
             else:
                 console.print(f"  {type_key}/{art['name']}.md")
 
-        import yaml
-        content = yaml.safe_dump(
-            manifest_data, default_flow_style=False, sort_keys=False
-        )
         console.print("\n[yellow]\\[Dry run — no files written][/yellow]")
-        console.print(Panel(content, title="aam.yaml", border_style="blue"))
+        _print_manifest_preview(console, manifest_data)
         return
 
     console.print("\n[bold]Creating package from remote source...[/bold]")
@@ -668,7 +793,7 @@ def _create_from_source(
     # -----
     for art in artifacts:
         art_type = art["type"]
-        type_key = art_type + "s"
+        type_key = TYPE_DIRS[art_type]
         art_path = art.get("path", "")
 
         # Source: the artifact in the cached clone
@@ -723,12 +848,7 @@ def _create_from_source(
     # -----
     # Summary
     # -----
-    type_counts: dict[str, int] = {}
-    for art in artifacts:
-        label = art["type"] + "s"
-        type_counts[label] = type_counts.get(label, 0) + 1
-
-    parts = [f"{count} {label}" for label, count in type_counts.items()]
+    parts = [f"{len(refs)} {label}" for label, refs in grouped.items() if refs]
     summary = ", ".join(parts)
 
     console.print(
@@ -854,6 +974,8 @@ def create_package(
         aam create-package --from-source openai/skills --all --name my-skills --yes
         aam create-package --from-source openai/skills --artifacts gh-fix-ci --artifacts coder
     """
+    from rich.prompt import Confirm, Prompt
+
     console: Console = ctx.obj["console"]
     project_path = Path(path)
     out_dir = Path(output_dir) if output_dir else project_path
@@ -896,17 +1018,20 @@ def create_package(
 
     # Filter by type if requested
     if artifact_types:
-        type_set = set(artifact_types)
+        type_set = {TYPE_ALIASES.get(t.lower(), t) for t in artifact_types}
         artifacts = [a for a in artifacts if a.type in type_set]
 
     # Add manual includes
     if includes:
         inc_type = include_as or "skill"
         for inc_path in includes:
+            # Derive the name with os.path; a Path is only built for storage
+            base = os.path.basename(os.path.normpath(inc_path))
+            inc_name = os.path.splitext(base)[0] if os.path.isfile(inc_path) else base
             inc = Path(inc_path)
             artifacts.append(
                 DetectedArtifact(
-                    name=inc.stem if inc.is_file() else inc.name,
+                    name=inc_name,
                     type=inc_type,
                     source_path=inc,
                     description=f"Manually included from {inc}",
@@ -963,8 +1088,8 @@ def create_package(
         author = pkg_author or ""
         license_str = "Apache-2.0"
     else:
-        # Interactive prompts
-        default_name = project_path.resolve().name
+        # Interactive prompts (click already resolved PATH to an absolute path)
+        default_name = project_path.name
         if pkg_scope:
             default_name = f"@{pkg_scope}/{default_name}"
 
@@ -997,6 +1122,12 @@ def create_package(
 
     manifest_path = out_dir / "aam.yaml"
 
+    # Rewriting the project's own aam.yaml keeps what it already declares
+    if manifest_path.resolve() == (project_path / "aam.yaml").resolve():
+        existing = _read_existing_manifest(project_path)
+        if existing:
+            _merge_existing_artifacts(manifest_data, existing)
+
     if dry_run:
         console.print("\n[bold]Would create:[/bold]")
         console.print("  aam.yaml")
@@ -1010,11 +1141,8 @@ def create_package(
                     console,
                     dry_run=True,
                 )
-        import yaml
-
-        content = yaml.safe_dump(manifest_data, default_flow_style=False, sort_keys=False)
         console.print("\n[yellow]\\[Dry run — no files written][/yellow]")
-        console.print(Panel(content, title="aam.yaml", border_style="blue"))
+        _print_manifest_preview(console, manifest_data)
         return
 
     # -----
@@ -1039,16 +1167,17 @@ def create_package(
     # -----
     # Summary
     # -----
-    type_counts: dict[str, int] = {}
-    for art in selected:
-        label = art.type + "s"
-        type_counts[label] = type_counts.get(label, 0) + 1
-
-    parts = [f"{count} {label}" for label, count in type_counts.items()]
+    # Reuse the per-type grouping already built for the manifest
+    parts = [
+        f"{len(refs)} {label}"
+        for label, refs in manifest_data["artifacts"].items()
+        if refs
+    ]
     summary = ", ".join(parts)
+    total = sum(len(refs) for refs in manifest_data["artifacts"].values())
 
     console.print(f"\n[green]✓[/green] Package created: [bold]{name}@{version}[/bold]")
-    console.print(f"  {len(selected)} artifacts ({summary})")
+    console.print(f"  {total} artifacts ({summary})")
     console.print()
     console.print("[bold]Next steps:[/bold]")
     console.print("  [cyan]aam validate[/cyan]    — verify the package is well-formed")
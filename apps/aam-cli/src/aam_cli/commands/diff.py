@@ -1,8 +1,11 @@
 """Diff command for AAM CLI.
 
 Shows unified diff output for modified files in installed packages.
-Uses Python's ``difflib`` to compute diffs without requiring the
-system ``diff`` command.
+Original file contents are read from the lock file and compared with
+the files on disk.  With the optional ``fast`` extra installed, hunks
+come from libgit2's Myers O(ND) diff via ``pygit2``, or from
+``cdifflib`` (a C ``difflib.SequenceMatcher``); otherwise the standard
+library is used.  No system ``diff`` command is required.
 
 Reference: contracts/cli-commands.md (aam diff)
 """
@@ -13,21 +16,62 @@ Reference: contracts/cli-commands.md (aam diff)
 #                                                                              #
 ################################################################################
 
-import difflib
 import json
 import logging
+import os
 import sys
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache, partial
+from itertools import islice
 from pathlib import Path
-from typing import Any
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
 
 import click
 from rich.console import Console
-from rich.syntax import Syntax
 
 from aam_cli.core.workspace import read_lock_file
-from aam_cli.services.checksum_service import verify_package
+from aam_cli.services.checksum_service import (
+    compute_stat_fingerprint,
+    decode_original,
+    verify_package,
+)
 from aam_cli.utils.paths import get_packages_dir
 
+if TYPE_CHECKING:
+    from rich.syntax import SyntaxTheme
+
+# -----
+# Prefer the native SequenceMatcher when the optional ``fast`` extra
+# is installed; the API and opcodes are identical.
+# -----
+try:
+    from cdifflib import CSequenceMatcher as SequenceMatcher
+except ImportError:
+    from difflib import SequenceMatcher
+
+# -----
+# libgit2's xdiff (Myers, linear in edit distance) when available
+# -----
+try:
+    import pygit2 as _pygit2
+
+    pygit2: ModuleType | None = _pygit2
+except ImportError:
+    pygit2 = None
+
+# -----
+# Native JSON encoder for ``--json`` output when available
+# -----
+try:
+    import orjson as _orjson
+
+    orjson: ModuleType | None = _orjson
+except ImportError:
+    orjson = None
+
 ################################################################################
 #                                                                              #
 # LOGGING                                                                      #
@@ -37,6 +81,15 @@ from aam_cli.utils.paths import get_packages_dir
 # Initialize logger for this module
 logger = logging.getLogger(__name__)
 
+################################################################################
+#                                                                              #
+# CONSTANTS                                                                    #
+#                                                                              #
+################################################################################
+
+# Upper bound on threads used to read and diff modified files
+MAX_DIFF_WORKERS: int = min(32, (os.cpu_count() or 1) * 4)
+
 ################################################################################
 #                                                                              #
 # CONSOLE                                                                      #
@@ -46,6 +99,197 @@ logger = logging.getLogger(__name__)
 console = Console()
 err_console = Console(stderr=True)
 
+################################################################################
+#                                                                              #
+# UNIFIED DIFF FORMATTING                                                      #
+#                                                                              #
+################################################################################
+
+
+def _format_range(start: int, stop: int) -> str:
+    """Format a hunk range in unified diff notation (``start,length``)."""
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return f"{beginning}"
+    if not length:
+        beginning -= 1
+    return f"{beginning},{length}"
+
+
+def _trimmed_opcodes(
+    original: list[bytes],
+    current: list[bytes],
+) -> list[tuple[str, int, int, int, int]]:
+    """Compute opcodes, skipping the common prefix and suffix.
+
+    Package edits are usually small and localized, so only the middle
+    region that actually differs is handed to the ``SequenceMatcher``, as
+    interned line ids.  The returned opcodes index into the full *original* / *current*
+    lists, exactly like ``SequenceMatcher.get_opcodes()``.
+    """
+    len_a, len_b = len(original), len(current)
+
+    # -----
+    # Walk the shared prefix, then the shared suffix of the remainder
+    # -----
+    prefix = 0
+    limit = min(len_a, len_b)
+    while prefix < limit and original[prefix] == current[prefix]:
+        prefix += 1
+
+    suffix = 0
+    limit -= prefix
+    while suffix < limit and original[len_a - 1 - suffix] == current[len_b - 1 - suffix]:
+        suffix += 1
+
+    # -----
+    # Diff the middle slices and shift them back into file coordinates
+    # -----
+    codes: list[tuple[str, int, int, int, int]] = []
+    if prefix:
+        codes.append(("equal", 0, prefix, 0, prefix))
+
+    # -----
+    # Intern each distinct line to a small int so the matcher hashes
+    # and compares ints rather than whole lines
+    # -----
+    vocab: dict[bytes, int] = {}
+    a_ids = [vocab.setdefault(line, len(vocab)) for line in original[prefix : len_a - suffix]]
+    b_ids = [vocab.setdefault(line, len(vocab)) for line in current[prefix : len_b - suffix]]
+
+    matcher = SequenceMatcher(None, a_ids, b_ids)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        codes.append((tag, i1 + prefix, i2 + prefix, j1 + prefix, j2 + prefix))
+
+    if suffix:
+        codes.append(("equal", len_a - suffix, len_a, len_b - suffix, len_b))
+
+    return codes
+
+
+def _group_opcodes(
+    codes: list[tuple[str, int, int, int, int]],
+    n: int,
+) -> Iterator[list[tuple[str, int, int, int, int]]]:
+    """Split opcodes into hunks with *n* lines of context.
+
+    Mirrors ``SequenceMatcher.get_grouped_opcodes`` for opcodes that
+    were not produced by a matcher instance.
+    """
+    if not codes:
+        codes = [("equal", 0, 1, 0, 1)]
+
+    # -----
+    # Trim leading / trailing context down to n lines
+    # -----
+    if codes[0][0] == "equal":
+        tag, i1, i2, j1, j2 = codes[0]
+        codes[0] = tag, max(i1, i2 - n), i2, max(j1, j2 - n), j2
+    if codes[-1][0] == "equal":
+        tag, i1, i2, j1, j2 = codes[-1]
+        codes[-1] = tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)
+
+    nn = n + n
+    group: list[tuple[str, int, int, int, int]] = []
+    for tag, i1, i2, j1, j2 in codes:
+        # -----
+        # Large unchanged runs end the current hunk and start the next
+        # -----
+        if tag == "equal" and i2 - i1 > nn:
+            group.append((tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)))
+            yield group
+            group = []
+            i1, j1 = max(i1, i2 - n), max(j1, j2 - n)
+        group.append((tag, i1, i2, j1, j2))
+
+    if group and not (len(group) == 1 and group[0][0] == "equal"):
+        yield group
+
+
+def _unified_diff(
+    original: list[bytes],
+    current: list[bytes],
+    fromfile: str,
+    tofile: str,
+    n: int = 3,
+) -> Iterator[str]:
+    """Yield unified diff lines, like :func:`difflib.unified_diff`.
+
+    Driven by the module-level ``SequenceMatcher`` so the native matcher
+    is used when available.  Lines are compared as raw bytes; only the
+    lines that end up in a hunk are decoded for display.  Header and
+    hunk markers carry no trailing newline (``lineterm=""``).
+    """
+    started = False
+    for group in _group_opcodes(_trimmed_opcodes(original, current), n):
+        if not started:
+            started = True
+            yield f"--- {fromfile}"
+            yield f"+++ {tofile}"
+
+        first, last = group[0], group[-1]
+        old_range = _format_range(first[1], last[2])
+        new_range = _format_range(first[3], last[4])
+        yield f"@@ -{old_range} +{new_range} @@"
+
+        for tag, i1, i2, j1, j2 in group:
+            if tag == "equal":
+                for line in original[i1:i2]:
+                    yield " " + line.decode("utf-8", "replace")
+                continue
+            if tag in ("replace", "delete"):
+                for line in original[i1:i2]:
+                    yield "-" + line.decode("utf-8", "replace")
+            if tag in ("replace", "insert"):
+                for line in current[j1:j2]:
+                    yield "+" + line.decode("utf-8", "replace")
+
+
+def _diff_file(original: bytes, current: bytes, rel_path: str) -> list[str]:
+    """Return unified diff lines (without newlines) for one file.
+
+    Uses ``pygit2`` when installed and the pure-Python path otherwise.
+    Both produce the same ``---`` / ``+++`` headers.
+
+    Args:
+        original: Original file bytes recorded at install time.
+        current: File bytes currently on disk.
+        rel_path: Path relative to the package root, used in headers.
+
+    Returns:
+        Diff lines; empty when the texts are identical.
+    """
+    fromfile = f"a/{rel_path} (original)"
+    tofile = f"b/{rel_path} (modified)"
+
+    if pygit2 is not None:
+        patch = pygit2.Patch.create_from(
+            original,
+            current,
+            old_as_path=rel_path,
+            new_as_path=rel_path,
+        )
+        # -----
+        # Keep libgit2's hunks, replace its git-style file header
+        # -----
+        lines = patch.text.splitlines() if patch is not None else []
+        for idx, line in enumerate(lines):
+            if line.startswith("@@"):
+                return [f"--- {fromfile}", f"+++ {tofile}", *lines[idx:]]
+        return []
+
+    return [
+        line.rstrip("\n")
+        for line in _unified_diff(
+            original.splitlines(keepends=True),
+            current.splitlines(keepends=True),
+            fromfile=fromfile,
+            tofile=tofile,
+        )
+    ]
+
+
 ################################################################################
 #                                                                              #
 # DIFF COMPUTATION                                                             #
@@ -53,49 +297,163 @@ err_console = Console(stderr=True)
 ################################################################################
 
 
+def _diff_one(
+    rel_path: str,
+    package_dir: Path,
+    originals: dict[str, str],
+) -> dict[str, Any] | None:
+    """Diff a single modified file against its recorded original.
+
+    Args:
+        rel_path: File path relative to the package root.
+        package_dir: Installed package directory.
+        originals: Encoded original contents from the lock file.
+
+    Returns:
+        Diff entry dict, or ``None`` if the file cannot be read
+        (e.g. it was removed after verification).
+    """
+    file_path = package_dir / rel_path
+
+    # -----
+    # Read current file content as bytes; lines are compared without
+    # decoding the whole file.  verify_package only reports files it
+    # has just hashed, so no separate existence check is needed — a
+    # file removed since then surfaces as OSError.
+    # -----
+    try:
+        current = file_path.read_bytes()
+    except OSError:
+        logger.warning(f"Cannot read file for diff: {file_path}")
+        return None
+
+    # -----
+    # Original content comes from the lock file; packages installed
+    # before originals were recorded diff against an empty file
+    # -----
+    blob = originals.get(rel_path)
+    original = decode_original(blob) if blob else b""
+
+    diff_lines = _diff_file(original, current, rel_path)
+
+    return {
+        "file": rel_path,
+        "diff": "\n".join(diff_lines),
+        "status": "modified",
+    }
+
+
+def _iter_diffs(
+    modified_files: list[str],
+    diff_one: Callable[[str], dict[str, Any] | None],
+) -> Iterator[dict[str, Any]]:
+    """Yield diff entries in order while diffing ahead on a thread pool.
+
+    At most ``2 * workers`` files are in flight, so a consumer that
+    renders each entry as it arrives never holds every diff at once.
+
+    Args:
+        modified_files: Relative paths in verification order.
+        diff_one: Per-file diff function (see :func:`_diff_one`).
+
+    Yields:
+        Diff entry dicts; unreadable files are skipped.
+    """
+    if len(modified_files) <= 1:
+        for rel_path in modified_files:
+            entry = diff_one(rel_path)
+            if entry is not None:
+                yield entry
+        return
+
+    workers = min(MAX_DIFF_WORKERS, len(modified_files))
+    paths = iter(modified_files)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending: deque[Future[dict[str, Any] | None]] = deque(
+            executor.submit(diff_one, rel_path)
+            for rel_path in islice(paths, workers * 2)
+        )
+        while pending:
+            entry = pending.popleft().result()
+
+            # -----
+            # Refill the window before handing the entry to the consumer
+            # -----
+            next_path = next(paths, None)
+            if next_path is not None:
+                pending.append(executor.submit(diff_one, next_path))
+
+            if entry is not None:
+                yield entry
+
+
 def diff_package(
     package_name: str,
     project_dir: Path | None = None,
+    *,
+    as_list: bool = True,
+    compute_diffs: bool = True,
 ) -> dict[str, Any]:
     """Compute diffs for modified files in an installed package.
 
     First runs verification to identify modified files, then generates
-    unified diffs for each one.
+    unified diffs for each one.  When the package's stat fingerprint
+    still matches the one recorded at install, verification is skipped
+    and the package is reported unchanged.
 
     Args:
         package_name: Name of the installed package.
         project_dir: Project root directory.
+        as_list: When False, ``diffs`` is a lazy iterator so callers can
+            render each file as soon as it is ready.
+        compute_diffs: When False, modified files are listed with an
+            empty ``diff`` and are not read at all.
 
     Returns:
-        Dict with ``package_name``, ``diffs`` (list), ``modified_count``,
-        ``missing_files``, ``untracked_files``.
+        Dict with ``package_name``, ``diffs`` (list or iterator),
+        ``modified_count``, ``missing_files``, ``untracked_files``.
 
     Raises:
         ValueError: If the package is not installed or has no checksums.
     """
     logger.info(f"Computing diff: package='{package_name}'")
 
+    lock = read_lock_file(project_dir)
+    locked = lock.packages.get(package_name)
+    package_dir = get_packages_dir(project_dir) / package_name
+
     # -----
-    # Step 1: Verify to identify changes
+    # Step 1: Fast path — unchanged file metadata means nothing to diff
     # -----
-    verify_result = verify_package(package_name, project_dir)
-
-    if not verify_result["has_checksums"]:
-        return {
-            "package_name": package_name,
-            "has_checksums": False,
-            "diffs": [],
-            "modified_count": 0,
-            "missing_files": [],
-            "untracked_files": [],
-        }
+    if (
+        locked is not None
+        and locked.file_checksums is not None
+        and locked.file_checksums.stat_fingerprint
+        and package_dir.is_dir()
+    ):
+        fingerprint, disk_files = compute_stat_fingerprint(
+            package_dir, locked.file_checksums.files
+        )
+        if fingerprint == locked.file_checksums.stat_fingerprint:
+            logger.info(f"Diff fast path: '{package_name}' unchanged since install")
+            recorded = locked.file_checksums.files
+            on_disk = set(disk_files)
+            return {
+                "package_name": package_name,
+                "has_checksums": True,
+                "diffs": [],
+                "modified_count": 0,
+                "missing_files": [f for f in recorded if f not in on_disk],
+                "untracked_files": sorted(on_disk.difference(recorded)),
+            }
 
     # -----
-    # Step 2: Read lock file to get original checksums
+    # Step 2: Verify to identify changes
     # -----
-    lock = read_lock_file(project_dir)
-    locked = lock.packages.get(package_name)
-    if locked is None or locked.file_checksums is None:
+    verify_result = verify_package(package_name, project_dir)
+
+    if not verify_result["has_checksums"] or locked is None or locked.file_checksums is None:
         return {
             "package_name": package_name,
             "has_checksums": False,
@@ -108,56 +466,67 @@ def diff_package(
     # -----
     # Step 3: Generate unified diffs for modified files
     # -----
-    packages_dir = get_packages_dir(project_dir)
-    package_dir = packages_dir / package_name
-    diffs: list[dict[str, Any]] = []
-
-    for rel_path in verify_result["modified_files"]:
-        file_path = package_dir / rel_path
-
-        if not file_path.is_file():
-            continue
-
-        # -----
-        # Read current file content
-        # -----
-        try:
-            current_lines = file_path.read_text(encoding="utf-8").splitlines(keepends=True)
-        except (OSError, UnicodeDecodeError):
-            logger.warning(f"Cannot read file for diff: {file_path}")
-            continue
+    modified_files: list[str] = verify_result["modified_files"]
+    diff_one = partial(
+        _diff_one,
+        package_dir=package_dir,
+        originals=locked.file_checksums.originals,
+    )
 
-        # -----
-        # We don't have the original content stored, so we note this
-        # The original would come from the package archive if available
-        # For now, show only current content with a note
-        # -----
-        diff_lines = list(
-            difflib.unified_diff(
-                [],  # Empty = original not available
-                current_lines,
-                fromfile=f"a/{rel_path} (original)",
-                tofile=f"b/{rel_path} (modified)",
-                lineterm="",
-            )
+    # -----
+    # Files are independent; read and diff them concurrently while
+    # keeping the verification order
+    # -----
+    if compute_diffs:
+        diffs = _iter_diffs(modified_files, diff_one)
+    else:
+        diffs = iter(
+            {"file": rel_path, "diff": "", "status": "modified"}
+            for rel_path in modified_files
         )
 
-        diffs.append({
-            "file": rel_path,
-            "diff": "\n".join(diff_lines),
-            "status": "modified",
-        })
-
     return {
         "package_name": package_name,
         "has_checksums": True,
-        "diffs": diffs,
-        "modified_count": len(verify_result["modified_files"]),
+        "diffs": list(diffs) if as_list else diffs,
+        "modified_count": len(modified_files),
         "missing_files": verify_result["missing_files"],
         "untracked_files": verify_result["untracked_files"],
     }
 
 
+################################################################################
+#                                                                              #
+# RENDERING                                                                    #
+#                                                                              #
+################################################################################
+
+
+def _to_json(data: dict[str, Any]) -> str:
+    """Serialize a diff result with 2-space indentation.
+
+    Uses ``orjson`` when installed (large diff texts encode several
+    times faster) and the standard library otherwise.
+    """
+    if orjson is not None:
+        return str(orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8"))
+    return json.dumps(data, indent=2)
+
+
+@lru_cache(maxsize=1)
+def _diff_highlighting() -> tuple[Any, "SyntaxTheme"]:
+    """Return the Pygments diff lexer and Rich theme, built once.
+
+    Passing instances to :class:`~rich.syntax.Syntax` skips the per-file
+    lexer lookup and theme construction.  Imported lazily so that other
+    commands do not pay for Pygments at startup.
+    """
+    from pygments.lexers.diff import DiffLexer
+    from rich.syntax import Syntax
+
+    return DiffLexer(), Syntax.get_theme("monokai")
+
+
 ################################################################################
 #                                                                              #
 # COMMAND                                                                      #
@@ -168,7 +537,12 @@ def diff_package(
 @click.command("diff")
 @click.argument("package")
 @click.option("--json", "output_json", is_flag=True, help="Output as JSON")
-def diff_cmd(package: str, output_json: bool) -> None:
+@click.option(
+    "--summary",
+    is_flag=True,
+    help="List changed files without computing diffs",
+)
+def diff_cmd(package: str, output_json: bool, summary: bool) -> None:
     """Show differences in installed package files.
 
     Displays a unified diff for each modified file in the installed
@@ -181,65 +555,77 @@ def diff_cmd(package: str, output_json: bool) -> None:
       aam diff my-package
 
       aam diff my-package --json
+
+      aam diff my-package --summary --json
     """
     logger.info(f"CLI diff: package='{package}'")
 
     try:
-        result = diff_package(package)
+        result = diff_package(
+            package,
+            as_list=output_json,
+            compute_diffs=not summary,
+        )
     except ValueError as e:
         err_console.print(f"[red]Error:[/red] {e}")
         sys.exit(1)
 
     if output_json:
-        click.echo(json.dumps(result, indent=2))
+        click.echo(_to_json(result))
         return
 
     # -----
     # Rich output
     # -----
-    console.print()
+    name = result["package_name"]
 
     if not result["has_checksums"]:
-        console.print(
-            f"[yellow]⚠[/yellow] No file checksums available for "
-            f"'{result['package_name']}'"
-        )
-        console.print()
+        console.print(f"\n[yellow]⚠[/yellow] No file checksums available for '{name}'\n")
         return
 
-    if not result["diffs"] and not result["missing_files"]:
-        console.print(
-            f"[green]✓[/green] '{result['package_name']}' — No changes"
-        )
-        console.print()
+    if not result["modified_count"] and not result["missing_files"]:
+        console.print(f"\n[green]✓[/green] '{name}' — No changes\n")
         return
 
     console.print(
-        f"[bold]{result['package_name']}[/bold] — "
-        f"{result['modified_count']} modified file(s)"
+        f"\n[bold]{name}[/bold] — {result['modified_count']} modified file(s)\n"
     )
-    console.print()
 
+    from rich.console import Group
+    from rich.syntax import Syntax
+    from rich.text import Text
+
+    # -----
+    # Render each file as soon as its diff is ready, one print per file
+    # -----
+    lexer, theme = _diff_highlighting()
     for diff_entry in result["diffs"]:
-        console.print(f"  [yellow]{diff_entry['file']}[/yellow]")
+        parts: list[Any] = [Text.from_markup(f"  [yellow]{diff_entry['file']}[/yellow]")]
         if diff_entry["diff"]:
-            syntax = Syntax(
-                diff_entry["diff"],
-                "diff",
-                theme="monokai",
-                line_numbers=False,
+            parts.append(
+                Syntax(
+                    diff_entry["diff"],
+                    lexer,
+                    theme=theme,
+                    line_numbers=False,
+                )
             )
-            console.print(syntax)
-        console.print()
+        parts.append(Text())
+        console.print(Group(*parts))
 
+    # -----
+    # Missing / untracked file lists in a single render
+    # -----
+    lines: list[str] = []
     if result["missing_files"]:
-        console.print(f"  [red]Missing files ({len(result['missing_files'])}):[/red]")
-        for f in result["missing_files"]:
-            console.print(f"    [red]-[/red] {f}")
-        console.print()
+        lines.append(f"  [red]Missing files ({len(result['missing_files'])}):[/red]")
+        lines.extend(f"    [red]-[/red] {f}" for f in result["missing_files"])
+        lines.append("")
 
     if result["untracked_files"]:
-        console.print(f"  [dim]Untracked files ({len(result['untracked_files'])}):[/dim]")
-        for f in result["untracked_files"]:
-            console.print(f"    [dim]+[/dim] {f}")
-        console.print()
+        lines.append(f"  [dim]Untracked files ({len(result['untracked_files'])}):[/dim]")
+        lines.extend(f"    [dim]+[/dim] {f}" for f in result["untracked_files"])
+        lines.append("")
+
+    if lines:
+        console.print("\n".join(lines))
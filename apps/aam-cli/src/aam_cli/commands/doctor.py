@@ -14,7 +14,8 @@ import logging
 from pathlib import Path
 
 import click
-from rich.console import Console
+from rich.console import Console, Group
+from rich.text import Text
 
 from aam_cli.services.doctor_service import run_diagnostics
 
@@ -58,6 +59,9 @@ def doctor(ctx: click.Context) -> None:
 
         aam doctor
     """
+    from rich.padding import Padding
+    from rich.table import Table
+
     console: Console = ctx.obj["console"]
     project_dir = Path.cwd()
 
@@ -71,21 +75,25 @@ def doctor(ctx: click.Context) -> None:
     report = run_diagnostics(project_dir)
 
     # -----
-    # Display individual check results
+    # Display check results and summary in a single render: one grid
+    # row per check, with any suggestion under its message
     # -----
+    grid = Table.grid(padding=(0, 1))
+    grid.add_column(no_wrap=True)
+    grid.add_column()
     for check in report["checks"]:
         symbol = STATUS_SYMBOLS.get(check["status"], "?")
-        console.print(f"  {symbol} {check['message']}")
-
+        message = Text(check["message"])
         if check.get("suggestion"):
-            console.print(f"      [dim]{check['suggestion']}[/dim]")
+            message.append(f"\n  {check['suggestion']}", style="dim")
+        grid.add_row(symbol, message)
 
-    # -----
-    # Display summary
-    # -----
-    console.print()
     if report["healthy"]:
-        console.print(f"[green]✓[/green] {report['summary']}")
+        summary = f"[green]✓[/green] {report['summary']}"
     else:
-        console.print(f"[red]✗[/red] {report['summary']}")
+        summary = f"[red]✗[/red] {report['summary']}"
+
+    console.print(Group(Padding(grid, (0, 0, 0, 2), expand=False), Text(), summary))
+
+    if not report["healthy"]:
         ctx.exit(1)
@@ -9,16 +9,17 @@ Scaffolds a brand-new AAM package interactively using Rich prompts.
 #                                                                              #
 ################################################################################
 
+import contextlib
+import json
 import logging
+import os
 from pathlib import Path
 from typing import Any
 
 import click
 from rich.console import Console
-from rich.prompt import Confirm, Prompt
 
 from aam_cli.utils.naming import format_invalid_package_name_message, validate_package_name
-from aam_cli.utils.yaml_utils import dump_yaml
 
 ################################################################################
 #                                                                              #
@@ -38,6 +39,93 @@ logger = logging.getLogger(__name__)
 ARTIFACT_TYPES: list[str] = ["skills", "agents", "prompts", "instructions"]
 PLATFORM_NAMES: list[str] = ["cursor", "claude", "copilot", "codex"]
 
+# Default ``platforms:`` config written for each selected platform
+PLATFORM_TEMPLATES: dict[str, dict[str, Any]] = {
+    "cursor": {"skill_scope": "project", "deploy_instructions_as": "rules"},
+    "claude": {"merge_instructions": True},
+    "copilot": {"merge_instructions": True},
+    "codex": {"skill_scope": "project"},
+}
+
+################################################################################
+#                                                                              #
+# PROMPT HELPERS                                                               #
+#                                                                              #
+################################################################################
+
+
+def _ask_choices(
+    console: Console,
+    options: list[str],
+    default: list[str],
+) -> list[str]:
+    """Ask for several options in a single comma-separated prompt.
+
+    Replaces one yes/no prompt per option.  Re-prompts on unknown names;
+    ``none`` selects nothing.
+
+    Args:
+        console: Rich console for error output.
+        options: Allowed option names, in display order.
+        default: Options selected when the user just presses Enter.
+
+    Returns:
+        Selected options in *options* order.
+    """
+    from rich.prompt import Prompt
+
+    while True:
+        answer = Prompt.ask(
+            f"  {', '.join(options)} (comma-separated, or 'none')",
+            default=", ".join(default),
+        )
+        picked = {part.strip().lower() for part in answer.split(",") if part.strip()}
+        if picked == {"none"}:
+            return []
+
+        unknown = picked.difference(options)
+        if not unknown:
+            return [option for option in options if option in picked]
+
+        console.print(f"[red]Unknown choice(s): {', '.join(sorted(unknown))}[/red]")
+
+
+################################################################################
+#                                                                              #
+# MANIFEST OUTPUT                                                              #
+#                                                                              #
+################################################################################
+
+
+def _scaffold_yaml_lines(data: dict[str, Any], indent: str = "") -> list[str]:
+    """Render a scaffold mapping as block-style YAML lines.
+
+    Scalars and empty collections are written with ``json.dumps``; JSON
+    is valid YAML flow syntax, so strings are always safely quoted.
+    """
+    lines: list[str] = []
+    for key, value in data.items():
+        if isinstance(value, dict) and value:
+            lines.append(f"{indent}{key}:")
+            lines.extend(_scaffold_yaml_lines(value, indent + "  "))
+        else:
+            lines.append(f"{indent}{key}: {json.dumps(value, ensure_ascii=False)}")
+    return lines
+
+
+def _emit_scaffold_yaml(manifest_data: dict[str, Any], path: Path) -> None:
+    """Write the fixed-schema ``aam.yaml`` produced by ``aam init``.
+
+    The scaffold only holds strings, booleans, empty lists and small
+    nested mappings, so the general-purpose YAML emitter is not needed.
+
+    Args:
+        manifest_data: Manifest built by :func:`init_package`.
+        path: Target ``aam.yaml`` path (parent must exist).
+    """
+    path.write_text("\n".join(_scaffold_yaml_lines(manifest_data)) + "\n", encoding="utf-8")
+
+
 ################################################################################
 #                                                                              #
 # COMMAND                                                                      #
@@ -59,6 +147,8 @@ def init_package(ctx: click.Context, name: str | None) -> None:
         aam init my-package
         aam init @author/my-package
     """
+    from rich.prompt import Prompt
+
     console: Console = ctx.obj["console"]
 
     # -----
@@ -81,22 +171,13 @@ def init_package(ctx: click.Context, name: str | None) -> None:
     # Step 2: Select artifact types
     # -----
     console.print("\n[bold]What artifacts will this package contain?[/bold]")
-    selected_types: list[str] = []
-
-    for atype in ARTIFACT_TYPES:
-        if Confirm.ask(f"  {atype.capitalize()}", default=True):
-            selected_types.append(atype)
+    selected_types = _ask_choices(console, ARTIFACT_TYPES, default=ARTIFACT_TYPES)
 
     # -----
     # Step 3: Select platforms
     # -----
     console.print("\n[bold]Which platforms should this package support?[/bold]")
-    selected_platforms: list[str] = []
-
-    for pname in PLATFORM_NAMES:
-        default = pname == "cursor"
-        if Confirm.ask(f"  {pname.capitalize()}", default=default):
-            selected_platforms.append(pname)
+    selected_platforms = _ask_choices(console, PLATFORM_NAMES, default=["cursor"])
 
     # -----
     # Step 4: Create directory structure
@@ -106,8 +187,13 @@ def init_package(ctx: click.Context, name: str | None) -> None:
     if name:
         pkg_dir.mkdir(parents=True, exist_ok=True)
 
+    # -----
+    # pkg_dir is known to exist now, so each type directory is a single
+    # mkdir without walking its parents
+    # -----
     for atype in selected_types:
-        (pkg_dir / atype).mkdir(parents=True, exist_ok=True)
+        with contextlib.suppress(FileExistsError):
+            os.mkdir(pkg_dir / atype)
 
     # -----
     # Step 5: Generate aam.yaml
@@ -127,22 +213,13 @@ def init_package(ctx: click.Context, name: str | None) -> None:
 
     manifest_data["dependencies"] = {}
 
-    platforms_config: dict[str, Any] = {}
-    if "cursor" in selected_platforms:
-        platforms_config["cursor"] = {
-            "skill_scope": "project",
-            "deploy_instructions_as": "rules",
-        }
-    if "claude" in selected_platforms:
-        platforms_config["claude"] = {"merge_instructions": True}
-    if "copilot" in selected_platforms:
-        platforms_config["copilot"] = {"merge_instructions": True}
-    if "codex" in selected_platforms:
-        platforms_config["codex"] = {"skill_scope": "project"}
-
-    manifest_data["platforms"] = platforms_config
+    manifest_data["platforms"] = {
+        pname: dict(PLATFORM_TEMPLATES[pname])
+        for pname in selected_platforms
+        if pname in PLATFORM_TEMPLATES
+    }
 
-    dump_yaml(manifest_data, pkg_dir / "aam.yaml")
+    _emit_scaffold_yaml(manifest_data, pkg_dir / "aam.yaml")
 
     # -----
     # Step 6: Register default community sources
@@ -151,15 +228,14 @@ def init_package(ctx: click.Context, name: str | None) -> None:
         from aam_cli.services.source_service import register_default_sources
 
         defaults_result = register_default_sources()
-        if defaults_result["registered"]:
-            console.print(
-                f"\n[dim]Registered {len(defaults_result['registered'])} "
-                f"default source(s):[/dim]"
-            )
-            for src_name in defaults_result["registered"]:
-                console.print(f"  [dim]• {src_name}[/dim]")
+        registered = defaults_result["registered"]
+        if registered:
             console.print(
-                "[dim]Run 'aam source scan <name>' to browse available artifacts[/dim]"
+                "\n".join([
+                    f"\n[dim]Registered {len(registered)} default source(s):[/dim]",
+                    *(f"  [dim]• {src_name}[/dim]" for src_name in registered),
+                    "[dim]Run 'aam source scan <name>' to browse available artifacts[/dim]",
+                ])
             )
     except Exception as e:
         # -----
@@ -172,12 +248,12 @@ def init_package(ctx: click.Context, name: str | None) -> None:
     # -----
     display_name = pkg_name.split("/")[-1] if "/" in pkg_name else pkg_name
 
-    console.print(f"\nCreated {display_name}/")
-    console.print("  ├── aam.yaml")
+    lines = [f"\nCreated {display_name}/", "  ├── aam.yaml"]
     for idx, atype in enumerate(selected_types):
         prefix = "└──" if idx == len(selected_types) - 1 else "├──"
-        console.print(f"  {prefix} {atype}/")
+        lines.append(f"  {prefix} {atype}/")
 
-    console.print(f"\n[green]✓[/green] Package initialized: [bold]{pkg_name}[/bold]")
+    lines.append(f"\n[green]✓[/green] Package initialized: [bold]{pkg_name}[/bold]")
+    console.print("\n".join(lines))
 
     logger.info(f"Initialized new package: name='{pkg_name}', dir='{pkg_dir}'")
@@ -12,33 +12,45 @@ and deploys artifacts to the target platform.
 ################################################################################
 
 import logging
+import os
 import shutil
+import stat
+import tempfile
+import threading
+from functools import lru_cache
 from pathlib import Path
 
 import click
 from rich.console import Console
 
 from aam_cli.adapters.factory import create_adapter, is_supported_platform
-from aam_cli.core.config import AamConfig, load_config
-from aam_cli.core.installer import install_packages
+from aam_cli.core.config import AamConfig, RegistrySource, load_config
 from aam_cli.core.manifest import load_manifest
-from aam_cli.core.resolver import resolve_dependencies
 from aam_cli.core.workspace import (
     FileChecksums,
     LockedPackage,
+    LockFile,
     ensure_workspace,
     get_packages_dir,
     is_package_installed,
     read_lock_file,
     write_lock_file,
 )
-from aam_cli.registry.factory import create_registry
-from aam_cli.utils.archive import extract_archive
-from aam_cli.utils.checksum import calculate_sha256
-from aam_cli.utils.naming import parse_package_name, parse_package_spec, to_filesystem_name
-from aam_cli.utils.paths import resolve_project_dir
+from aam_cli.registry.cache import MetadataCache
+from aam_cli.registry.factory import LazyRegistryList, create_registry
+from aam_cli.services.checksum_service import (
+    compute_file_originals,
+    compute_stat_fingerprint,
+)
+from aam_cli.utils.archive import extract_archive_with_digest
+from aam_cli.utils.naming import package_fs_name, parse_package_spec
+from aam_cli.utils.paths import (
+    copytree_reflink,
+    get_resolve_cache_dir,
+    resolve_project_dir,
+)
 from aam_cli.utils.text_match import find_similar_names
-from aam_cli.utils.yaml_utils import load_yaml_optional
+from aam_cli.utils.yaml_utils import load_yaml_key
 
 ################################################################################
 #                                                                              #
@@ -61,6 +73,7 @@ def _handle_upgrade_warning(
     package_name: str,
     project_dir: Path,
     force: bool,
+    lock: LockFile | None = None,
 ) -> bool:
     """Check for local modifications and warn the user before overwriting.
 
@@ -72,16 +85,26 @@ def _handle_upgrade_warning(
         package_name: Name of the package being upgraded.
         project_dir: Project root directory.
         force: If True, skip the interactive prompt and overwrite.
+        lock: Already-loaded lock file. When given, the lock file is not
+            read from disk again.
 
     Returns:
         True if the upgrade should proceed, False to abort.
     """
+    # -----
+    # Nothing to compare against without recorded checksums
+    # -----
+    if lock is not None:
+        entry = lock.packages.get(package_name)
+        if entry is None or entry.file_checksums is None:
+            return True
+
     from aam_cli.services.checksum_service import (
         check_modifications,
         create_backup,
     )
 
-    mod_result = check_modifications(package_name, project_dir)
+    mod_result = check_modifications(package_name, project_dir, lock=lock)
 
     # -----
     # No checksums or no modifications — proceed silently
@@ -95,24 +118,25 @@ def _handle_upgrade_warning(
     modified = mod_result["modified_files"]
     missing = mod_result["missing_files"]
 
-    console.print(
+    # Collect the listing and print it in one call
+    lines = [
         f"\n[yellow]⚠  Warning:[/yellow] Package [bold]{package_name}[/bold] "
         f"has local modifications:"
-    )
+    ]
 
     if modified:
-        console.print(f"  [yellow]Modified:[/yellow] {len(modified)} file(s)")
-        for f in modified[:5]:
-            console.print(f"    • {f}")
+        lines.append(f"  [yellow]Modified:[/yellow] {len(modified)} file(s)")
+        lines.extend(f"    • {f}" for f in modified[:5])
         if len(modified) > 5:
-            console.print(f"    [dim]... and {len(modified) - 5} more[/dim]")
+            lines.append(f"    [dim]... and {len(modified) - 5} more[/dim]")
 
     if missing:
-        console.print(f"  [red]Missing:[/red] {len(missing)} file(s)")
-        for f in missing[:5]:
-            console.print(f"    • {f}")
+        lines.append(f"  [red]Missing:[/red] {len(missing)} file(s)")
+        lines.extend(f"    • {f}" for f in missing[:5])
         if len(missing) > 5:
-            console.print(f"    [dim]... and {len(missing) - 5} more[/dim]")
+            lines.append(f"    [dim]... and {len(missing) - 5} more[/dim]")
+
+    console.print("\n".join(lines))
 
     # -----
     # If --force, proceed without prompt
@@ -189,6 +213,28 @@ def _handle_upgrade_warning(
 ################################################################################
 
 
+@lru_cache(maxsize=256)
+def _read_checksums_section(
+    manifest_path: str, mtime_ns: int, size: int
+) -> tuple[str, tuple[tuple[str, str], ...]] | None:
+    """Parse the ``file_checksums`` section of an ``aam.yaml``.
+
+    ``mtime_ns`` and ``size`` are only part of the cache key, so an edited
+    manifest is re-parsed while an unchanged one is served from the cache.
+    The result is immutable so cached entries cannot be mutated by callers.
+    """
+    checksums_data = load_yaml_key(Path(manifest_path), "file_checksums")
+    if not checksums_data or not isinstance(checksums_data, dict):
+        return None
+
+    files = checksums_data.get("files", {})
+    if not files:
+        return None
+
+    algorithm = checksums_data.get("algorithm", "sha256")
+    return algorithm, tuple(files.items())
+
+
 def _read_file_checksums_from_package(
     package_dir: Path,
 ) -> FileChecksums | None:
@@ -207,29 +253,31 @@ def _read_file_checksums_from_package(
     """
 
     manifest_path = package_dir / "aam.yaml"
-    if not manifest_path.is_file():
+    try:
+        st = os.stat(manifest_path)
+    except OSError:
         return None
-
-    data = load_yaml_optional(manifest_path)
-    if not data:
+    if not stat.S_ISREG(st.st_mode):
         return None
 
-    checksums_data = data.get("file_checksums")
-    if not checksums_data or not isinstance(checksums_data, dict):
+    section = _read_checksums_section(str(manifest_path), st.st_mtime_ns, st.st_size)
+    if section is None:
         return None
 
-    files = checksums_data.get("files", {})
-    if not files:
-        return None
-
-    algorithm = checksums_data.get("algorithm", "sha256")
+    algorithm, items = section
+    files = dict(items)
 
     logger.info(
         f"Read file checksums from package: "
         f"algorithm='{algorithm}', files={len(files)}"
     )
 
-    return FileChecksums(algorithm=algorithm, files=files)
+    return FileChecksums(
+        algorithm=algorithm,
+        files=files,
+        originals=compute_file_originals(package_dir, list(files)),
+        stat_fingerprint=compute_stat_fingerprint(package_dir, files)[0],
+    )
 
 
 ################################################################################
@@ -245,6 +293,10 @@ def _read_file_checksums_from_package(
 @click.option("--no-deploy", is_flag=True, help="Download only, skip deployment")
 @click.option("--force", "-f", is_flag=True, help="Reinstall even if present")
 @click.option("--dry-run", is_flag=True, help="Preview without installing")
+@click.option(
+    "--refresh", is_flag=True,
+    help="Ignore cached registry metadata and re-read it",
+)
 @click.option(
     "--global", "-g", "is_global", is_flag=True,
     help="Install to global ~/.aam/ directory",
@@ -257,6 +309,7 @@ def install(
     no_deploy: bool,
     force: bool,
     dry_run: bool,
+    refresh: bool,
     is_global: bool,
 ) -> None:
     """Install a package and deploy artifacts.
@@ -280,6 +333,7 @@ def install(
         aam install my-package-1.0.0.aam
         aam install my-agent --no-deploy
         aam install my-agent --force
+        aam install my-agent --refresh
         aam install my-agent -g
     """
     console: Console = ctx.obj["console"]
@@ -297,10 +351,23 @@ def install(
     config = load_config(project_dir)
     platform_name = platform or config.default_platform
 
+    if refresh:
+        MetadataCache(get_resolve_cache_dir(project_dir)).clear()
+
+    # -----
+    # Read the lock file once; the install helpers check and update it
+    # in memory and write it back at the end.
+    # -----
+    lock = read_lock_file(project_dir)
+
     # -----
-    # Determine source type
+    # Determine source type (a single stat for path-like arguments)
     # -----
-    if package.endswith(".aam") and Path(package).is_file():
+    is_archive_arg = package.endswith(".aam")
+    is_dir_arg = package.startswith(("./", "/"))
+    mode = _stat_mode(package) if is_archive_arg or is_dir_arg else 0
+
+    if is_archive_arg and stat.S_ISREG(mode):
         _install_from_archive(
             ctx,
             console,
@@ -310,23 +377,23 @@ def install(
             no_deploy,
             force,
             dry_run,
+            lock,
         )
         return
 
-    if package.startswith("./") or package.startswith("/"):
-        local_path = Path(package).resolve()
-        if local_path.is_dir():
-            _install_from_directory(
-                ctx,
-                console,
-                local_path,
-                project_dir,
-                platform_name,
-                no_deploy,
-                force,
-                dry_run,
-            )
-            return
+    if is_dir_arg and stat.S_ISDIR(mode):
+        _install_from_directory(
+            ctx,
+            console,
+            Path(package).resolve(),
+            project_dir,
+            platform_name,
+            no_deploy,
+            force,
+            dry_run,
+            lock,
+        )
+        return
 
     # -----
     # Registry-based install (with source fallback)
@@ -341,6 +408,7 @@ def install(
         no_deploy,
         force,
         dry_run,
+        lock,
     )
 
 
@@ -351,6 +419,14 @@ def install(
 ################################################################################
 
 
+def _stat_mode(path: str) -> int:
+    """Return the ``st_mode`` of *path*, or ``0`` if it cannot be stat'ed."""
+    try:
+        return os.stat(path).st_mode
+    except OSError:
+        return 0
+
+
 def _collect_available_names(config: AamConfig) -> list[str]:
     """Collect all known package names from registries and sources.
 
@@ -442,6 +518,7 @@ def _install_from_registry_or_source(
     no_deploy: bool,
     force: bool,
     dry_run: bool,
+    lock: LockFile,
 ) -> None:
     """Install a package from registries, with source fallback.
 
@@ -483,17 +560,15 @@ def _install_from_registry_or_source(
         return
 
     # -----
-    # Check if already installed
+    # Check if already installed (one lookup in the loaded lock)
     # -----
-    if not force and is_package_installed(pkg_name, project_dir):
-        lock = read_lock_file(project_dir)
-        existing = lock.packages.get(pkg_name)
-        if existing:
-            console.print(
-                f"{pkg_name}@{existing.version} is already installed. "
-                f"Use --force to reinstall."
-            )
-            return
+    existing = None if force else lock.packages.get(pkg_name)
+    if existing is not None:
+        console.print(
+            f"{pkg_name}@{existing.version} is already installed. "
+            f"Use --force to reinstall."
+        )
+        return
 
     # -----
     # Step 3: Try registry resolution
@@ -504,80 +579,81 @@ def _install_from_registry_or_source(
         constraint = pkg_version or "*"
         console.print(f"Resolving {pkg_name}@{constraint}...")
 
-        registries = []
-        for reg_source in config.registries:
-            try:
-                registries.append(create_registry(reg_source))
-            except ValueError as exc:
-                # -----
-                # Skip unsupported registry types with a warning
-                # -----
-                logger.warning(
-                    f"Skipping registry '{reg_source.name}': {exc}"
-                )
-                console.print(
-                    f"[yellow]Warning:[/yellow] Skipping registry "
-                    f"'{reg_source.name}' — {exc}"
-                )
-
-        if not registries:
+        def _skip_registry(reg_source: RegistrySource, exc: ValueError) -> None:
             # -----
-            # All registries were unsupported — skip to source fallback
+            # Skip unsupported registry types with a warning
             # -----
-            logger.debug(
-                "No usable registries after filtering, "
-                "falling through to source"
+            logger.warning(
+                f"Skipping registry '{reg_source.name}': {exc}"
             )
-        else:
-            try:
-                resolved = resolve_dependencies(
-                    [(pkg_name, constraint)],
-                    registries,
+            console.print(
+                f"[yellow]Warning:[/yellow] Skipping registry "
+                f"'{reg_source.name}' — {exc}"
+            )
+
+        # The resolver and installer are only needed on this path; importing
+        # them here keeps them out of every other command's startup.
+        from aam_cli.core.installer import install_packages
+        from aam_cli.core.resolver import resolve_dependencies
+
+        # Registries are only built once resolution reaches them; if none
+        # is usable, resolution fails and we fall through to source.
+        registries = LazyRegistryList(config.registries, on_error=_skip_registry)
+
+        try:
+            resolved = resolve_dependencies(
+                [(pkg_name, constraint)],
+                registries,
+                cache=MetadataCache(get_resolve_cache_dir(project_dir)),
+            )
+
+            # One render and flush for the whole list
+            if resolved:
+                console.print(
+                    "\n".join(f"  + {pkg.name}@{pkg.version}" for pkg in resolved)
                 )
 
-                for pkg in resolved:
-                    console.print(f"  + {pkg.name}@{pkg.version}")
+            if dry_run:
+                console.print(
+                    "\n[yellow]\\[Dry run — no packages installed][/yellow]"
+                )
+                return
 
-                if dry_run:
+            adapter = None
+            if not no_deploy:
+                if not is_supported_platform(platform_name):
                     console.print(
-                        "\n[yellow]\\[Dry run — no packages installed][/yellow]"
+                        f"[red]Error:[/red] Unsupported platform "
+                        f"'{platform_name}'. "
+                        "Supported: cursor, copilot, claude, codex"
                     )
+                    ctx.exit(1)
                     return
+                adapter = create_adapter(platform_name, project_dir)
 
-                adapter = None
-                if not no_deploy:
-                    if not is_supported_platform(platform_name):
-                        console.print(
-                            f"[red]Error:[/red] Unsupported platform "
-                            f"'{platform_name}'. "
-                            "Supported: cursor, copilot, claude, codex"
-                        )
-                        ctx.exit(1)
-                        return
-                    adapter = create_adapter(platform_name, project_dir)
-
-                installed = install_packages(
-                    resolved,
-                    adapter,
-                    config,
-                    project_dir,
-                    no_deploy=no_deploy,
-                    force=force,
-                )
+            installed = install_packages(
+                resolved,
+                adapter,
+                config,
+                project_dir,
+                no_deploy=no_deploy,
+                force=force,
+                lock=lock,
+            )
 
-                console.print(
-                    f"\n[green]✓[/green] Installed {len(installed)} packages"
-                )
-                registry_resolved = True
-
-            except ValueError:
-                # -----
-                # Registry resolution failed — fall through to source
-                # -----
-                logger.debug(
-                    f"Registry resolution failed for '{pkg_name}', "
-                    f"trying source fallback"
-                )
+            console.print(
+                f"\n[green]✓[/green] Installed {len(installed)} packages"
+            )
+            registry_resolved = True
+
+        except ValueError:
+            # -----
+            # Registry resolution failed — fall through to source
+            # -----
+            logger.debug(
+                f"Registry resolution failed for '{pkg_name}', "
+                f"trying source fallback"
+            )
 
     # -----
     # Step 4: Source fallback for unqualified names
@@ -685,6 +761,7 @@ def _install_from_directory(
     no_deploy: bool,
     force: bool,
     dry_run: bool,
+    lock: LockFile,
 ) -> None:
     """Install a package from a local directory (FR-017)."""
     try:
@@ -704,9 +781,9 @@ def _install_from_directory(
     # Check for local modifications before overwriting (upgrade warning)
     # -----
     if (
-        is_package_installed(manifest.name, project_dir)
+        is_package_installed(manifest.name, lock=lock)
         and not _handle_upgrade_warning(
-            console, manifest.name, project_dir, force
+            console, manifest.name, project_dir, force, lock=lock
         )
     ):
         console.print("[yellow]Aborted.[/yellow]")
@@ -716,24 +793,32 @@ def _install_from_directory(
     # Copy to .aam/packages/
     # -----
     ensure_workspace(project_dir)
-    scope, base_name = parse_package_name(manifest.name)
-    fs_name = to_filesystem_name(scope, base_name)
-    dest = get_packages_dir(project_dir) / fs_name
-
-    if dest.exists():
-        shutil.rmtree(dest)
+    fs_name = package_fs_name(manifest.name)
+    packages_dir = get_packages_dir(project_dir)
+    dest = packages_dir / fs_name
 
-    shutil.copytree(source_dir, dest)
+    # -----
+    # Copy into a ``.partial`` staging dir inside .aam/, then rename it
+    # into place; the replaced tree is deleted in the background
+    # -----
+    partial = Path(tempfile.mkdtemp(prefix=".", suffix=".partial", dir=packages_dir.parent))
+    try:
+        # mkdtemp only reserves a unique name; copytree creates the directory
+        partial.rmdir()
+        copytree_reflink(source_dir, partial)
+        old_tree_remover = _swap_into_place(partial, dest)
+    finally:
+        shutil.rmtree(partial, ignore_errors=True)
 
     # -----
     # Deploy if needed
     # -----
     if not no_deploy:
         if is_supported_platform(platform_name):
-            adapter = create_adapter(platform_name, project_dir)
             from aam_cli.core.installer import _deploy_package
 
-            _deploy_package(dest, adapter)
+            adapter = create_adapter(platform_name, project_dir)
+            _deploy_package(dest, adapter, manifest)
         else:
             console.print(
                 f"[yellow]Warning:[/yellow] Unsupported platform '{platform_name}', "
@@ -744,7 +829,6 @@ def _install_from_directory(
     # Update lock file (with file checksums if available)
     # -----
     file_checksums = _read_file_checksums_from_package(dest)
-    lock = read_lock_file(project_dir)
     lock.packages[manifest.name] = LockedPackage(
         version=manifest.version,
         source="local",
@@ -754,6 +838,9 @@ def _install_from_directory(
     )
     write_lock_file(lock, project_dir)
 
+    if old_tree_remover is not None:
+        old_tree_remover.join()
+
     console.print(f"\n[green]✓[/green] Installed {manifest.name}@{manifest.version}")
     if file_checksums:
         console.print(
@@ -769,6 +856,51 @@ def _install_from_directory(
 ################################################################################
 
 
+def _swap_into_place(partial: Path, dest: Path) -> threading.Thread | None:
+    """Rename the staged tree *partial* to *dest*, replacing any old copy.
+
+    An existing *dest* is first renamed aside, so the package directory is
+    never half-deleted: if the final rename fails the old tree is restored.
+    Both paths must be on the same filesystem.
+
+    Deleting the old tree (one unlink per file) runs on a background
+    thread so it overlaps deployment and the lock file write; join the
+    returned thread before reporting success.
+
+    Args:
+        partial: Fully extracted staging directory.
+        dest: Final package directory.
+
+    Returns:
+        The thread removing the replaced tree, or ``None`` if *dest* did
+        not exist.
+    """
+    previous: Path | None = None
+    if dest.exists():
+        previous = partial.with_suffix(".old")
+        os.replace(dest, previous)
+
+    try:
+        os.replace(partial, dest)
+    except OSError:
+        if previous is not None:
+            os.replace(previous, dest)
+        raise
+
+    if previous is None:
+        return None
+
+    # Not a daemon: interpreter exit waits for it, so no ``.old`` tree leaks
+    remover = threading.Thread(
+        target=shutil.rmtree,
+        args=(previous,),
+        kwargs={"ignore_errors": True},
+        name=f"aam-rmtree-{dest.name}",
+    )
+    remover.start()
+    return remover
+
+
 def _install_from_archive(
     ctx: click.Context,
     console: Console,
@@ -778,6 +910,7 @@ def _install_from_archive(
     no_deploy: bool,
     force: bool,
     dry_run: bool,
+    lock: LockFile,
 ) -> None:
     """Install a package from a ``.aam`` archive file (FR-017)."""
     console.print(f"Installing from archive: {archive_path}...")
@@ -787,16 +920,19 @@ def _install_from_archive(
         return
 
     # -----
-    # Extract to temp, read manifest, then move to packages
+    # Extract straight into a ``.partial`` staging dir inside .aam/ (same
+    # filesystem as .aam/packages/), read the manifest from it, then rename
+    # it into place. Every byte is written once; the archive checksum is
+    # computed from the extraction read.
     # -----
-    import tempfile
-
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        tmp_path = Path(tmp_dir)
-        extract_archive(archive_path, tmp_path)
+    ensure_workspace(project_dir)
+    packages_dir = get_packages_dir(project_dir)
+    partial = Path(tempfile.mkdtemp(prefix=".", suffix=".partial", dir=packages_dir.parent))
+    try:
+        checksum = extract_archive_with_digest(archive_path, partial)
 
         try:
-            manifest = load_manifest(tmp_path)
+            manifest = load_manifest(partial)
         except (FileNotFoundError, Exception) as exc:
             console.print(f"[red]Error:[/red] {exc}")
             ctx.exit(1)
@@ -806,34 +942,31 @@ def _install_from_archive(
         # Check for local modifications before overwriting
         # -----
         if (
-            is_package_installed(manifest.name, project_dir)
+            is_package_installed(manifest.name, lock=lock)
             and not _handle_upgrade_warning(
-                console, manifest.name, project_dir, force
+                console, manifest.name, project_dir, force, lock=lock
             )
         ):
             console.print("[yellow]Aborted.[/yellow]")
             return
 
-        # Move to .aam/packages/
-        ensure_workspace(project_dir)
-        scope, base_name = parse_package_name(manifest.name)
-        fs_name = to_filesystem_name(scope, base_name)
-        dest = get_packages_dir(project_dir) / fs_name
+        # Rename into .aam/packages/
+        fs_name = package_fs_name(manifest.name)
+        dest = packages_dir / fs_name
 
-        if dest.exists():
-            shutil.rmtree(dest)
-
-        shutil.copytree(tmp_path, dest)
+        old_tree_remover = _swap_into_place(partial, dest)
+    finally:
+        shutil.rmtree(partial, ignore_errors=True)
 
     # -----
     # Deploy if needed
     # -----
     if not no_deploy:
         if is_supported_platform(platform_name):
-            adapter = create_adapter(platform_name, project_dir)
             from aam_cli.core.installer import _deploy_package
 
-            _deploy_package(dest, adapter)
+            adapter = create_adapter(platform_name, project_dir)
+            _deploy_package(dest, adapter, manifest)
         else:
             console.print(
                 f"[yellow]Warning:[/yellow] Unsupported platform '{platform_name}', "
@@ -843,9 +976,7 @@ def _install_from_archive(
     # -----
     # Update lock file (with file checksums if available)
     # -----
-    checksum = calculate_sha256(archive_path)
     file_checksums = _read_file_checksums_from_package(dest)
-    lock = read_lock_file(project_dir)
     lock.packages[manifest.name] = LockedPackage(
         version=manifest.version,
         source="local",
@@ -855,6 +986,9 @@ def _install_from_archive(
     )
     write_lock_file(lock, project_dir)
 
+    if old_tree_remover is not None:
+        old_tree_remover.join()
+
     console.print(f"\n[green]✓[/green] Installed {manifest.name}@{manifest.version}")
     if file_checksums:
         console.print(
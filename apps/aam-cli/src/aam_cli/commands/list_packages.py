@@ -16,15 +16,18 @@ from typing import TYPE_CHECKING
 
 import click
 from rich.console import Console
-from rich.table import Table
-from rich.tree import Tree
 
-from aam_cli.core.manifest import load_manifest
-from aam_cli.core.workspace import LockedPackage, LockFile, get_packages_dir, read_lock_file
-from aam_cli.utils.naming import parse_package_name, to_filesystem_name
+from aam_cli.core.workspace import (
+    LockedPackage,
+    LockFile,
+    read_installed_manifests,
+    read_lock_file,
+)
 from aam_cli.utils.paths import resolve_project_dir
 
 if TYPE_CHECKING:
+    from rich.tree import Tree
+
     from aam_cli.services.source_service import VirtualPackage
 
 ################################################################################
@@ -123,6 +126,8 @@ def _show_table(
     project_dir: Path,
 ) -> None:
     """Display packages as a flat table."""
+    from rich.table import Table
+
     console.print("[bold]Installed packages:[/bold]\n")
 
     table = Table(show_header=True, header_style="bold")
@@ -131,28 +136,20 @@ def _show_table(
     table.add_column("Source", style="magenta")
     table.add_column("Artifacts")
 
-    packages_dir = get_packages_dir(project_dir)
+    manifests = read_installed_manifests(lock, project_dir)
 
     for pkg_name, locked in lock.packages.items():
         # -----
-        # Try to read the manifest for artifact counts
+        # Use the (cached) manifest for artifact counts
         # -----
         artifact_info = ""
-        scope, base_name = parse_package_name(pkg_name)
-        fs_name = to_filesystem_name(scope, base_name)
-        pkg_dir = packages_dir / fs_name
-
-        if pkg_dir.is_dir():
-            try:
-                manifest = load_manifest(pkg_dir)
-                counts: dict[str, int] = {}
-                for atype, _ref in manifest.all_artifacts:
-                    counts[atype] = counts.get(atype, 0) + 1
-                parts = [f"{c} {t}" for t, c in counts.items()]
-                total = manifest.artifact_count
-                artifact_info = f"{total} ({', '.join(parts)})"
-            except Exception:
-                artifact_info = "?"
+        manifest = manifests.get(pkg_name)
+
+        if manifest is not None:
+            parts = [f"{c} {t}" for t, c in manifest.artifact_counts.items()]
+            artifact_info = f"{manifest.artifact_count} ({', '.join(parts)})"
+        elif pkg_name in manifests:
+            artifact_info = "?"
 
         table.add_row(
             pkg_name,
@@ -170,14 +167,17 @@ def _show_tree(
     _project_dir: Path,
 ) -> None:
     """Display packages as a dependency tree."""
+    from rich.tree import Tree
+
     # -----
     # Find root packages (not depended on by anything)
     # -----
-    all_deps: set[str] = set()
-    for locked in lock.packages.values():
-        all_deps.update(locked.dependencies.keys())
+    roots = lock.root_packages()
 
-    roots = [name for name in lock.packages if name not in all_deps]
+    # -----
+    # Subtrees already printed are shown once, then referenced
+    # -----
+    expanded: set[str] = set()
 
     for root_name in roots:
         locked = lock.packages[root_name]
@@ -187,7 +187,8 @@ def _show_tree(
             f" [dim]({source_label})[/dim]"
         )
 
-        _add_deps_to_tree(tree, locked, lock)
+        expanded.add(root_name)
+        _add_deps_to_tree(tree, locked, lock, expanded)
         console.print(tree)
 
 
@@ -195,15 +196,39 @@ def _add_deps_to_tree(
     parent: Tree,
     locked: LockedPackage,
     lock: LockFile,
+    expanded: set[str],
 ) -> None:
-    """Recursively add dependencies to a Rich Tree."""
-    for dep_name in locked.dependencies:
+    """Add dependencies to a Rich Tree, expanding each package only once.
+
+    Walks depth-first with an explicit stack. A package whose subtree was
+    already added (here or under an earlier root) gets a single
+    ``(see above)`` leaf instead, so shared dependencies cost O(V + E)
+    rather than one full re-walk per parent, and cycles terminate.
+
+    Args:
+        parent: Tree node to attach the dependencies to.
+        locked: Lock entry whose dependencies are added.
+        lock: Full lock file for looking up dependency entries.
+        expanded: Names of packages whose subtrees were already added;
+            updated in place.
+    """
+    stack: list[tuple[Tree, str]] = [(parent, name) for name in reversed(locked.dependencies)]
+
+    while stack:
+        node, dep_name = stack.pop()
         dep_locked = lock.packages.get(dep_name)
-        if dep_locked:
-            branch = parent.add(f"{dep_name}@{dep_locked.version}")
-            _add_deps_to_tree(branch, dep_locked, lock)
-        else:
-            parent.add(f"{dep_name} [dim](not installed)[/dim]")
+        if not dep_locked:
+            node.add(f"{dep_name} [dim](not installed)[/dim]")
+            continue
+
+        label = f"{dep_name}@{dep_locked.version}"
+        if dep_name in expanded:
+            node.add(f"{label} [dim](see above)[/dim]")
+            continue
+
+        expanded.add(dep_name)
+        branch = node.add(label)
+        stack.extend((branch, name) for name in reversed(dep_locked.dependencies))
 
 
 ################################################################################
@@ -218,6 +243,8 @@ def _show_available(console: Console) -> None:
 
     Groups artifacts by source name with type and description columns.
     """
+    from rich.table import Table
+
     from aam_cli.services.source_service import build_source_index
 
     logger.info("Listing available source artifacts")
@@ -14,12 +14,12 @@ Reference: spec 004 US4; contracts/cli-commands.md.
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 import click
 from rich.console import Console
-from rich.table import Table
 
-from aam_cli.core.config import AamConfig, load_config
+from aam_cli.core.config import AamConfig, SourceEntry, load_config
 from aam_cli.core.workspace import LockFile, read_lock_file
 from aam_cli.services.upgrade_service import OutdatedPackage, OutdatedResult
 from aam_cli.utils.paths import resolve_project_dir
@@ -33,6 +33,18 @@ from aam_cli.utils.paths import resolve_project_dir
 # Initialize logger for this module
 logger = logging.getLogger(__name__)
 
+################################################################################
+#                                                                              #
+# CONSTANTS                                                                    #
+#                                                                              #
+################################################################################
+
+# Sources are read concurrently; each read is a ``git`` subprocess.
+MAX_SOURCE_HEAD_WORKERS: int = 16
+
+# Sources not fetched for longer than this are reported as stale
+STALE_SOURCE_DAYS: int = 7
+
 ################################################################################
 #                                                                              #
 # COMMAND                                                                      #
@@ -62,6 +74,8 @@ def outdated(ctx: click.Context, output_json: bool, is_global: bool) -> None:
         aam outdated --json
         aam outdated -g
     """
+    from rich.table import Table
+
     console: Console = ctx.obj["console"]
     project_dir = resolve_project_dir(is_global)
 
@@ -166,6 +180,47 @@ def outdated(ctx: click.Context, output_json: bool, is_global: bool) -> None:
 ################################################################################
 
 
+def _read_source_head(source_entry: SourceEntry) -> tuple[str | None, bool]:
+    """Read one source's cached HEAD SHA and staleness.
+
+    Args:
+        source_entry: Configured source.
+
+    Returns:
+        ``(head_sha, stale)``. ``head_sha`` is ``None`` when the source
+        has no valid cache or it cannot be read.
+    """
+    from datetime import UTC, datetime
+
+    from aam_cli.services.git_service import get_cache_dir, get_head_sha, validate_cache
+    from aam_cli.utils.git_url import parse
+
+    head_sha: str | None = None
+    stale = False
+
+    try:
+        parsed = parse(source_entry.url)
+        cache_dir = get_cache_dir(parsed.host, parsed.owner, parsed.repo)
+
+        if validate_cache(cache_dir):
+            head_sha = get_head_sha(cache_dir)
+
+        # -----
+        # Check for stale sources
+        # -----
+        if source_entry.last_fetched:
+            fetched_dt = datetime.fromisoformat(source_entry.last_fetched)
+            now = datetime.now(UTC)
+            stale = (now - fetched_dt).days > STALE_SOURCE_DAYS
+
+    except (ValueError, OSError) as e:
+        logger.warning(
+            f"Cannot read HEAD for source '{source_entry.name}': {e}"
+        )
+
+    return head_sha, stale
+
+
 def check_outdated(
     lock: LockFile,
     config: AamConfig,
@@ -181,42 +236,26 @@ def check_outdated(
     Returns:
         :class:`OutdatedResult` with categorized packages.
     """
-    from datetime import UTC, datetime
-
-    from aam_cli.services.git_service import get_cache_dir, get_head_sha, validate_cache
-    from aam_cli.utils.git_url import parse
-
     logger.info(f"Checking outdated: packages={len(lock.packages)}")
 
     result = OutdatedResult()
 
     # -----
-    # Build source HEAD SHA cache (one read per source)
+    # Build source HEAD SHA cache (one read per source, run concurrently;
+    # results are consumed in config order)
     # -----
     source_head_cache: dict[str, str] = {}
-    stale_threshold_days = 7
 
-    for source_entry in config.sources:
-        try:
-            parsed = parse(source_entry.url)
-            cache_dir = get_cache_dir(parsed.host, parsed.owner, parsed.repo)
+    sources = config.sources
+    workers = min(MAX_SOURCE_HEAD_WORKERS, len(sources))
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+        heads = list(executor.map(_read_source_head, sources))
 
-            if validate_cache(cache_dir):
-                source_head_cache[source_entry.name] = get_head_sha(cache_dir)
-
-            # -----
-            # Check for stale sources
-            # -----
-            if source_entry.last_fetched:
-                fetched_dt = datetime.fromisoformat(source_entry.last_fetched)
-                now = datetime.now(UTC)
-                if (now - fetched_dt).days > stale_threshold_days:
-                    result.stale_sources.append(source_entry.name)
-
-        except (ValueError, OSError) as e:
-            logger.warning(
-                f"Cannot read HEAD for source '{source_entry.name}': {e}"
-            )
+    for source_entry, (head_sha, stale) in zip(sources, heads, strict=True):
+        if head_sha:
+            source_head_cache[source_entry.name] = head_sha
+        if stale:
+            result.stale_sources.append(source_entry.name)
 
     # -----
     # Compare each installed package
@@ -243,7 +282,7 @@ def check_outdated(
             try:
                 from aam_cli.services.checksum_service import check_modifications
 
-                mod_result = check_modifications(pkg_name)
+                mod_result = check_modifications(pkg_name, lock=lock)
                 has_mods = mod_result.get("has_modifications", False)
             except Exception:
                 pass
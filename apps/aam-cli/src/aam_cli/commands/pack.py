@@ -21,9 +21,8 @@ from rich.console import Console
 
 from aam_cli.core.manifest import load_manifest
 from aam_cli.services.checksum_service import compute_file_checksums
-from aam_cli.utils.archive import create_archive
-from aam_cli.utils.checksum import calculate_sha256
-from aam_cli.utils.yaml_utils import dump_yaml, load_yaml
+from aam_cli.utils.archive import create_archive_with_digest
+from aam_cli.utils.yaml_utils import dump_yaml_text, load_yaml
 
 ################################################################################
 #                                                                              #
@@ -78,13 +77,11 @@ def pack(ctx: click.Context, path: str) -> None:
     console.print(f"Building [bold]{manifest.name}@{manifest.version}[/bold]...")
 
     # -----
-    # Step 2: Check artifact paths exist
+    # Step 2: Check artifact paths exist (the artifact list is built once
+    # and reused for the report below)
     # -----
-    missing_paths: list[str] = []
-    for _artifact_type, ref in manifest.all_artifacts:
-        artifact_path = pkg_path / ref.path
-        if not artifact_path.exists():
-            missing_paths.append(ref.path)
+    artifacts = manifest.all_artifacts
+    missing_paths = [ref.path for _, ref in artifacts if not (pkg_path / ref.path).exists()]
 
     if missing_paths:
         console.print(
@@ -100,32 +97,30 @@ def pack(ctx: click.Context, path: str) -> None:
     # -----
     console.print("  Computing per-file checksums...")
     file_checksums = compute_file_checksums(pkg_path)
+    overrides: dict[str, bytes] = {}
 
     if file_checksums:
         # -----
-        # Write checksums into aam.yaml so they are included in the archive
+        # Add checksums to the archived aam.yaml; the project's own
+        # aam.yaml is left as the user wrote it
         # -----
-        manifest_yaml_path = pkg_path / "aam.yaml"
-        manifest_raw = load_yaml(manifest_yaml_path)
+        manifest_raw = load_yaml(pkg_path / "aam.yaml")
         manifest_raw["file_checksums"] = {
             "algorithm": "sha256",
             "files": file_checksums,
         }
-        dump_yaml(manifest_raw, manifest_yaml_path)
+        overrides["aam.yaml"] = dump_yaml_text(manifest_raw).encode("utf-8")
 
         console.print(
             f"  [dim]{len(file_checksums)} file checksum(s) computed[/dim]"
         )
-        logger.info(
-            f"File checksums computed and written: "
-            f"count={len(file_checksums)}"
-        )
+        logger.info(f"File checksums computed: count={len(file_checksums)}")
 
     # -----
     # Step 4: Log what's being added
     # -----
     console.print("  Adding aam.yaml")
-    for _artifact_type, ref in manifest.all_artifacts:
+    for _artifact_type, ref in artifacts:
         console.print(f"  Adding {ref.path}")
 
     # -----
@@ -138,7 +133,7 @@ def pack(ctx: click.Context, path: str) -> None:
     output_path = pkg_path / archive_name
 
     try:
-        create_archive(pkg_path, output_path)
+        checksum = create_archive_with_digest(pkg_path, output_path, overrides)
     except ValueError as exc:
         console.print(f"[red]Error:[/red] {exc}")
         ctx.exit(1)
@@ -147,7 +142,6 @@ def pack(ctx: click.Context, path: str) -> None:
     # -----
     # Step 6: Report results
     # -----
-    checksum = calculate_sha256(output_path)
     size_bytes = output_path.stat().st_size
 
     if size_bytes >= 1024 * 1024:
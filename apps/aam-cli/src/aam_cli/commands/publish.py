@@ -17,8 +17,10 @@ from rich.console import Console
 
 from aam_cli.core.config import load_config
 from aam_cli.core.manifest import load_manifest
+from aam_cli.registry.cache import MetadataCache
 from aam_cli.registry.factory import create_registry
 from aam_cli.utils.checksum import calculate_sha256
+from aam_cli.utils.paths import get_resolve_cache_dir
 
 ################################################################################
 #                                                                              #
@@ -141,6 +143,8 @@ def publish(
         ctx.exit(1)
         return
 
+    MetadataCache(get_resolve_cache_dir()).invalidate(reg_source.name, manifest.name)
+
     console.print("  [green]✓[/green] Copied to registry")
     console.print("  [green]✓[/green] Updated metadata.yaml")
     console.print("  [green]✓[/green] Rebuilt index.yaml")
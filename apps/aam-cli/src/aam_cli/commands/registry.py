@@ -15,7 +15,6 @@ from pathlib import Path
 
 import click
 from rich.console import Console
-from rich.table import Table
 
 from aam_cli.core.config import RegistrySource, load_config, save_global_config
 from aam_cli.registry.local import LocalRegistry
@@ -216,6 +215,8 @@ def registry_add(
 @click.pass_context
 def registry_list(ctx: click.Context) -> None:
     """Display all configured registries."""
+    from rich.table import Table
+
     console: Console = ctx.obj["console"]
 
     config = load_config()
@@ -18,7 +18,6 @@ import logging
 
 import click
 from rich.console import Console
-from rich.table import Table
 
 from aam_cli.core.config import load_config
 from aam_cli.core.workspace import read_lock_file
@@ -133,6 +132,8 @@ def search(
         aam search data --type skill --type agent
         aam search chatbot --json
     """
+    from rich.table import Table
+
     console: Console = ctx.obj["console"]
 
     logger.info(
@@ -20,7 +20,6 @@ from typing import Any
 import click
 import yaml
 from rich.console import Console
-from rich.panel import Panel
 from rich.text import Text
 
 from aam_cli.core.config import SourceEntry, load_config
@@ -32,7 +31,7 @@ from aam_cli.services.source_service import (
     build_source_index,
 )
 from aam_cli.utils.git_url import GitSourceURL, parse
-from aam_cli.utils.naming import parse_package_name, to_filesystem_name
+from aam_cli.utils.naming import package_fs_name
 
 ################################################################################
 #                                                                              #
@@ -200,6 +199,8 @@ def _render_frontmatter(
         console: Rich console for output.
         frontmatter: Parsed frontmatter dict.
     """
+    from rich.panel import Panel
+
     lines: list[str] = []
     for key, value in frontmatter.items():
         # -----
@@ -296,8 +297,7 @@ def _show_installed_package(
     # -----
     # Load manifest from installed directory
     # -----
-    scope, base_name = parse_package_name(package)
-    fs_name = to_filesystem_name(scope, base_name)
+    fs_name = package_fs_name(package)
     pkg_dir = get_packages_dir(project_dir) / fs_name
 
     try:
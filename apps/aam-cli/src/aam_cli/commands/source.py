@@ -24,7 +24,6 @@ from typing import Any
 
 import click
 from rich.console import Console
-from rich.table import Table
 
 from aam_cli.services.source_service import (
     DEFAULT_SOURCES,
@@ -188,6 +187,8 @@ def scan(
 
       aam source scan openai/skills --type skill --type agent
     """
+    from rich.table import Table
+
     console: Console = ctx.obj["console"]
     err_console: Console = ctx.obj["err_console"]
     logger.info(f"CLI source scan: name='{name}'")
@@ -398,6 +399,8 @@ def list_cmd(ctx: click.Context, output_json: bool) -> None:
 
       aam source list --json
     """
+    from rich.table import Table
+
     console: Console = ctx.obj["console"]
     logger.info("CLI source list")
 
@@ -536,6 +539,8 @@ def candidates(
 
       aam source candidates --source openai/skills --type skill
     """
+    from rich.table import Table
+
     console: Console = ctx.obj["console"]
     err_console: Console = ctx.obj["err_console"]
     logger.info("CLI source candidates")
@@ -618,6 +623,8 @@ def enable_defaults(ctx: click.Context, output_json: bool) -> None:
 
       aam source enable-defaults --json
     """
+    from rich.table import Table
+
     console: Console = ctx.obj["console"]
     err_console: Console = ctx.obj["err_console"]
     logger.info("CLI source enable-defaults")
@@ -14,7 +14,6 @@ import shutil
 
 import click
 from rich.console import Console
-from rich.prompt import Confirm
 
 from aam_cli.adapters.factory import create_adapter
 from aam_cli.core.config import load_config
@@ -24,7 +23,7 @@ from aam_cli.core.workspace import (
     read_lock_file,
     write_lock_file,
 )
-from aam_cli.utils.naming import parse_package_name, to_filesystem_name
+from aam_cli.utils.naming import package_fs_name
 from aam_cli.utils.paths import resolve_project_dir
 
 ################################################################################
@@ -65,6 +64,8 @@ def uninstall(ctx: click.Context, package: str, is_global: bool) -> None:
         aam uninstall @author/my-package
         aam uninstall my-package -g
     """
+    from rich.prompt import Confirm
+
     console: Console = ctx.obj["console"]
     project_dir = resolve_project_dir(is_global)
 
@@ -88,12 +89,7 @@ def uninstall(ctx: click.Context, package: str, is_global: bool) -> None:
     # -----
     # Step 2: Check for dependents
     # -----
-    dependents: list[str] = []
-    for other_name, other_locked in lock.packages.items():
-        if other_name == package:
-            continue
-        if package in other_locked.dependencies:
-            dependents.append(other_name)
+    dependents = lock.dependents_of(package)
 
     if dependents:
         dep_list = ", ".join(dependents)
@@ -118,8 +114,7 @@ def uninstall(ctx: click.Context, package: str, is_global: bool) -> None:
     # -----
     # Step 3: Undeploy artifacts from platform
     # -----
-    scope, base_name = parse_package_name(package)
-    fs_name = to_filesystem_name(scope, base_name)
+    fs_name = package_fs_name(package)
     pkg_dir = get_packages_dir(project_dir) / fs_name
 
     config = load_config(project_dir)
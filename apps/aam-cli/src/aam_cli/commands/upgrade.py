@@ -20,7 +20,7 @@ from rich.console import Console
 
 from aam_cli.commands.outdated import check_outdated
 from aam_cli.core.config import AamConfig, load_config
-from aam_cli.core.workspace import read_lock_file
+from aam_cli.core.workspace import edit_lock_file, read_lock_file
 from aam_cli.services.upgrade_service import OutdatedPackage, UpgradeResult
 from aam_cli.utils.paths import resolve_project_dir
 
@@ -191,7 +191,8 @@ def upgrade_packages(
     """Upgrade a list of outdated packages from sources.
 
     For each target, reinstalls from the source cache using the
-    existing install_from_source flow.
+    existing install_from_source flow. The lock file is read once and
+    written once for the whole batch.
 
     Args:
         targets: List of OutdatedPackage instances to upgrade.
@@ -229,49 +230,51 @@ def upgrade_packages(
     # -----
     index = build_source_index(config)
 
-    for target in targets:
-        try:
-            # -----
-            # Check for local modifications
-            # -----
-            if target.has_local_modifications and not force:
-                result.skipped.append({
+    with edit_lock_file(project_dir) as lock:
+        for target in targets:
+            try:
+                # -----
+                # Check for local modifications
+                # -----
+                if target.has_local_modifications and not force:
+                    result.skipped.append({
+                        "name": target.name,
+                        "reason": "Local modifications detected. Use --force to overwrite.",
+                    })
+                    continue
+
+                # -----
+                # Resolve the artifact from source index
+                # -----
+                virtual_package = resolve_artifact(target.name, index)
+
+                # -----
+                # Reinstall from source with force=True (overwrite existing)
+                # -----
+                install_from_source(
+                    virtual_package=virtual_package,
+                    project_dir=project_dir,
+                    platform_name=config.default_platform,
+                    config=config,
+                    force=True,
+                    no_deploy=False,
+                    lock=lock,
+                )
+
+                result.upgraded.append({
                     "name": target.name,
-                    "reason": "Local modifications detected. Use --force to overwrite.",
+                    "from_commit": target.current_commit,
+                    "to_commit": target.latest_commit,
                 })
-                continue
-
-            # -----
-            # Resolve the artifact from source index
-            # -----
-            virtual_package = resolve_artifact(target.name, index)
-
-            # -----
-            # Reinstall from source with force=True (overwrite existing)
-            # -----
-            install_from_source(
-                virtual_package=virtual_package,
-                project_dir=project_dir,
-                platform_name=config.default_platform,
-                config=config,
-                force=True,
-                no_deploy=False,
-            )
 
-            result.upgraded.append({
-                "name": target.name,
-                "from_commit": target.current_commit,
-                "to_commit": target.latest_commit,
-            })
-
-        except Exception as e:
-            logger.error(
-                f"Failed to upgrade '{target.name}': {e}", exc_info=True
-            )
-            result.failed.append({
-                "name": target.name,
-                "error": str(e),
-            })
+            except Exception as e:
+                logger.error(
+                    f"Failed to upgrade '{target.name}': {e}", exc_info=True
+                )
+                result.failed.append({
+                    "name": target.name,
+                    "error": str(e),
+                })
 
     result.total_upgraded = len(result.upgraded)
 
@@ -104,6 +104,7 @@ class AamConfig(BaseModel):
     security: SecurityConfig = SecurityConfig()
     author: AuthorConfig = AuthorConfig()
     publish: PublishConfig = PublishConfig()
+    parallel_downloads: int = 5  # Concurrent archive downloads during install
 
     # -----
     # Source management fields (spec 003)
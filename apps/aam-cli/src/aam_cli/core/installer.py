@@ -2,10 +2,16 @@
 
 Orchestrates the full install flow:
   1. Download archives from registries
-  2. Verify checksums
-  3. Extract to ``.aam/packages/``
-  4. Deploy via platform adapter
-  5. Write lock file
+  2. Extract into per-package scratch directories
+  3. Verify checksums (hashed on the extraction read)
+  4. Move each tree into ``.aam/packages/``
+  5. Deploy via platform adapter
+  6. Write lock file
+
+Steps 1-3 run concurrently, one worker per package, each confined to its
+own scratch directory. Moving into place, deployment and lock-file
+updates stay on the calling thread, in resolver order, so nothing races
+on ``.aam/packages/``, platform directories or ``aam-lock.yaml``.
 """
 
 ################################################################################
@@ -15,14 +21,18 @@ Orchestrates the full install flow:
 ################################################################################
 
 import logging
+import os
+import shutil
+from concurrent.futures import FIRST_EXCEPTION, Future, ThreadPoolExecutor, wait
 from pathlib import Path
 
 from aam_cli.adapters.base import PlatformAdapter
 from aam_cli.core.config import AamConfig
-from aam_cli.core.manifest import load_manifest
+from aam_cli.core.manifest import PackageManifest, load_manifest
 from aam_cli.core.resolver import ResolvedPackage
 from aam_cli.core.workspace import (
     LockedPackage,
+    LockFile,
     ensure_workspace,
     get_packages_dir,
     read_lock_file,
@@ -30,8 +40,8 @@ from aam_cli.core.workspace import (
 )
 from aam_cli.registry.base import Registry
 from aam_cli.registry.factory import create_registry
-from aam_cli.utils.checksum import verify_sha256
-from aam_cli.utils.naming import parse_package_name, to_filesystem_name
+from aam_cli.utils.archive import extract_archive, extract_archive_with_digest
+from aam_cli.utils.naming import package_fs_name
 
 ################################################################################
 #                                                                              #
@@ -42,6 +52,15 @@ from aam_cli.utils.naming import parse_package_name, to_filesystem_name
 # Initialize logger for this module
 logger = logging.getLogger(__name__)
 
+################################################################################
+#                                                                              #
+# CONSTANTS                                                                    #
+#                                                                              #
+################################################################################
+
+# Subdirectory of a package's download dir that holds its extracted tree
+STAGED_PACKAGE_DIR_NAME: str = "package"
+
 ################################################################################
 #                                                                              #
 # INSTALLER                                                                    #
@@ -56,6 +75,7 @@ def install_packages(
     project_dir: Path | None = None,
     no_deploy: bool = False,
     force: bool = False,
+    lock: LockFile | None = None,
 ) -> list[str]:
     """Install resolved packages: download, verify, extract, deploy.
 
@@ -66,6 +86,8 @@ def install_packages(
         project_dir: Project root directory.
         no_deploy: If True, skip platform deployment.
         force: If True, reinstall even if already installed.
+        lock: Already-loaded lock file to update in place. Read from
+            disk when omitted.
 
     Returns:
         List of installed package names (including version).
@@ -80,71 +102,67 @@ def install_packages(
     ensure_workspace(project_dir)
     packages_dir = get_packages_dir(project_dir)
 
-    lock = read_lock_file(project_dir)
+    if lock is None:
+        lock = read_lock_file(project_dir)
     installed_names: list[str] = []
 
+    # -----
+    # Check if already installed (skip unless --force)
+    # -----
+    to_install: list[ResolvedPackage] = []
     for pkg in resolved_packages:
-        pkg_label = f"{pkg.name}@{pkg.version}"
+        existing = lock.packages.get(pkg.name)
+        if existing is not None and not force and existing.version == pkg.version:
+            logger.info(f"Already installed: {pkg.name}@{pkg.version}, skipping")
+            continue
+        to_install.append(pkg)
 
-        # -----
-        # Check if already installed (skip unless --force)
-        # -----
-        if pkg.name in lock.packages and not force:
-            existing = lock.packages[pkg.name]
-            if existing.version == pkg.version:
-                logger.info(f"Already installed: {pkg_label}, skipping")
-                continue
-
-        # -----
-        # Step 1: Download the archive
-        # -----
-        logger.info(f"Downloading {pkg_label} from '{pkg.source}'")
+    # -----
+    # Steps 1-3: Download, extract and verify every package concurrently
+    # into scratch space, so a failure leaves .aam/packages/ untouched
+    # -----
+    downloads_dir = packages_dir / ".downloads"
+    try:
+        staged_dirs = _fetch_packages(to_install, config, downloads_dir)
+    except Exception:
+        shutil.rmtree(downloads_dir, ignore_errors=True)
+        raise
 
-        registry = _get_registry(pkg.source, config)
-        archive_dest = packages_dir / ".downloads"
-        archive_path = registry.download(pkg.name, pkg.version, archive_dest)
+    # One directory listing replaces a stat per package below
+    existing_dirs = _list_package_dirs(packages_dir)
 
-        # -----
-        # Step 2: Verify checksum
-        # -----
-        if pkg.checksum and config.security.require_checksum:
-            if not verify_sha256(archive_path, pkg.checksum):
-                raise ValueError(
-                    f"Checksum verification failed for {pkg_label}. The archive may be corrupted."
-                )
-            logger.info(f"Checksum verified: {pkg_label}")
+    for pkg, staged_dir in zip(to_install, staged_dirs, strict=True):
+        pkg_label = f"{pkg.name}@{pkg.version}"
 
         # -----
-        # Step 3: Extract to .aam/packages/<fs-name>/
+        # Move the staged tree to .aam/packages/<fs-name>/ (same
+        # filesystem, so this is a rename)
         # -----
-        scope, base_name = parse_package_name(pkg.name)
-        fs_name = to_filesystem_name(scope, base_name)
-        extract_dir = packages_dir / fs_name
-
-        from aam_cli.utils.archive import extract_archive
-
-        if extract_dir.exists():
-            import shutil
+        extract_dir = packages_dir / staged_dir.parent.name
 
+        if extract_dir.name in existing_dirs:
             shutil.rmtree(extract_dir)
 
-        extract_archive(archive_path, extract_dir)
+        os.replace(staged_dir, extract_dir)
         logger.info(f"Extracted {pkg_label} to {extract_dir}")
 
+        # Parse the manifest once for both deployment and the lock entry
+        manifest: PackageManifest | None
+        try:
+            manifest = load_manifest(extract_dir)
+        except FileNotFoundError:
+            manifest = None
+
         # -----
         # Step 4: Deploy via platform adapter
         # -----
         if not no_deploy and adapter is not None:
-            _deploy_package(extract_dir, adapter)
+            _deploy_package(extract_dir, adapter, manifest)
 
         # -----
         # Step 5: Update lock file entry
         # -----
-        deps: dict[str, str] = {}
-        manifest_path = extract_dir / "aam.yaml"
-        if manifest_path.is_file():
-            manifest = load_manifest(extract_dir)
-            deps = dict(manifest.dependencies)
+        deps = dict(manifest.dependencies) if manifest is not None else {}
 
         lock.packages[pkg.name] = LockedPackage(
             version=pkg.version,
@@ -164,10 +182,7 @@ def install_packages(
     # -----
     # Clean up download directory
     # -----
-    downloads_dir = packages_dir / ".downloads"
     if downloads_dir.exists():
-        import shutil
-
         shutil.rmtree(downloads_dir, ignore_errors=True)
 
     logger.info(f"Installation complete: {len(installed_names)} packages installed")
@@ -181,6 +196,119 @@ def install_packages(
 ################################################################################
 
 
+def _list_package_dirs(packages_dir: Path) -> set[str]:
+    """Return the names of the package directories under *packages_dir*.
+
+    Args:
+        packages_dir: The ``.aam/packages/`` directory.
+
+    Returns:
+        Directory names found by a single ``scandir`` pass.
+    """
+    with os.scandir(packages_dir) as entries:
+        return {entry.name for entry in entries if entry.is_dir(follow_symlinks=False)}
+
+
+def _fetch_packages(
+    packages: list[ResolvedPackage],
+    config: AamConfig,
+    downloads_dir: Path,
+) -> list[Path]:
+    """Download, verify and extract package archives in parallel.
+
+    Each package is fetched and unpacked into its own subdirectory of
+    *downloads_dir*, so concurrent workers never write to the same path.
+    The first failure cancels every fetch that has not started yet and is
+    re-raised once the running ones finish.
+
+    Args:
+        packages: Packages to fetch.
+        config: AAM configuration (registries, checksum policy, and
+            ``parallel_downloads`` worker count).
+        downloads_dir: Scratch directory for archives and staged trees.
+
+    Returns:
+        Staged package directories in the same order as *packages*.
+
+    Raises:
+        ValueError: If a registry is missing or checksum verification fails.
+    """
+    if not packages:
+        return []
+
+    workers = max(1, min(config.parallel_downloads, len(packages)))
+    logger.info(f"Fetching {len(packages)} packages with {workers} workers")
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures: list[Future[Path]] = [
+            executor.submit(_fetch_package, pkg, config, downloads_dir)
+            for pkg in packages
+        ]
+        done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+
+        # -----
+        # Fail fast: drop queued fetches and surface the first error
+        # -----
+        for future in futures:
+            if future in done and (exc := future.exception()) is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+                raise exc
+
+    return [future.result() for future in futures]
+
+
+def _fetch_package(
+    pkg: ResolvedPackage,
+    config: AamConfig,
+    downloads_dir: Path,
+) -> Path:
+    """Download one package archive, then extract it and verify its checksum.
+
+    Runs on a worker thread; touches nothing outside its own
+    ``downloads_dir/<fs-name>/`` directory.
+
+    Args:
+        pkg: Package to fetch.
+        config: AAM configuration.
+        downloads_dir: Scratch directory for archives and staged trees.
+
+    Returns:
+        Path to the extracted package, ``downloads_dir/<fs-name>/package``.
+
+    Raises:
+        ValueError: If the registry is missing or checksum verification fails.
+    """
+    pkg_label = f"{pkg.name}@{pkg.version}"
+
+    # -----
+    # Step 1: Download the archive
+    # -----
+    logger.info(f"Downloading {pkg_label} from '{pkg.source}'")
+
+    registry = _get_registry(pkg.source, config)
+    archive_dest = downloads_dir / package_fs_name(pkg.name)
+    archive_path = registry.download(pkg.name, pkg.version, archive_dest)
+
+    # -----
+    # Steps 2-3: Extract into the package's scratch directory, hashing the
+    # archive on the same read, then verify the checksum. A mismatch
+    # fails the fetch and the caller discards the scratch directory.
+    # -----
+    staged_dir = archive_dest / STAGED_PACKAGE_DIR_NAME
+
+    if pkg.checksum and config.security.require_checksum:
+        actual = extract_archive_with_digest(archive_path, staged_dir)
+        if actual != pkg.checksum:
+            raise ValueError(
+                f"Checksum verification failed for {pkg_label}. The archive may be corrupted."
+            )
+        logger.info(f"Checksum verified: {pkg_label}")
+    else:
+        extract_archive(archive_path, staged_dir)
+
+    return staged_dir
+
+
 def _get_registry(source_name: str, config: AamConfig) -> Registry:
     """Get a registry instance by name from the config.
 
@@ -206,14 +334,18 @@ def _get_registry(source_name: str, config: AamConfig) -> Registry:
 def _deploy_package(
     package_dir: Path,
     adapter: PlatformAdapter,
+    manifest: PackageManifest | None = None,
 ) -> None:
     """Deploy all artifacts from an extracted package.
 
     Args:
         package_dir: Path to the extracted package directory.
         adapter: Platform adapter for deployment.
+        manifest: The package's already-parsed manifest. Loaded from
+            *package_dir* when omitted.
     """
-    manifest = load_manifest(package_dir)
+    if manifest is None:
+        manifest = load_manifest(package_dir)
 
     config_dict: dict[str, str] = {}
 
@@ -63,7 +63,7 @@ class ArtifactRef(BaseModel):
     @classmethod
     def validate_name(cls, v: str) -> str:
         """Validate artifact name matches ``^[a-z0-9][a-z0-9-]{0,63}$``."""
-        if not _NAME_PATTERN.match(v):
+        if not _NAME_PATTERN.fullmatch(v):
             raise ValueError(f"Invalid artifact name '{v}': must match {NAME_REGEX}")
         return v
 
@@ -212,7 +212,7 @@ class PackageManifest(BaseModel):
     @classmethod
     def validate_name(cls, v: str) -> str:
         """Validate full package name matches ``FULL_NAME_REGEX``."""
-        if not _FULL_NAME_PATTERN.match(v):
+        if not _FULL_NAME_PATTERN.fullmatch(v):
             raise ValueError(f"Invalid package name '{v}': must match {FULL_NAME_REGEX}")
         return v
 
@@ -238,13 +238,7 @@ class PackageManifest(BaseModel):
     @model_validator(mode="after")
     def validate_has_artifacts(self) -> "PackageManifest":
         """Ensure at least one artifact is declared."""
-        total = (
-            len(self.artifacts.agents)
-            + len(self.artifacts.skills)
-            + len(self.artifacts.prompts)
-            + len(self.artifacts.instructions)
-        )
-        if total == 0:
+        if self.artifact_count == 0:
             raise ValueError("At least one artifact must be declared across all types")
         return self
 
@@ -253,7 +247,7 @@ class PackageManifest(BaseModel):
     def validate_dependencies(cls, v: dict[str, str]) -> dict[str, str]:
         """Validate dependency names and constraint syntax."""
         for dep_name, constraint in v.items():
-            if not _FULL_NAME_PATTERN.match(dep_name):
+            if not _FULL_NAME_PATTERN.fullmatch(dep_name):
                 raise ValueError(
                     f"Invalid dependency name '{dep_name}': must match {FULL_NAME_REGEX}"
                 )
@@ -297,10 +291,29 @@ class PackageManifest(BaseModel):
             result.append(("instruction", instruction))
         return result
 
+    @property
+    def artifact_counts(self) -> dict[str, int]:
+        """Number of declared artifacts per type, omitting empty types.
+
+        Keys are singular type names in ``all_artifacts`` order.
+        """
+        counts = {
+            "agent": len(self.artifacts.agents),
+            "skill": len(self.artifacts.skills),
+            "prompt": len(self.artifacts.prompts),
+            "instruction": len(self.artifacts.instructions),
+        }
+        return {atype: n for atype, n in counts.items() if n}
+
     @property
     def artifact_count(self) -> int:
         """Total number of declared artifacts."""
-        return len(self.all_artifacts)
+        return (
+            len(self.artifacts.agents)
+            + len(self.artifacts.skills)
+            + len(self.artifacts.prompts)
+            + len(self.artifacts.instructions)
+        )
 
 
 ################################################################################
@@ -370,3 +383,29 @@ def load_manifest(path: Path) -> PackageManifest:
         f"artifacts={manifest.artifact_count}"
     )
     return manifest
+
+
+def parse_manifest(text: str, source: Path) -> PackageManifest:
+    """Validate a ``PackageManifest`` from ``aam.yaml`` text.
+
+    For manifests that are not on disk, such as one read straight out of
+    a package archive.
+
+    Args:
+        text: Content of the ``aam.yaml`` file.
+        source: Where the text came from, used only in log messages.
+
+    Returns:
+        Validated :class:`PackageManifest` instance.
+
+    Raises:
+        ValueError: If the manifest fails validation.
+    """
+    from aam_cli.utils.yaml_utils import parse_yaml_text
+
+    manifest = PackageManifest(**parse_yaml_text(text, source))
+    logger.info(
+        f"Manifest parsed: source='{source}', name='{manifest.name}', "
+        f"version='{manifest.version}'"
+    )
+    return manifest
@@ -14,14 +14,16 @@ Decision reference: plan.md Key Decision 4.
 ################################################################################
 
 import logging
-from collections import deque
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from pydantic import BaseModel, ConfigDict
 
 from aam_cli.core.manifest import PackageManifest
 from aam_cli.core.version import find_best_match, parse_version
-from aam_cli.registry.base import Registry
+from aam_cli.registry.base import PackageMetadata, Registry
+from aam_cli.registry.cache import MetadataCache
 
 ################################################################################
 #                                                                              #
@@ -32,6 +34,15 @@ from aam_cli.registry.base import Registry
 # Initialize logger for this module
 logger = logging.getLogger(__name__)
 
+################################################################################
+#                                                                              #
+# CONSTANTS                                                                    #
+#                                                                              #
+################################################################################
+
+# Maximum concurrent registry lookups per BFS level
+MAX_RESOLVE_WORKERS: int = 8
+
 ################################################################################
 #                                                                              #
 # DATA MODELS                                                                  #
@@ -61,7 +72,8 @@ class ResolvedPackage(BaseModel):
 
 def resolve_dependencies(
     root_specs: list[tuple[str, str]],
-    registries: list[Registry],
+    registries: Iterable[Registry],
+    cache: MetadataCache | None = None,
 ) -> list[ResolvedPackage]:
     """Resolve dependencies for a set of root package specs.
 
@@ -71,10 +83,16 @@ def resolve_dependencies(
       3. If conflict, raise a clear error
       4. Add the package's dependencies to the queue
 
+    The queue is processed one BFS level at a time. Registry lookups for
+    every new package in a level run concurrently; the results are then
+    applied in queue order, so the outcome matches a serial walk.
+
     Args:
         root_specs: List of ``(name, constraint)`` tuples for the
             packages to install.
         registries: Available registries to look up packages in.
+        cache: Optional metadata cache consulted for registries that
+            expose a ``metadata_etag`` validator.
 
     Returns:
         Ordered list of :class:`ResolvedPackage` instances (dependencies first).
@@ -90,60 +108,73 @@ def resolve_dependencies(
     resolved_map: dict[str, ResolvedPackage] = {}
 
     # -----
-    # BFS queue: (package_name, constraint_str, requested_by)
+    # BFS level: (package_name, constraint_str, requested_by)
     # -----
-    queue: deque[tuple[str, str, str]] = deque()
-
-    for name, constraint in root_specs:
-        queue.append((name, constraint, "user"))
-
-    while queue:
-        pkg_name, constraint, requested_by = queue.popleft()
-
-        logger.debug(
-            f"Resolving: name='{pkg_name}', constraint='{constraint}', "
-            f"requested_by='{requested_by}'"
-        )
+    level: list[tuple[str, str, str]] = [
+        (name, constraint, "user") for name, constraint in root_specs
+    ]
 
+    while level:
         # -----
-        # Check if already resolved
+        # Look up every new package of this level concurrently, using the
+        # constraint of its first occurrence (as a serial walk would)
         # -----
-        if pkg_name in resolved_map:
-            existing = resolved_map[pkg_name]
-            # Verify the existing resolved version satisfies this constraint
-            from aam_cli.core.version import parse_constraint, version_matches
-
-            constraints = parse_constraint(constraint)
-            existing_ver = parse_version(existing.version)
-            if version_matches(existing_ver, constraints):
-                logger.debug(
-                    f"Already resolved {pkg_name}@{existing.version}, "
-                    "compatible with new constraint"
+        pending: dict[str, str] = {}
+        for pkg_name, constraint, _ in level:
+            if pkg_name not in resolved_map:
+                pending.setdefault(pkg_name, constraint)
+        lookups = _lookup_all(pending, registries, cache)
+
+        next_level: list[tuple[str, str, str]] = []
+        for pkg_name, constraint, requested_by in level:
+            logger.debug(
+                f"Resolving: name='{pkg_name}', constraint='{constraint}', "
+                f"requested_by='{requested_by}'"
+            )
+
+            # -----
+            # Check if already resolved
+            # -----
+            if pkg_name in resolved_map:
+                existing = resolved_map[pkg_name]
+                # Verify the existing resolved version satisfies this constraint
+                from aam_cli.core.version import parse_constraint, version_matches
+
+                constraints = parse_constraint(constraint)
+                existing_ver = parse_version(existing.version)
+                if version_matches(existing_ver, constraints):
+                    logger.debug(
+                        f"Already resolved {pkg_name}@{existing.version}, "
+                        "compatible with new constraint"
+                    )
+                    continue
+
+                # -----
+                # Conflict: existing version doesn't satisfy new constraint
+                # -----
+                raise ValueError(
+                    f"Dependency conflict for '{pkg_name}': "
+                    f"version {existing.version} (required by {requested_by}) "
+                    f"is incompatible with constraint '{constraint}'. "
+                    f"Cannot resolve without backtracking."
                 )
-                continue
 
             # -----
-            # Conflict: existing version doesn't satisfy new constraint
+            # Take the registry lookup result for this package
             # -----
-            raise ValueError(
-                f"Dependency conflict for '{pkg_name}': "
-                f"version {existing.version} (required by {requested_by}) "
-                f"is incompatible with constraint '{constraint}'. "
-                f"Cannot resolve without backtracking."
-            )
+            resolved = lookups[pkg_name]
+            if isinstance(resolved, ValueError):
+                raise resolved
+            resolved_map[pkg_name] = resolved
 
-        # -----
-        # Look up the package in registries
-        # -----
-        resolved = _resolve_from_registries(pkg_name, constraint, registries)
-        resolved_map[pkg_name] = resolved
+            # -----
+            # Enqueue dependencies for the next level
+            # -----
+            if resolved.manifest:
+                for dep_name, dep_constraint in resolved.manifest.dependencies.items():
+                    next_level.append((dep_name, dep_constraint, pkg_name))
 
-        # -----
-        # Enqueue dependencies
-        # -----
-        if resolved.manifest:
-            for dep_name, dep_constraint in resolved.manifest.dependencies.items():
-                queue.append((dep_name, dep_constraint, pkg_name))
+        level = next_level
 
     # -----
     # Return in dependency-first order (reverse BFS order)
@@ -153,10 +184,45 @@ def resolve_dependencies(
     return result
 
 
+def _lookup_all(
+    pending: dict[str, str],
+    registries: Iterable[Registry],
+    cache: MetadataCache | None = None,
+) -> dict[str, ResolvedPackage | ValueError]:
+    """Resolve several packages against the registries concurrently.
+
+    Lookup failures are returned rather than raised so the caller can
+    report them at the point a serial walk would have.
+
+    Args:
+        pending: Mapping of package name to version constraint.
+        registries: Registries to search.
+        cache: Optional metadata cache.
+
+    Returns:
+        Mapping of package name to its resolution or ``ValueError``.
+    """
+
+    def lookup(item: tuple[str, str]) -> ResolvedPackage | ValueError:
+        try:
+            return _resolve_from_registries(item[0], item[1], registries, cache)
+        except ValueError as exc:
+            return exc
+
+    if len(pending) <= 1:
+        return {name: lookup((name, c)) for name, c in pending.items()}
+
+    workers = min(MAX_RESOLVE_WORKERS, len(pending))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(lookup, pending.items())
+        return dict(zip(pending, results, strict=True))
+
+
 def _resolve_from_registries(
     name: str,
     constraint: str,
-    registries: list[Registry],
+    registries: Iterable[Registry],
+    cache: MetadataCache | None = None,
 ) -> ResolvedPackage:
     """Find and resolve a package from the available registries.
 
@@ -166,6 +232,7 @@ def _resolve_from_registries(
         name: Package name.
         constraint: Version constraint string.
         registries: Registries to search.
+        cache: Optional metadata cache.
 
     Returns:
         A :class:`ResolvedPackage` with version info.
@@ -174,19 +241,20 @@ def _resolve_from_registries(
         ValueError: If the package or matching version is not found.
     """
     for registry in registries:
+        # -----
+        # One metadata read per registry yields both the version list
+        # and the checksum of the chosen version
+        # -----
         try:
-            versions = registry.get_versions(name)
+            metadata = _get_metadata(registry, name, cache)
         except KeyError:
             continue
 
+        versions = [v.version for v in metadata.versions]
         best = find_best_match(constraint, versions)
         if best is None:
             continue
 
-        # -----
-        # Get metadata for the resolved version
-        # -----
-        metadata = registry.get_metadata(name)
         version_info = None
         for vi in metadata.versions:
             if vi.version == best:
@@ -210,3 +278,39 @@ def _resolve_from_registries(
         f"Package '{name}' not found in any configured registry. "
         f"Run 'aam registry list' to check your registries."
     )
+
+
+def _get_metadata(
+    registry: Registry,
+    name: str,
+    cache: MetadataCache | None,
+) -> PackageMetadata:
+    """Fetch package metadata, answering from *cache* when still valid.
+
+    Only registries with a ``metadata_etag`` method are cached; the
+    validator is read before the metadata, so an entry can never be
+    stored under a newer validator than its content.
+
+    Args:
+        registry: Registry to query.
+        name: Full package name.
+        cache: Optional metadata cache.
+
+    Returns:
+        Package metadata.
+
+    Raises:
+        KeyError: If the package does not exist in *registry*.
+    """
+    metadata_etag = getattr(registry, "metadata_etag", None)
+    if cache is None or metadata_etag is None:
+        return registry.get_metadata(name)
+
+    etag = metadata_etag(name)
+    cached = cache.get(registry.name, name, etag)
+    if cached is not None:
+        return cached
+
+    metadata = registry.get_metadata(name)
+    cache.put(registry.name, name, etag, metadata)
+    return metadata
@@ -10,19 +10,29 @@ stores installed packages and the lock file.
 #                                                                              #
 ################################################################################
 
+import hashlib
 import logging
+import os
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import UTC, datetime
 from pathlib import Path
 
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel, ValidationError, model_validator
 
+from aam_cli.core.manifest import PackageManifest, load_manifest
+from aam_cli.utils.naming import package_fs_name
 from aam_cli.utils.paths import (
     ensure_project_workspace,
+    get_lock_cache_path,
     get_lock_file_path,
+    get_manifest_cache_path,
     get_packages_dir,
     get_project_workspace,
 )
-from aam_cli.utils.yaml_utils import dump_yaml, load_yaml_optional
+from aam_cli.utils.yaml_utils import dump_yaml, parse_yaml_text
 
 ################################################################################
 #                                                                              #
@@ -39,8 +49,11 @@ __all__ = [
     "get_workspace_path",
     "read_lock_file",
     "write_lock_file",
+    "edit_lock_file",
+    "get_lock_file",
     "get_installed_packages",
     "is_package_installed",
+    "read_installed_manifests",
 ]
 
 ################################################################################
@@ -52,6 +65,15 @@ __all__ = [
 # Initialize logger for this module
 logger = logging.getLogger(__name__)
 
+################################################################################
+#                                                                              #
+# CONSTANTS                                                                    #
+#                                                                              #
+################################################################################
+
+# Manifests missing from the cache are read and parsed concurrently
+MAX_MANIFEST_PARSE_WORKERS: int = 8
+
 ################################################################################
 #                                                                              #
 # LOCK FILE MODELS                                                             #
@@ -69,6 +91,18 @@ class FileChecksums(BaseModel):
     algorithm: str = "sha256"  # Hash algorithm used
     files: dict[str, str] = {}  # {relative_path: hex_digest}
 
+    # -----
+    # Original text content for ``aam diff`` (base64 of zlib-compressed
+    # UTF-8). Empty for packages installed before this was recorded.
+    # -----
+    originals: dict[str, str] = {}  # {relative_path: blob}
+
+    # -----
+    # SHA-256 over (path, size, mtime) of the installed files; lets
+    # ``aam diff`` skip re-hashing an untouched package
+    # -----
+    stat_fingerprint: str | None = None
+
 
 class LockedPackage(BaseModel):
     """A single resolved package in the lock file."""
@@ -118,6 +152,42 @@ class LockFile(BaseModel):
     resolved_at: str = ""  # ISO 8601 timestamp
     packages: dict[str, LockedPackage] = {}  # package name -> locked info
 
+    def root_packages(self) -> list[str]:
+        """Names of packages no other locked package depends on, in lock order."""
+        all_deps: set[str] = set().union(
+            *(locked.dependencies.keys() for locked in self.packages.values())
+        )
+        return [name for name in self.packages if name not in all_deps]
+
+    def dependents_of(self, package_name: str) -> list[str]:
+        """Names of the other locked packages that depend on *package_name*."""
+        return [
+            name
+            for name, locked in self.packages.items()
+            if package_name in locked.dependencies and name != package_name
+        ]
+
+
+class _LockCache(BaseModel):
+    """Parsed lock file keyed by the SHA-256 of the YAML it came from."""
+
+    sha256: str
+    lock: LockFile
+
+
+class _ManifestCacheEntry(BaseModel):
+    """Parsed ``aam.yaml`` keyed by the stat of the file it came from."""
+
+    mtime_ns: int
+    size: int
+    manifest: PackageManifest
+
+
+class _ManifestCache(BaseModel):
+    """Parsed installed manifests keyed by package directory name."""
+
+    entries: dict[str, _ManifestCacheEntry] = {}
+
 
 ################################################################################
 #                                                                              #
@@ -178,24 +248,59 @@ def read_lock_file(project_dir: Path | None = None) -> LockFile:
     lock_path = get_lock_file_path(project_dir)
     logger.debug(f"Reading lock file: path='{lock_path}'")
 
-    data = load_yaml_optional(lock_path)
-    if not data:
+    # -----
+    # Serve from the JSON cache when it was built from these exact bytes
+    # -----
+    try:
+        raw = lock_path.read_bytes()
+    except FileNotFoundError:
         logger.debug("No existing lock file found, returning empty")
         return LockFile()
 
+    digest = hashlib.sha256(raw).hexdigest()
+    cache_path = get_lock_cache_path(project_dir)
+    cached = _read_lock_cache(cache_path, digest)
+    if cached is not None:
+        return cached
+
     # -----
-    # Parse packages into LockedPackage models
+    # Parse the bytes that were hashed, not a second read of the file,
+    # so a concurrent write cannot pair this digest with other content
     # -----
-    packages_raw = data.get("packages", {})
-    packages: dict[str, LockedPackage] = {}
-    for pkg_name, pkg_data in packages_raw.items():
-        if isinstance(pkg_data, dict):
-            packages[pkg_name] = LockedPackage(**pkg_data)
-
-    return LockFile(
-        lockfile_version=data.get("lockfile_version", 1),
-        resolved_at=data.get("resolved_at", ""),
-        packages=packages,
+    lock = _parse_lock_yaml(raw.decode("utf-8"), lock_path)
+    _write_lock_cache(cache_path, digest, lock)
+    return lock
+
+
+def _parse_lock_yaml(text: str, lock_path: Path) -> LockFile:
+    """Parse ``aam-lock.yaml`` content into a :class:`LockFile`.
+
+    Args:
+        text: Lock file content.
+        lock_path: Path to the lock file, used only in log messages.
+
+    Returns:
+        Parsed lock file; empty if the content is blank.
+    """
+    data = parse_yaml_text(text, lock_path)
+    if not data:
+        return LockFile()
+
+    # -----
+    # Validate the whole document in one pydantic-core call rather than
+    # constructing each LockedPackage from Python keyword arguments
+    # -----
+    packages_raw = data.get("packages") or {}
+    return LockFile.model_validate(
+        {
+            "lockfile_version": data.get("lockfile_version", 1),
+            "resolved_at": data.get("resolved_at", ""),
+            "packages": {
+                pkg_name: pkg_data
+                for pkg_name, pkg_data in packages_raw.items()
+                if isinstance(pkg_data, dict)
+            },
+        }
     )
 
 
@@ -223,11 +328,85 @@ def write_lock_file(
     data = lock_file.model_dump(mode="json")
 
     ensure_workspace(project_dir)
-    dump_yaml(data, lock_path)
+    _lock_snapshots.pop(lock_path, None)
+    dump_yaml(data, lock_path, atomic=True)
+
+    # -----
+    # Refresh the JSON cache so the next read skips YAML parsing
+    # -----
+    digest = hashlib.sha256(lock_path.read_bytes()).hexdigest()
+    _write_lock_cache(get_lock_cache_path(project_dir), digest, lock_file)
 
     logger.info(f"Lock file written: packages={len(lock_file.packages)}")
 
 
+@contextmanager
+def edit_lock_file(project_dir: Path | None = None) -> Iterator[LockFile]:
+    """Read the lock file once, yield it for updates, then write it once.
+
+    Lets a command that touches several packages update one in-memory
+    :class:`LockFile` instead of re-reading and re-writing
+    ``aam-lock.yaml`` per package. The lock is written only if the block
+    changed it, and is written even when the block raises, so entries
+    recorded for packages already moved into place are not lost.
+
+    Args:
+        project_dir: Project root directory.
+
+    Yields:
+        The loaded :class:`LockFile`, to be modified in place.
+    """
+    lock = read_lock_file(project_dir)
+    original = lock.model_copy(deep=True)
+    try:
+        yield lock
+    finally:
+        if lock != original:
+            write_lock_file(lock, project_dir)
+
+
+def _read_lock_cache(cache_path: Path, digest: str) -> LockFile | None:
+    """Return the cached lock if it was built from YAML hashing to *digest*.
+
+    Args:
+        cache_path: Path to ``.aam/cache/lock.json``.
+        digest: SHA-256 hex digest of the current ``aam-lock.yaml``.
+
+    Returns:
+        The cached :class:`LockFile`, or ``None`` on a miss or bad entry.
+    """
+    try:
+        entry = _LockCache.model_validate_json(cache_path.read_bytes())
+    except (OSError, ValidationError):
+        return None
+
+    if entry.sha256 != digest:
+        return None
+
+    logger.debug(f"Lock cache hit: path='{cache_path}'")
+    return entry.lock
+
+
+def _write_lock_cache(cache_path: Path, digest: str, lock_file: LockFile) -> None:
+    """Store *lock_file* as the parsed form of the YAML hashing to *digest*.
+
+    Write failures are logged and ignored; the cache is best-effort.
+
+    Args:
+        cache_path: Path to ``.aam/cache/lock.json``.
+        digest: SHA-256 hex digest of the ``aam-lock.yaml`` bytes.
+        lock_file: Parsed lock file.
+    """
+    payload = _LockCache(sha256=digest, lock=lock_file).model_dump_json()
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}-{threading.get_ident()}.tmp")
+        tmp_path.write_text(payload, encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except OSError as exc:
+        logger.debug(f"Could not write lock cache '{cache_path}': {exc}")
+
+
 ################################################################################
 #                                                                              #
 # INSTALLED PACKAGES                                                           #
@@ -235,33 +414,220 @@ def write_lock_file(
 ################################################################################
 
 
+# Read-only snapshots served by get_lock_file: lock path -> (stat key, lock)
+_lock_snapshots: dict[Path, tuple[tuple[int, int], LockFile]] = {}
+
+
+def get_lock_file(project_dir: Path | None = None) -> LockFile:
+    """Return a shared, read-only snapshot of the lock file.
+
+    The parsed lock is kept per process and keyed by the lock file's
+    ``st_mtime_ns`` and ``st_size``, so repeated read-only lookups (such
+    as successive MCP tool calls) cost one ``stat``. The returned object
+    is shared between callers and must not be modified; use
+    :func:`read_lock_file` or :func:`edit_lock_file` to change the lock.
+
+    Args:
+        project_dir: Project root directory.
+
+    Returns:
+        Parsed :class:`LockFile`.
+    """
+    lock_path = get_lock_file_path(project_dir)
+    try:
+        st = lock_path.stat()
+    except FileNotFoundError:
+        return LockFile()
+
+    key = (st.st_mtime_ns, st.st_size)
+    snapshot = _lock_snapshots.get(lock_path)
+    if snapshot is not None and snapshot[0] == key:
+        return snapshot[1]
+
+    lock = read_lock_file(project_dir)
+    _lock_snapshots[lock_path] = (key, lock)
+    return lock
+
+
 def get_installed_packages(
     project_dir: Path | None = None,
 ) -> dict[str, LockedPackage]:
     """Return a mapping of installed package names to their lock entries.
 
+    Served from the :func:`get_lock_file` snapshot; treat it as read-only.
+
     Args:
         project_dir: Project root directory.
 
     Returns:
         Dict mapping package names to :class:`LockedPackage` instances.
     """
-    lock = read_lock_file(project_dir)
-    return lock.packages
+    return get_lock_file(project_dir).packages
 
 
 def is_package_installed(
     package_name: str,
     project_dir: Path | None = None,
+    lock: LockFile | None = None,
 ) -> bool:
     """Check if a package is currently installed.
 
+    The lock file is the source of truth: the package directory under
+    ``.aam/packages/`` is never stat'ed. Without *lock*, the answer comes
+    from the :func:`get_lock_file` snapshot.
+
     Args:
         package_name: Full package name (scoped or unscoped).
         project_dir: Project root directory.
+        lock: Already-loaded lock file. When given, the lock file is not
+            read from disk again.
 
     Returns:
         ``True`` if the package appears in the lock file.
     """
-    packages = get_installed_packages(project_dir)
-    return package_name in packages
+    if lock is None:
+        lock = get_lock_file(project_dir)
+    return package_name in lock.packages
+
+
+################################################################################
+#                                                                              #
+# INSTALLED MANIFESTS                                                          #
+#                                                                              #
+################################################################################
+
+
+def read_installed_manifests(
+    lock: LockFile,
+    project_dir: Path | None = None,
+) -> dict[str, PackageManifest | None]:
+    """Load the ``aam.yaml`` of every package in *lock* via a stat-keyed cache.
+
+    Each manifest is looked up in ``.aam/cache/manifests.json`` by the
+    ``st_mtime_ns`` and ``st_size`` of its ``aam.yaml``, so an unchanged
+    install costs one ``stat`` instead of a YAML parse. Misses are parsed
+    on a thread pool and the cache is rewritten once at the end, dropping
+    entries for packages no longer in the lock.
+
+    Args:
+        lock: Lock file listing the installed packages.
+        project_dir: Project root directory.
+
+    Returns:
+        Mapping of package name to its manifest. Packages without a
+        directory under ``.aam/packages/`` are omitted; packages whose
+        ``aam.yaml`` is missing or could not be parsed map to ``None``.
+    """
+    packages_dir = get_packages_dir(project_dir)
+    cache_path = get_manifest_cache_path(project_dir)
+
+    # -----
+    # One directory listing instead of a stat per package directory
+    # -----
+    try:
+        with os.scandir(packages_dir) as it:
+            present = {entry.name for entry in it if entry.is_dir()}
+    except OSError:
+        present = set()
+
+    try:
+        cache = _ManifestCache.model_validate_json(cache_path.read_bytes())
+    except (OSError, ValidationError):
+        cache = _ManifestCache()
+
+    entries: dict[str, _ManifestCacheEntry] = {}
+    manifests: dict[str, PackageManifest | None] = {}
+    misses: list[tuple[str, str, Path, os.stat_result]] = []
+
+    for pkg_name in lock.packages:
+        fs_name = package_fs_name(pkg_name)
+        if fs_name not in present:
+            continue
+        manifest_path = packages_dir / fs_name / "aam.yaml"
+
+        # -----
+        # One stat decides between a cache hit and a fresh parse
+        # -----
+        try:
+            st = manifest_path.stat()
+        except OSError:
+            manifests[pkg_name] = None
+            continue
+
+        entry = cache.entries.get(fs_name)
+        if entry is None or (entry.mtime_ns, entry.size) != (st.st_mtime_ns, st.st_size):
+            manifests[pkg_name] = None  # placeholder keeps lock order
+            misses.append((pkg_name, fs_name, manifest_path, st))
+            continue
+
+        entries[fs_name] = entry
+        manifests[pkg_name] = entry.manifest
+
+    # -----
+    # Parse the misses concurrently so their file reads overlap
+    # -----
+    parsed = 0
+    if misses:
+        workers = min(MAX_MANIFEST_PARSE_WORKERS, len(misses))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(
+                executor.map(
+                    lambda miss: _parse_manifest_entry(miss[0], miss[2], miss[3]), misses
+                )
+            )
+
+        for (pkg_name, fs_name, _, _), entry in zip(misses, results, strict=True):
+            if entry is not None:
+                entries[fs_name] = entry
+                manifests[pkg_name] = entry.manifest
+                parsed += 1
+
+    if parsed or entries.keys() != cache.entries.keys():
+        _write_manifest_cache(cache_path, _ManifestCache(entries=entries))
+
+    logger.debug(f"Installed manifests loaded: total={len(manifests)}, parsed={parsed}")
+    return manifests
+
+
+def _parse_manifest_entry(
+    pkg_name: str,
+    manifest_path: Path,
+    st: os.stat_result,
+) -> _ManifestCacheEntry | None:
+    """Parse one installed ``aam.yaml`` into a cache entry.
+
+    Args:
+        pkg_name: Full package name, for logging.
+        manifest_path: Path to the package's ``aam.yaml``.
+        st: Stat result the entry is keyed by.
+
+    Returns:
+        The new entry, or ``None`` if the manifest could not be parsed.
+    """
+    try:
+        return _ManifestCacheEntry(
+            mtime_ns=st.st_mtime_ns,
+            size=st.st_size,
+            manifest=load_manifest(manifest_path),
+        )
+    except Exception as exc:
+        logger.warning(f"Could not read manifest for '{pkg_name}': {exc}")
+        return None
+
+
+def _write_manifest_cache(cache_path: Path, cache: _ManifestCache) -> None:
+    """Persist the installed manifest cache.
+
+    Write failures are logged and ignored; the cache is best-effort.
+
+    Args:
+        cache_path: Path to ``.aam/cache/manifests.json``.
+        cache: Entries to store.
+    """
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}-{threading.get_ident()}.tmp")
+        tmp_path.write_text(cache.model_dump_json(), encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except OSError as exc:
+        logger.debug(f"Could not write manifest cache '{cache_path}': {exc}")
@@ -37,9 +37,13 @@ Supported source directories and their mappings:
 ################################################################################
 
 import logging
+import mmap
+import os
+import re
+from dataclasses import dataclass
 from pathlib import Path
 
-from pydantic import BaseModel, ConfigDict
+import yaml
 
 ################################################################################
 #                                                                              #
@@ -77,6 +81,21 @@ EXCLUDED_DIRS: set[str] = {
 # All recognised platform identifiers (used for validation & filtering)
 KNOWN_PLATFORMS: set[str] = {"cursor", "codex", "copilot", "claude"}
 
+# Leading ``---`` delimited YAML frontmatter block (matched on raw bytes)
+_FRONTMATTER_RE = re.compile(
+    rb"\A---[ \t]*\r?\n(.*?)\r?\n---[ \t]*(?:\r?\n|\Z)", re.DOTALL
+)
+
+# Maximum length of a description extracted from an artifact file
+_MAX_DESCRIPTION_LENGTH: int = 256
+
+# Output order of artifact types; within a type artifacts sort by name
+_TYPE_RANK: dict[str, int] = {"skill": 0, "agent": 1, "prompt": 2, "instruction": 3}
+
+# Classifies a .cursor/rules/*.mdc filename: ``agent-<name>.mdc`` is an
+# agent, any other ``<name>.mdc`` is an instruction
+_MDC_RE = re.compile(r"^(?P<agent>agent-)?(?P<name>.+)\.mdc$")
+
 ################################################################################
 #                                                                              #
 # DATA MODEL                                                                   #
@@ -84,8 +103,13 @@ KNOWN_PLATFORMS: set[str] = {"cursor", "codex", "copilot", "claude"}
 ################################################################################
 
 
-class DetectedArtifact(BaseModel):
-    """An artifact found during project scanning."""
+@dataclass(slots=True)
+class DetectedArtifact:
+    """An artifact found during project scanning.
+
+    One instance is created per discovered file, so the class is slotted
+    to keep large scans (monorepos, curated source repos) compact.
+    """
 
     name: str  # Derived artifact name
     type: str  # skill, agent, prompt, instruction
@@ -95,8 +119,6 @@ class DetectedArtifact(BaseModel):
     # The source directory where the artifact was found (e.g. ".cursor", ".github")
     source_dir: str = ""
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
-
 
 ################################################################################
 #                                                                              #
@@ -116,6 +138,49 @@ def _in_aam_packages(rel_path: Path) -> bool:
     return len(parts) >= 2 and parts[0] == ".aam" and parts[1] == "packages"
 
 
+def _sort_artifacts(artifacts: list[DetectedArtifact]) -> None:
+    """Sort artifacts in place into a deterministic order.
+
+    Directory listing order depends on the filesystem, so results are
+    collected unordered and sorted once by ``(type, name, path)``.
+    """
+    artifacts.sort(
+        key=lambda a: (
+            _TYPE_RANK.get(a.type, len(_TYPE_RANK)),
+            a.name,
+            a.source_path.as_posix(),
+        )
+    )
+
+
+def _find_marker_dirs(root: Path) -> tuple[list[Path], list[Path]]:
+    """Walk *root* once and collect directories holding marker files.
+
+    Excluded directories (see :data:`EXCLUDED_DIRS`, which includes
+    ``.aam`` and therefore installed packages) are pruned before the walk
+    descends into them, so their subtrees are never listed.
+
+    Args:
+        root: Project root directory.
+
+    Returns:
+        Tuple of ``(skill_dirs, agent_dirs)``: paths relative to *root*
+        of directories containing ``SKILL.md`` and ``agent.yaml``.
+    """
+    skill_dirs: list[Path] = []
+    agent_dirs: list[Path] = []
+
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in EXCLUDED_DIRS]
+
+        if "SKILL.md" in filenames:
+            skill_dirs.append(Path(dirpath).relative_to(root))
+        if "agent.yaml" in filenames:
+            agent_dirs.append(Path(dirpath).relative_to(root))
+
+    return skill_dirs, agent_dirs
+
+
 ################################################################################
 #                                                                              #
 # DETECTION FUNCTIONS                                                          #
@@ -123,24 +188,78 @@ def _in_aam_packages(rel_path: Path) -> bool:
 ################################################################################
 
 
-def _detect_skills(root: Path) -> list[DetectedArtifact]:
-    """Detect skill artifacts by looking for SKILL.md files.
+def _detect_cursor_rules(
+    root: Path,
+) -> tuple[list[DetectedArtifact], list[DetectedArtifact]]:
+    """Classify ``.cursor/rules/*.mdc`` files in a single directory pass.
+
+    ``agent-<name>.mdc`` files become agents and every other ``.mdc`` file
+    becomes an instruction.
+
+    Args:
+        root: Project root directory.
+
+    Returns:
+        Tuple of ``(agents, instructions)`` artifact lists.
+    """
+    agents: list[DetectedArtifact] = []
+    instructions: list[DetectedArtifact] = []
+
+    try:
+        with os.scandir(os.path.join(root, ".cursor", "rules")) as it:
+            filenames = [entry.name for entry in it]
+    except OSError:
+        return agents, instructions
+
+    for filename in filenames:
+        match = _MDC_RE.match(filename)
+        if match is None:
+            continue
+
+        rel = Path(".cursor", "rules", filename)
+        if match.group("agent"):
+            agents.append(
+                DetectedArtifact(
+                    name=match.group("name"),
+                    type="agent",
+                    source_path=rel,
+                    platform="cursor",
+                    source_dir=".cursor",
+                    description=f"Cursor agent rule at {rel}",
+                )
+            )
+        else:
+            instructions.append(
+                DetectedArtifact(
+                    name=match.group("name"),
+                    type="instruction",
+                    source_path=rel,
+                    platform="cursor",
+                    source_dir=".cursor",
+                    description=f"Cursor rule at {rel}",
+                )
+            )
+
+    return agents, instructions
+
+
+def _detect_skills(root: Path, skill_dirs: list[Path]) -> list[DetectedArtifact]:
+    """Detect skill artifacts from directories holding a SKILL.md file.
 
     Patterns:
       - ``**/SKILL.md`` (any location — parent dir is the skill)
       - ``.cursor/skills/*/SKILL.md`` (Cursor convention)
       - ``.codex/skills/*/SKILL.md`` (Codex convention)
+
+    Args:
+        root: Project root directory.
+        skill_dirs: Relative skill directories from :func:`_find_marker_dirs`.
     """
     artifacts: list[DetectedArtifact] = []
 
-    for skill_md in root.rglob("SKILL.md"):
-        rel = skill_md.relative_to(root)
-        if _should_skip(rel) or _in_aam_packages(rel):
-            continue
-
-        skill_dir = skill_md.parent
-        name = skill_dir.name
-        rel_dir = skill_dir.relative_to(root)
+    for rel_dir in skill_dirs:
+        rel = rel_dir / "SKILL.md"
+        name = (root / rel_dir).name
 
         # -----
         # Determine platform and source directory from path
@@ -155,6 +274,8 @@ def _detect_skills(root: Path) -> list[DetectedArtifact]:
             platform = "codex"
             source_dir = ".codex"
 
+        description = _frontmatter_description(root / rel) or f"Skill at {rel_dir}"
+
         artifacts.append(
             DetectedArtifact(
                 name=name,
@@ -162,33 +283,33 @@ def _detect_skills(root: Path) -> list[DetectedArtifact]:
                 source_path=rel_dir,
                 platform=platform,
                 source_dir=source_dir,
-                description=f"Skill at {rel_dir}",
+                description=description,
             )
         )
 
     return artifacts
 
 
-def _detect_agents(root: Path) -> list[DetectedArtifact]:
+def _detect_agents(
+    root: Path,
+    agent_dirs: list[Path],
+    cursor_agents: list[DetectedArtifact],
+) -> list[DetectedArtifact]:
     """Detect agent artifacts.
 
     Patterns:
-      - ``**/agent.yaml`` (AAM convention)
-      - ``.cursor/rules/agent-*.mdc`` (Cursor convention)
+      - ``**/agent.yaml`` (AAM convention, from :func:`_find_marker_dirs`)
+      - ``.cursor/rules/agent-*.mdc`` (Cursor convention, from
+        :func:`_detect_cursor_rules`)
     """
     artifacts: list[DetectedArtifact] = []
 
     # -----
     # Pattern 1: agent.yaml files
     # -----
-    for agent_yaml in root.rglob("agent.yaml"):
-        rel = agent_yaml.relative_to(root)
-        if _should_skip(rel) or _in_aam_packages(rel):
-            continue
-
-        agent_dir = agent_yaml.parent
-        name = agent_dir.name
-        rel_dir = agent_dir.relative_to(root)
+    for rel_dir in agent_dirs:
+        rel = rel_dir / "agent.yaml"
+        name = (root / rel_dir).name
 
         # Determine source directory
         source_dir = ""
@@ -210,26 +331,9 @@ def _detect_agents(root: Path) -> list[DetectedArtifact]:
         )
 
     # -----
-    # Pattern 2: .cursor/rules/agent-*.mdc
+    # Pattern 2: .cursor/rules/agent-*.mdc (pre-classified by caller)
     # -----
-    cursor_rules_dir = root / ".cursor" / "rules"
-    if cursor_rules_dir.is_dir():
-        for mdc_file in cursor_rules_dir.glob("agent-*.mdc"):
-            rel = mdc_file.relative_to(root)
-            if _in_aam_packages(rel):
-                continue
-
-            name = mdc_file.stem.removeprefix("agent-")
-            artifacts.append(
-                DetectedArtifact(
-                    name=name,
-                    type="agent",
-                    source_path=rel,
-                    platform="cursor",
-                    source_dir=".cursor",
-                    description=f"Cursor agent rule at {rel}",
-                )
-            )
+    artifacts.extend(cursor_agents)
 
     return artifacts
 
@@ -257,12 +361,10 @@ def _detect_prompts(root: Path) -> list[DetectedArtifact]:
     ]
 
     for prompt_dir, platform, source_dir in prompt_dirs:
-        if not prompt_dir.is_dir():
+        if not os.path.isdir(prompt_dir):
             continue
         for md_file in prompt_dir.glob("*.md"):
             rel = md_file.relative_to(root)
-            if _in_aam_packages(rel):
-                continue
 
             # -----
             # Derive a clean name from the filename
@@ -292,12 +394,16 @@ def _detect_prompts(root: Path) -> list[DetectedArtifact]:
     return artifacts
 
 
-def _detect_instructions(root: Path) -> list[DetectedArtifact]:
+def _detect_instructions(
+    root: Path,
+    cursor_instructions: list[DetectedArtifact],
+) -> list[DetectedArtifact]:
     """Detect instruction artifacts.
 
     Patterns:
       - ``instructions/*.md`` (AAM convention)
-      - ``.cursor/rules/*.mdc`` non-agent (Cursor convention)
+      - ``.cursor/rules/*.mdc`` non-agent (Cursor convention, from
+        :func:`_detect_cursor_rules`)
       - ``CLAUDE.md`` (Claude convention)
       - ``AGENTS.md`` (Codex convention)
       - ``.github/copilot-instructions.md`` (Copilot convention)
@@ -308,7 +414,7 @@ def _detect_instructions(root: Path) -> list[DetectedArtifact]:
     # Pattern 1: instructions/*.md
     # -----
     instructions_dir = root / "instructions"
-    if instructions_dir.is_dir():
+    if os.path.isdir(instructions_dir):
         for md_file in instructions_dir.glob("*.md"):
             rel = md_file.relative_to(root)
             artifacts.append(
@@ -323,26 +429,9 @@ def _detect_instructions(root: Path) -> list[DetectedArtifact]:
             )
 
     # -----
-    # Pattern 2: .cursor/rules/*.mdc (non-agent)
+    # Pattern 2: .cursor/rules/*.mdc non-agent (pre-classified by caller)
     # -----
-    cursor_rules_dir = root / ".cursor" / "rules"
-    if cursor_rules_dir.is_dir():
-        for mdc_file in cursor_rules_dir.glob("*.mdc"):
-            if mdc_file.name.startswith("agent-"):
-                continue  # Handled by _detect_agents
-            rel = mdc_file.relative_to(root)
-            if _in_aam_packages(rel):
-                continue
-            artifacts.append(
-                DetectedArtifact(
-                    name=mdc_file.stem,
-                    type="instruction",
-                    source_path=rel,
-                    platform="cursor",
-                    source_dir=".cursor",
-                    description=f"Cursor rule at {rel}",
-                )
-            )
+    artifacts.extend(cursor_instructions)
 
     # -----
     # Pattern 3: Standalone instruction files
@@ -354,9 +443,10 @@ def _detect_instructions(root: Path) -> list[DetectedArtifact]:
         (".github/copilot-instructions.md", "copilot-instructions", "copilot", ".github"),
     ]
 
+    # Plain os.path checks avoid building a Path per candidate file
+    root_str = str(root)
     for file_rel, name, platform, source_dir in standalone:
-        filepath = root / file_rel
-        if filepath.is_file():
+        if os.path.isfile(os.path.join(root_str, file_rel)):
             artifacts.append(
                 DetectedArtifact(
                     name=name,
@@ -494,8 +584,6 @@ def scan_directory(
     # Walk directory tree manually to handle dot-prefixed directories
     # (os.walk and Path.rglob handle dots, but we need custom exclusion)
     # -----
-    import os
-
     for dirpath_str, dirnames, filenames in os.walk(scan_root):
         dirpath = Path(dirpath_str)
 
@@ -526,14 +614,15 @@ def scan_directory(
                 source_dir = ".codex"
 
             # -----
-            # Extract description from first line of SKILL.md
+            # Extract description from SKILL.md frontmatter, falling back
+            # to its first content line
             # -----
-            description = f"Skill at {skill_rel}"
             skill_md = dirpath / "SKILL.md"
-            if skill_md.is_file():
-                desc = _extract_first_line(skill_md)
-                if desc:
-                    description = desc
+            description = (
+                _frontmatter_description(skill_md)
+                or _extract_first_line(skill_md)
+                or f"Skill at {skill_rel}"
+            )
 
             artifacts.append(
                 DetectedArtifact(
@@ -652,9 +741,9 @@ def scan_directory(
         ("CLAUDE.md", "claude-instructions", "claude", ""),
         ("AGENTS.md", "codex-instructions", "codex", ""),
     ]
+    scan_root_str = str(scan_root)
     for filename, name, platform, source_dir in standalone_instructions:
-        filepath = scan_root / filename
-        if filepath.is_file():
+        if os.path.isfile(os.path.join(scan_root_str, filename)):
             artifacts.append(
                 DetectedArtifact(
                     name=name,
@@ -666,6 +755,8 @@ def scan_directory(
                 )
             )
 
+    _sort_artifacts(artifacts)
+
     logger.info(
         f"Directory scan complete: found {len(artifacts)} artifacts "
         f"(skills={sum(1 for a in artifacts if a.type == 'skill')}, "
@@ -677,6 +768,58 @@ def scan_directory(
     return artifacts
 
 
+def _read_frontmatter(filepath: Path) -> bytes | None:
+    """Return the raw YAML frontmatter block at the top of a file.
+
+    The file is memory-mapped and matched against a pre-compiled pattern,
+    so only the frontmatter bytes are copied out — the body is never read
+    into a Python buffer.
+
+    Args:
+        filepath: Path to the markdown file.
+
+    Returns:
+        The bytes between the ``---`` delimiters, or ``None`` if the file
+        has no frontmatter or cannot be read.
+    """
+    try:
+        with (
+            filepath.open("rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+        ):
+            match = _FRONTMATTER_RE.match(mapped)
+            return match.group(1) if match else None
+    except (OSError, ValueError):
+        # ValueError: empty files cannot be memory-mapped
+        return None
+
+
+def _frontmatter_description(filepath: Path) -> str | None:
+    """Return the ``description`` field from a file's YAML frontmatter.
+
+    Args:
+        filepath: Path to the markdown file (e.g. ``SKILL.md``).
+
+    Returns:
+        The stripped description, or ``None`` if absent or unparsable.
+    """
+    block = _read_frontmatter(filepath)
+    if block is None:
+        return None
+
+    try:
+        data = yaml.safe_load(block.decode("utf-8"))
+    except (UnicodeDecodeError, yaml.YAMLError):
+        logger.debug(f"Invalid frontmatter, ignoring: {filepath}")
+        return None
+
+    if isinstance(data, dict):
+        description = data.get("description")
+        if isinstance(description, str) and description.strip():
+            return description.strip()[:_MAX_DESCRIPTION_LENGTH]
+    return None
+
+
 def _extract_first_line(filepath: Path) -> str | None:
     """Extract the first meaningful line from a markdown file.
 
@@ -697,7 +840,7 @@ def _extract_first_line(filepath: Path) -> str | None:
                 if stripped.startswith("#"):
                     stripped = stripped.lstrip("#").strip()
                 if stripped:
-                    return stripped[:256]
+                    return stripped[:_MAX_DESCRIPTION_LENGTH]
     except OSError:
         pass
     return None
@@ -725,11 +868,15 @@ def scan_project(
         logger.warning(f"Project root is not a directory: {root}")
         return []
 
+    skill_dirs, agent_dirs = _find_marker_dirs(root)
+    cursor_agents, cursor_instructions = _detect_cursor_rules(root)
+
     artifacts: list[DetectedArtifact] = []
-    artifacts.extend(_detect_skills(root))
-    artifacts.extend(_detect_agents(root))
+    artifacts.extend(_detect_skills(root, skill_dirs))
+    artifacts.extend(_detect_agents(root, agent_dirs, cursor_agents))
     artifacts.extend(_detect_prompts(root))
-    artifacts.extend(_detect_instructions(root))
+    artifacts.extend(_detect_instructions(root, cursor_instructions))
+    _sort_artifacts(artifacts)
 
     # -----
     # Apply platform filter if specified
@@ -0,0 +1,181 @@
+"""On-disk cache of registry package metadata for the resolver.
+
+Entries live at ``.aam/cache/resolve/<registry>/<package>.json`` and hold
+the metadata together with the validator ("etag") it was read under.
+A lookup only hits when the registry reports the same validator, so a
+changed ``metadata.yaml`` is never served stale. The cache is bounded:
+once it holds more than :data:`MAX_CACHE_ENTRIES` files the least
+recently written ones are dropped.
+
+Entries read or written in this process are also kept in memory, keyed
+by the stat of their JSON file, so resolving several packages in one
+command (``aam install a b c``) costs a ``stat`` per repeated lookup
+instead of a read and parse. The file stays authoritative: an entry that
+was pruned, invalidated or rewritten no longer matches its stat.
+"""
+
+################################################################################
+#                                                                              #
+# IMPORTS & DEPENDENCIES                                                       #
+#                                                                              #
+################################################################################
+
+import contextlib
+import json
+import logging
+import os
+import shutil
+import threading
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from aam_cli.registry.base import PackageMetadata
+from aam_cli.utils.naming import package_fs_name
+
+################################################################################
+#                                                                              #
+# LOGGING                                                                      #
+#                                                                              #
+################################################################################
+
+# Initialize logger for this module
+logger = logging.getLogger(__name__)
+
+################################################################################
+#                                                                              #
+# CONSTANTS                                                                    #
+#                                                                              #
+################################################################################
+
+# Maximum number of cached metadata entries across all registries
+MAX_CACHE_ENTRIES: int = 200
+
+################################################################################
+#                                                                              #
+# METADATA CACHE                                                               #
+#                                                                              #
+################################################################################
+
+
+class MetadataCache:
+    """Validator-keyed metadata cache rooted at a directory."""
+
+    # Process-wide layer shared by every instance:
+    # entry path -> ((st_mtime_ns, st_size), etag, metadata)
+    _memory: dict[Path, tuple[tuple[int, int], str, PackageMetadata]] = {}
+
+    def __init__(self, root: Path, max_entries: int = MAX_CACHE_ENTRIES) -> None:
+        """Initialize the cache.
+
+        Args:
+            root: Cache directory (created on first write).
+            max_entries: Entry count above which old entries are pruned.
+        """
+        self.root = root
+        self.max_entries = max_entries
+
+    def get(self, registry: str, name: str, etag: str) -> PackageMetadata | None:
+        """Return cached metadata if it was stored under *etag*.
+
+        Args:
+            registry: Registry name.
+            name: Full package name.
+            etag: Current validator reported by the registry.
+
+        Returns:
+            The cached metadata, or ``None`` on a miss or unreadable entry.
+        """
+        path = self._entry_path(registry, name)
+        try:
+            with path.open("rb") as f:
+                st = os.fstat(f.fileno())
+                remembered = self._memory.get(path)
+                if remembered is not None and remembered[0] == (st.st_mtime_ns, st.st_size):
+                    _, cached_etag, metadata = remembered
+                    return metadata if cached_etag == etag else None
+
+                entry = json.loads(f.read())
+            if entry.get("etag") != etag:
+                return None
+            metadata = PackageMetadata.model_validate(entry["metadata"])
+        except (OSError, ValueError, KeyError, ValidationError):
+            return None
+
+        self._memory[path] = ((st.st_mtime_ns, st.st_size), etag, metadata)
+        logger.debug(f"Resolve cache hit: registry='{registry}', name='{name}'")
+        return metadata
+
+    def put(self, registry: str, name: str, etag: str, metadata: PackageMetadata) -> None:
+        """Store *metadata* under *etag*, pruning old entries if needed.
+
+        Write failures are logged and ignored; the cache is best-effort.
+
+        Args:
+            registry: Registry name.
+            name: Full package name.
+            etag: Validator the metadata was read under.
+            metadata: Metadata to cache.
+        """
+        path = self._entry_path(registry, name)
+        payload = json.dumps({"etag": etag, "metadata": metadata.model_dump(mode="json")})
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}-{threading.get_ident()}.tmp")
+            tmp_path.write_text(payload, encoding="utf-8")
+            os.replace(tmp_path, path)
+            st = path.stat()
+        except OSError as exc:
+            logger.debug(f"Could not write resolve cache entry '{path}': {exc}")
+            return
+
+        self._memory[path] = ((st.st_mtime_ns, st.st_size), etag, metadata)
+
+        # Concurrent writers may remove entries mid-scan; pruning is best-effort
+        with contextlib.suppress(OSError):
+            self._prune()
+
+    def invalidate(self, registry: str, name: str | None = None) -> None:
+        """Drop one package's entry, or every entry of *registry*.
+
+        Args:
+            registry: Registry name.
+            name: Full package name; ``None`` drops the whole registry.
+        """
+        if name is None:
+            shutil.rmtree(self.root / registry, ignore_errors=True)
+        else:
+            self._entry_path(registry, name).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _entry_path(self, registry: str, name: str) -> Path:
+        """Path of the entry file for *name* in *registry*."""
+        return self.root / registry / f"{package_fs_name(name)}.json"
+
+    def _prune(self) -> None:
+        """Delete the oldest entries beyond ``max_entries``."""
+        entries: list[tuple[int, str]] = []
+        with os.scandir(self.root) as registries:
+            for reg_entry in registries:
+                if not reg_entry.is_dir():
+                    continue
+                with os.scandir(reg_entry.path) as files:
+                    entries.extend(
+                        (f.stat().st_mtime_ns, f.path) for f in files if f.name.endswith(".json")
+                    )
+
+        excess = len(entries) - self.max_entries
+        if excess <= 0:
+            return
+
+        entries.sort()
+        for _, path in entries[:excess]:
+            Path(path).unlink(missing_ok=True)
+        logger.debug(f"Pruned {excess} resolve cache entries")
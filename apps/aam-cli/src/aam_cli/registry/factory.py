@@ -1,7 +1,10 @@
 """Registry factory — instantiate registries from configuration.
 
 Provides a single entry point for creating registry instances from
-``RegistrySource`` config objects.
+``RegistrySource`` config objects. Instances are memoized per
+``(name, type, url)`` so repeated lookups in one process share them, and
+:class:`LazyRegistryList` defers construction until a registry is
+actually consulted.
 """
 
 ################################################################################
@@ -11,6 +14,9 @@ Provides a single entry point for creating registry instances from
 ################################################################################
 
 import logging
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from functools import cache
 
 from aam_cli.core.config import RegistrySource
 from aam_cli.registry.base import Registry
@@ -36,6 +42,9 @@ logger = logging.getLogger(__name__)
 def create_registry(source: RegistrySource) -> Registry:
     """Create a registry instance from a configuration source.
 
+    Instances are cached per ``(name, type, url)``, so the same
+    configured registry always maps to the same object.
+
     Args:
         source: Registry source configuration.
 
@@ -45,18 +54,81 @@ def create_registry(source: RegistrySource) -> Registry:
     Raises:
         ValueError: If the registry type is not supported.
     """
-    logger.debug(
-        f"Creating registry: name='{source.name}', type='{source.type}', url='{source.url}'"
-    )
+    return _create_registry(source.name, source.type, source.url)
+
 
-    if source.type == "local":
-        local_path = parse_file_url(source.url)
-        return LocalRegistry(name=source.name, root=local_path)
+@cache
+def _create_registry(name: str, registry_type: str, url: str) -> Registry:
+    """Build a registry instance (memoized by :func:`create_registry`)."""
+    logger.debug(f"Creating registry: name='{name}', type='{registry_type}', url='{url}'")
+
+    if registry_type == "local":
+        local_path = parse_file_url(url)
+        return LocalRegistry(name=name, root=local_path)
 
     # -----
     # Unsupported types raise immediately — no fallbacks
     # -----
     raise ValueError(
-        f"Unsupported registry type '{source.type}'. "
+        f"Unsupported registry type '{registry_type}'. "
         "Only 'local' registries are supported in this version."
     )
+
+
+################################################################################
+#                                                                              #
+# LAZY REGISTRY LIST                                                           #
+#                                                                              #
+################################################################################
+
+
+class LazyRegistryList:
+    """Configured registries, each built the first time it is iterated to.
+
+    Resolution usually stops at the first registry that has the package,
+    so later registries are never constructed. Built instances (and
+    failures) are remembered, so iterating again is cheap.
+    """
+
+    def __init__(
+        self,
+        sources: Iterable[RegistrySource],
+        on_error: Callable[[RegistrySource, ValueError], None] | None = None,
+    ) -> None:
+        """Initialize the lazy list.
+
+        Args:
+            sources: Registry sources in lookup order.
+            on_error: Called once for each source that cannot be built;
+                that source is then skipped. Without it the
+                ``ValueError`` propagates.
+        """
+        self._sources = list(sources)
+        self._on_error = on_error
+        self._built: dict[int, Registry | None] = {}
+        self._lock = threading.Lock()
+
+    def __iter__(self) -> Iterator[Registry]:
+        for index, source in enumerate(self._sources):
+            if index not in self._built:
+                # Resolver threads may iterate concurrently; build once
+                with self._lock:
+                    if index not in self._built:
+                        self._built[index] = self._build(source)
+
+            registry = self._built[index]
+            if registry is not None:
+                yield registry
+
+    def _build(self, source: RegistrySource) -> Registry | None:
+        """Create one registry, reporting failures via ``on_error``."""
+        try:
+            return create_registry(source)
+        except ValueError as exc:
+            if self._on_error is None:
+                raise
+            self._on_error(source, exc)
+            return None
+
+    def __len__(self) -> int:
+        return len(self._sources)
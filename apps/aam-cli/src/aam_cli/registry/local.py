@@ -26,15 +26,14 @@ import shutil
 from datetime import UTC, datetime
 from pathlib import Path
 
-from aam_cli.core.manifest import PackageManifest, load_manifest
+from aam_cli.core.manifest import PackageManifest, parse_manifest
 from aam_cli.registry.base import (
     PackageIndexEntry,
     PackageMetadata,
     VersionInfo,
 )
-from aam_cli.utils.archive import extract_archive
-from aam_cli.utils.checksum import calculate_sha256
-from aam_cli.utils.naming import parse_package_name, to_filesystem_name
+from aam_cli.utils.archive import read_archive_member_with_digest
+from aam_cli.utils.naming import package_fs_name
 from aam_cli.utils.yaml_utils import dump_yaml, load_yaml, load_yaml_optional
 
 ################################################################################
@@ -155,6 +154,27 @@ class LocalRegistry:
         metadata = self.get_metadata(name)
         return [v.version for v in metadata.versions]
 
+    def metadata_etag(self, name: str) -> str:
+        """Return a validator that changes whenever a package's metadata does.
+
+        Derived from the ``metadata.yaml`` stat (mtime and size), so it
+        can be checked without reading or parsing the file.
+
+        Args:
+            name: Full package name.
+
+        Returns:
+            Opaque validator string.
+
+        Raises:
+            KeyError: If the package does not exist.
+        """
+        try:
+            st = (self._package_dir(name) / "metadata.yaml").stat()
+        except FileNotFoundError:
+            raise KeyError(f"Package '{name}' not found in registry '{self.name}'") from None
+        return f"{st.st_mtime_ns:x}-{st.st_size:x}"
+
     def download(self, name: str, version: str, dest: Path) -> Path:
         """Copy a package archive to a destination directory.
 
@@ -186,7 +206,7 @@ class LocalRegistry:
         """Publish a package archive to this registry.
 
         Steps:
-          1. Extract the archive to read aam.yaml
+          1. Read aam.yaml from the archive
           2. Copy the archive to packages/<name>/versions/<ver>.aam
           3. Update metadata.yaml
           4. Rebuild index.yaml
@@ -204,14 +224,11 @@ class LocalRegistry:
             raise FileNotFoundError(f"Archive not found: {archive_path}")
 
         # -----
-        # Step 1: Extract to a temp directory to read aam.yaml
+        # Step 1: Read aam.yaml straight out of the archive, hashing the
+        # archive on the same read; nothing is extracted to disk
         # -----
-        import tempfile
-
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            tmp_path = Path(tmp_dir)
-            extract_archive(archive_path, tmp_path)
-            manifest = load_manifest(tmp_path)
+        manifest_bytes, checksum = read_archive_member_with_digest(archive_path, "aam.yaml")
+        manifest = parse_manifest(manifest_bytes.decode("utf-8"), archive_path / "aam.yaml")
 
         # -----
         # Step 2: Check for duplicate version
@@ -235,7 +252,6 @@ class LocalRegistry:
         # -----
         # Step 4: Update metadata.yaml
         # -----
-        checksum = calculate_sha256(version_archive)
         size = version_archive.stat().st_size
         now = datetime.now(UTC).isoformat()
 
@@ -315,8 +331,7 @@ class LocalRegistry:
         Converts scoped names (``@scope/name``) to filesystem-safe
         format (``scope--name``).
         """
-        scope, base_name = parse_package_name(name)
-        fs_name = to_filesystem_name(scope, base_name)
+        fs_name = package_fs_name(name)
         return self.root / "packages" / fs_name
 
     def _version_archive_path(self, name: str, version: str) -> Path:
@@ -13,14 +13,22 @@ Reference: spec.md User Story 4; data-model.md entities 9, 12.
 #                                                                              #
 ################################################################################
 
+import base64
+import hashlib
 import logging
+import os
 import shutil
+import zlib
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 from aam_cli.core.workspace import (
+    LockedPackage,
+    LockFile,
     get_installed_packages,
 )
 from aam_cli.utils.checksum import calculate_sha256
@@ -96,6 +104,13 @@ BACKUPS_DIR_NAME: str = "backups"
 # Checksum prefix (matches checksum.py convention)
 CHECKSUM_PREFIX: str = "sha256:"
 
+# Worker threads for hashing package files. hashlib releases the GIL
+# while digesting, so threads scale with cores on large packages.
+MAX_HASH_WORKERS: int = min(32, (os.cpu_count() or 1) * 2)
+
+# Below this many files, hash serially; pool startup would dominate
+PARALLEL_HASH_MIN_FILES: int = 16
+
 ################################################################################
 #                                                                              #
 # INTERNAL HELPERS                                                             #
@@ -122,10 +137,41 @@ def _compute_file_sha256(file_path: Path) -> str:
     return full_checksum.removeprefix(CHECKSUM_PREFIX)
 
 
+def _hash_or_none(file_path: Path) -> str | None:
+    """Hash *file_path*, or return ``None`` if it is not a regular file."""
+    try:
+        return _compute_file_sha256(file_path)
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+        return None
+
+
+def _hash_files(directory: Path, rel_paths: list[str]) -> list[str | None]:
+    """Hash many package files, in parallel when there are enough of them.
+
+    Args:
+        directory: Root the relative paths are resolved against.
+        rel_paths: Relative file paths to hash.
+
+    Returns:
+        Hex digests in the order of *rel_paths*; ``None`` for paths that
+        are missing or not regular files.
+    """
+    paths = [directory / rel for rel in rel_paths]
+    if len(paths) < PARALLEL_HASH_MIN_FILES:
+        return [_hash_or_none(p) for p in paths]
+
+    workers = min(MAX_HASH_WORKERS, len(paths))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_hash_or_none, paths))
+
+
 def _list_package_files(package_dir: Path) -> list[str]:
     """List all files in a package directory, relative to it.
 
-    Excludes hidden files and directories.
+    Excludes hidden files and directories. Walks with ``os.scandir`` so
+    file types come from the directory entries rather than a ``stat``
+    per path, and hidden directories are pruned instead of descended
+    into. Symlinked directories are not followed.
 
     Args:
         package_dir: Root directory of the installed package.
@@ -134,12 +180,25 @@ def _list_package_files(package_dir: Path) -> list[str]:
         List of relative file paths as strings.
     """
     files: list[str] = []
-    for file_path in package_dir.rglob("*"):
-        if file_path.is_file():
-            rel = str(file_path.relative_to(package_dir))
-            # Skip hidden files
-            if not any(part.startswith(".") for part in Path(rel).parts):
+    stack: list[tuple[str, str]] = [(str(package_dir), "")]
+
+    while stack:
+        dir_path, prefix = stack.pop()
+        try:
+            with os.scandir(dir_path) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            rel = prefix + entry.name
+            if entry.is_dir(follow_symlinks=False):
+                stack.append((entry.path, rel + os.sep))
+            elif entry.is_file():
                 files.append(rel)
+
     return sorted(files)
 
 
@@ -153,6 +212,7 @@ def _list_package_files(package_dir: Path) -> list[str]:
 def verify_package(
     package_name: str,
     project_dir: Path | None = None,
+    lock: LockFile | None = None,
 ) -> dict[str, Any]:
     """Verify integrity of an installed package's files.
 
@@ -162,6 +222,8 @@ def verify_package(
     Args:
         package_name: Name of the package to verify.
         project_dir: Project root directory.
+        lock: Already-loaded lock file. When given, the lock file is not
+            read from disk again.
 
     Returns:
         Dict with verification results matching ``VerifyResult``
@@ -175,7 +237,7 @@ def verify_package(
     # -----
     # Load lock file and find the package
     # -----
-    packages = get_installed_packages(project_dir)
+    packages = lock.packages if lock is not None else get_installed_packages(project_dir)
     locked = packages.get(package_name)
 
     if locked is None:
@@ -184,6 +246,28 @@ def verify_package(
             f"is not installed"
         )
 
+    return _verify_locked_package(package_name, locked, project_dir)
+
+
+def _verify_locked_package(
+    package_name: str,
+    locked: LockedPackage,
+    project_dir: Path | None,
+) -> dict[str, Any]:
+    """Verify a package's files against its already-loaded lock entry.
+
+    Args:
+        package_name: Name of the package to verify.
+        locked: The package's lock file entry.
+        project_dir: Project root directory.
+
+    Returns:
+        Dict with verification results matching ``VerifyResult``
+        fields.
+
+    Raises:
+        ValueError: If the package directory is missing.
+    """
     # -----
     # Check if file checksums are available
     # -----
@@ -223,14 +307,13 @@ def verify_package(
     modified_files: list[str] = []
     missing_files: list[str] = []
 
-    for rel_path, expected_hash in recorded.items():
-        file_path = package_dir / rel_path
-        if not file_path.is_file():
+    actual_hashes = _hash_files(package_dir, list(recorded))
+    for (rel_path, expected_hash), actual_hash in zip(
+        recorded.items(), actual_hashes, strict=True
+    ):
+        if actual_hash is None:
             missing_files.append(rel_path)
-            continue
-
-        actual_hash = _compute_file_sha256(file_path)
-        if actual_hash == expected_hash:
+        elif actual_hash == expected_hash:
             ok_files.append(rel_path)
         else:
             modified_files.append(rel_path)
@@ -374,6 +457,7 @@ def create_backup(
 def check_modifications(
     package_name: str,
     project_dir: Path | None = None,
+    lock: LockFile | None = None,
 ) -> dict[str, Any]:
     """Check if an installed package has locally modified files.
 
@@ -383,6 +467,8 @@ def check_modifications(
     Args:
         package_name: Name of the package to check.
         project_dir: Project root directory.
+        lock: Already-loaded lock file. When given, the lock file is not
+            read from disk again.
 
     Returns:
         Dict with keys ``has_modifications``, ``modified_files``,
@@ -390,7 +476,7 @@ def check_modifications(
     """
     logger.info(f"Checking modifications: package='{package_name}'")
 
-    packages = get_installed_packages(project_dir)
+    packages = lock.packages if lock is not None else get_installed_packages(project_dir)
     locked = packages.get(package_name)
 
     if locked is None:
@@ -412,7 +498,7 @@ def check_modifications(
     # -----
     # Re-use verify_package logic for consistency
     # -----
-    result = verify_package(package_name, project_dir)
+    result = _verify_locked_package(package_name, locked, project_dir)
 
     has_mods = bool(result["modified_files"] or result["missing_files"])
 
@@ -457,11 +543,139 @@ def compute_file_checksums(
     if files is None:
         files = _list_package_files(directory)
 
-    checksums: dict[str, str] = {}
-    for rel_path in files:
-        file_path = directory / rel_path
-        if file_path.is_file():
-            checksums[rel_path] = _compute_file_sha256(file_path)
+    checksums: dict[str, str] = {
+        rel_path: digest
+        for rel_path, digest in zip(files, _hash_files(directory, files), strict=True)
+        if digest is not None
+    }
 
     logger.info(f"Checksums computed: files={len(checksums)}")
     return checksums
+
+
+################################################################################
+#                                                                              #
+# PUBLIC API: ORIGINAL CONTENT                                                 #
+#                                                                              #
+################################################################################
+
+
+def encode_original(data: bytes) -> str:
+    """Encode original file bytes for storage in the lock file.
+
+    Args:
+        data: Original file content.
+
+    Returns:
+        Base64 string of the zlib-compressed bytes.
+    """
+    return base64.b64encode(zlib.compress(data)).decode("ascii")
+
+
+def decode_original(blob: str) -> bytes:
+    """Decode a lock file blob produced by :func:`encode_original`.
+
+    Args:
+        blob: Base64 string of zlib-compressed bytes.
+
+    Returns:
+        Original file content.
+    """
+    return zlib.decompress(base64.b64decode(blob))
+
+
+def compute_file_originals(
+    directory: Path,
+    files: list[str],
+) -> dict[str, str]:
+    """Capture the original content of package files for later diffs.
+
+    Binary files (containing NUL bytes) and unreadable files are
+    skipped — ``aam diff`` only renders text.
+
+    Args:
+        directory: Root directory of the package.
+        files: Relative paths to capture (usually the checksummed files).
+
+    Returns:
+        Dict mapping relative file paths to encoded blobs.
+    """
+    originals: dict[str, str] = {}
+    for rel_path in files:
+        try:
+            data = (directory / rel_path).read_bytes()
+        except OSError:
+            continue
+        if b"\0" in data:
+            continue
+        originals[rel_path] = encode_original(data)
+
+    logger.debug(f"Originals captured: files={len(originals)}")
+    return originals
+
+
+################################################################################
+#                                                                              #
+# PUBLIC API: STAT FINGERPRINT                                                 #
+#                                                                              #
+################################################################################
+
+
+def _iter_file_stats(directory: Path, prefix: str = "") -> list[tuple[str, int, int]]:
+    """Collect ``(rel_path, size, mtime_ns)`` for non-hidden files.
+
+    Hidden files and directories are skipped and symlinked directories
+    are not followed, matching :func:`_list_package_files`.
+    """
+    stats: list[tuple[str, int, int]] = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            rel = f"{prefix}{entry.name}"
+            if entry.is_dir(follow_symlinks=False):
+                stats.extend(_iter_file_stats(Path(entry.path), f"{rel}{os.sep}"))
+            elif entry.is_file(follow_symlinks=True):
+                st = entry.stat()
+                stats.append((rel, st.st_size, st.st_mtime_ns))
+    return stats
+
+
+def compute_stat_fingerprint(
+    directory: Path,
+    tracked: Iterable[str],
+) -> tuple[str, list[str]]:
+    """Fingerprint a package directory from file metadata only.
+
+    No file content is read: the digest covers each file's relative
+    path, size and modification time.  Any edit, addition or removal
+    changes it, while re-hashing every file is avoided.
+
+    The walk skips hidden files like :func:`_list_package_files`, so
+    every *tracked* file is also stat'ed directly; a recorded hidden
+    file is then covered exactly like the checksum check covers it.
+
+    Args:
+        directory: Installed package directory.
+        tracked: Relative paths recorded in the package's file checksums.
+
+    Returns:
+        Tuple of ``(hex_digest, sorted relative paths of present files)``.
+    """
+    stats = {rel: (size, mtime_ns) for rel, size, mtime_ns in _iter_file_stats(directory)}
+    for rel in tracked:
+        if rel in stats:
+            continue
+        try:
+            st = (directory / rel).stat()
+        except OSError:
+            continue
+        stats[rel] = (st.st_size, st.st_mtime_ns)
+
+    files = sorted(stats)
+    digest = hashlib.sha256()
+    for rel in files:
+        size, mtime_ns = stats[rel]
+        digest.update(f"{rel}\0{size}\0{mtime_ns}\n".encode())
+
+    return digest.hexdigest(), files
@@ -20,7 +20,7 @@ from pydantic import ValidationError
 from aam_cli.core.config import AamConfig, load_config
 from aam_cli.core.manifest import load_manifest
 from aam_cli.core.workspace import get_packages_dir, read_lock_file
-from aam_cli.utils.naming import parse_package_name, to_filesystem_name
+from aam_cli.utils.naming import package_fs_name
 from aam_cli.utils.paths import get_global_config_path, get_project_config_path
 from aam_cli.utils.yaml_utils import load_yaml_optional
 
@@ -390,8 +390,7 @@ def _check_packages_integrity(project_dir: Path) -> list[dict[str, Any]]:
     packages_dir = get_packages_dir(project_dir)
 
     for pkg_name, _locked in lock.packages.items():
-        scope, base_name = parse_package_name(pkg_name)
-        fs_name = to_filesystem_name(scope, base_name)
+        fs_name = package_fs_name(pkg_name)
         pkg_dir = packages_dir / fs_name
 
         if not pkg_dir.is_dir():
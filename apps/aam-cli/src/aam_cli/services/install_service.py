@@ -31,15 +31,23 @@ from aam_cli.core.resolver import resolve_dependencies
 from aam_cli.core.workspace import (
     FileChecksums,
     LockedPackage,
+    LockFile,
     ensure_workspace,
     get_packages_dir,
     is_package_installed,
     read_lock_file,
     write_lock_file,
 )
-from aam_cli.registry.factory import create_registry
+from aam_cli.registry.cache import MetadataCache
+from aam_cli.registry.factory import LazyRegistryList
+from aam_cli.services.checksum_service import (
+    compute_file_checksums,
+    compute_file_originals,
+    compute_stat_fingerprint,
+)
 from aam_cli.services.source_service import VirtualPackage
 from aam_cli.utils.naming import parse_package_spec
+from aam_cli.utils.paths import copytree_reflink, get_resolve_cache_dir
 from aam_cli.utils.yaml_utils import dump_yaml
 
 ################################################################################
@@ -230,14 +238,12 @@ def _install_single_package(
     # -----
     # Step 2: Check if already installed
     # -----
-    if not force and is_package_installed(pkg_name, project_dir):
-        lock = read_lock_file(project_dir)
-        existing = lock.packages.get(pkg_name)
-        if existing:
-            return {
-                "status": "already_installed",
-                "name": pkg_name,
-            }
+    lock = read_lock_file(project_dir)
+    if not force and pkg_name in lock.packages:
+        return {
+            "status": "already_installed",
+            "name": pkg_name,
+        }
 
     # -----
     # Step 3: Check for configured registries
@@ -252,11 +258,12 @@ def _install_single_package(
     # Step 4: Resolve dependencies
     # -----
     constraint = pkg_version or "*"
-    registries = [create_registry(reg_source) for reg_source in config.registries]
+    registries = LazyRegistryList(config.registries)
 
     resolved = resolve_dependencies(
         [(pkg_name, constraint)],
         registries,
+        cache=MetadataCache(get_resolve_cache_dir(project_dir)),
     )
 
     # -----
@@ -273,12 +280,12 @@ def _install_single_package(
         project_dir,
         no_deploy=no_deploy,
         force=force,
+        lock=lock,
     )
 
     # -----
-    # Step 6: Build result
+    # Step 6: Build result (the installer updated ``lock`` in place)
     # -----
-    lock = read_lock_file(project_dir)
     locked = lock.packages.get(pkg_name)
 
     info: dict[str, Any] = {
@@ -312,6 +319,7 @@ def install_from_source(
     config: AamConfig,
     force: bool = False,
     no_deploy: bool = False,
+    lock: LockFile | None = None,
 ) -> dict[str, Any]:
     """Install an artifact directly from a source cache.
 
@@ -327,6 +335,9 @@ def install_from_source(
         config: AAM configuration.
         force: Overwrite existing installation.
         no_deploy: Skip platform deployment.
+        lock: Already-loaded lock file to update in place. The caller
+            then owns persisting it; when omitted the lock is read and
+            written here.
 
     Returns:
         Dict with install result: ``name``, ``version``, ``source``,
@@ -339,12 +350,15 @@ def install_from_source(
     )
 
     pkg_name = virtual_package.name
+    owns_lock = lock is None
 
     with _workspace_lock:
         # -----
         # Step 1: Check if already installed
         # -----
-        if not force and is_package_installed(pkg_name, project_dir):
+        if lock is None:
+            lock = read_lock_file(project_dir)
+        if not force and is_package_installed(pkg_name, lock=lock):
             logger.info(f"Package '{pkg_name}' already installed, skipping")
             return {
                 "status": "already_installed",
@@ -381,7 +395,7 @@ def install_from_source(
             type_dir = virtual_package.type + "s"
             dest = stage_pkg_dir / type_dir / virtual_package.name
             dest.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copytree(source_path, dest)
+            copytree_reflink(source_path, dest)
         elif source_path.is_file():
             # -----
             # Artifact is a single file (prompt or instruction)
@@ -430,14 +444,17 @@ def install_from_source(
         dump_yaml(manifest_data, stage_pkg_dir / "aam.yaml")
 
         # -----
-        # Step 5: Compute per-file SHA-256 checksums
+        # Step 5: Compute per-file SHA-256 checksums (hidden files
+        # included), hashing across a thread pool
         # -----
-        file_checksums: dict[str, str] = {}
-        for file_path in stage_pkg_dir.rglob("*"):
-            if file_path.is_file():
-                rel = str(file_path.relative_to(stage_pkg_dir))
-                sha = hashlib.sha256(file_path.read_bytes()).hexdigest()
-                file_checksums[rel] = sha
+        staged_files = [
+            str(file_path.relative_to(stage_pkg_dir))
+            for file_path in stage_pkg_dir.rglob("*")
+            if file_path.is_file()
+        ]
+        file_checksums = compute_file_checksums(stage_pkg_dir, staged_files)
+
+        originals = compute_file_originals(stage_pkg_dir, list(file_checksums))
 
         # -----
         # Step 6: Move from staging to final location
@@ -462,7 +479,6 @@ def install_from_source(
             (final_dir / "aam.yaml").read_bytes()
         ).hexdigest()
 
-        lock = read_lock_file(project_dir)
         lock.packages[pkg_name] = LockedPackage(
             version="0.0.0",
             source="source",
@@ -472,9 +488,12 @@ def install_from_source(
             file_checksums=FileChecksums(
                 algorithm="sha256",
                 files=file_checksums,
+                originals=originals,
+                stat_fingerprint=compute_stat_fingerprint(final_dir, file_checksums)[0],
             ) if file_checksums else None,
         )
-        write_lock_file(lock, project_dir)
+        if owns_lock:
+            write_lock_file(lock, project_dir)
 
         # -----
         # Cleanup staging
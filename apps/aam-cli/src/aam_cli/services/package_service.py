@@ -12,6 +12,7 @@ Returns structured data for use by both CLI and MCP.
 
 import logging
 import shutil
+from collections import Counter
 from pathlib import Path
 from typing import Any
 
@@ -20,11 +21,12 @@ from aam_cli.core.config import AamConfig
 from aam_cli.core.manifest import load_manifest
 from aam_cli.core.workspace import (
     get_packages_dir,
+    read_installed_manifests,
     read_lock_file,
     write_lock_file,
 )
 from aam_cli.detection.scanner import scan_project
-from aam_cli.utils.naming import parse_package_name, to_filesystem_name
+from aam_cli.utils.naming import package_fs_name
 from aam_cli.utils.yaml_utils import dump_yaml
 
 ################################################################################
@@ -65,30 +67,23 @@ def list_installed_packages(
         logger.info("No packages installed")
         return []
 
-    packages_dir = get_packages_dir(effective_dir)
     results: list[dict[str, Any]] = []
 
+    manifests = read_installed_manifests(lock, effective_dir)
+
     for pkg_name, locked in lock.packages.items():
         # -----
-        # Try to read manifest for artifact counts
+        # Use the (cached) manifest for artifact counts
         # -----
         artifact_counts: dict[str, int] = {}
         artifact_count = 0
-        scope, base_name = parse_package_name(pkg_name)
-        fs_name = to_filesystem_name(scope, base_name)
-        pkg_dir = packages_dir / fs_name
-
-        if pkg_dir.is_dir():
-            try:
-                manifest = load_manifest(pkg_dir)
-                for atype, _ref in manifest.all_artifacts:
-                    key = atype + "s"
-                    artifact_counts[key] = artifact_counts.get(key, 0) + 1
-                artifact_count = manifest.artifact_count
-            except Exception as exc:
-                logger.warning(
-                    f"Could not read manifest for '{pkg_name}': {exc}"
-                )
+        manifest = manifests.get(pkg_name)
+
+        if manifest is not None:
+            artifact_counts = {
+                atype + "s": n for atype, n in manifest.artifact_counts.items()
+            }
+            artifact_count = manifest.artifact_count
 
         results.append(
             {
@@ -149,8 +144,7 @@ def get_package_info(
     # -----
     # Load manifest from installed directory
     # -----
-    scope, base_name = parse_package_name(package_name)
-    fs_name = to_filesystem_name(scope, base_name)
+    fs_name = package_fs_name(package_name)
     pkg_dir = get_packages_dir(effective_dir) / fs_name
 
     try:
@@ -239,18 +233,12 @@ def uninstall_package(
     # -----
     # Check for dependents
     # -----
-    dependents: list[str] = []
-    for other_name, other_locked in lock.packages.items():
-        if other_name == package_name:
-            continue
-        if package_name in other_locked.dependencies:
-            dependents.append(other_name)
+    dependents = lock.dependents_of(package_name)
 
     # -----
     # Undeploy artifacts
     # -----
-    scope, base_name = parse_package_name(package_name)
-    fs_name = to_filesystem_name(scope, base_name)
+    fs_name = package_fs_name(package_name)
     pkg_dir = get_packages_dir(effective_dir) / fs_name
     files_removed = 0
 
@@ -386,10 +374,7 @@ def create_package(
     # -----
     # Step 5: Build result
     # -----
-    type_counts: dict[str, int] = {}
-    for art in selected:
-        key = art.type + "s"
-        type_counts[key] = type_counts.get(key, 0) + 1
+    type_counts = dict(Counter(art.type + "s" for art in selected))
 
     logger.info(
         f"Package created: name='{pkg_name}', "
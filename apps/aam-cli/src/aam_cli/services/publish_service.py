@@ -15,8 +15,10 @@ from typing import Any
 
 from aam_cli.core.config import load_config
 from aam_cli.core.manifest import load_manifest
+from aam_cli.registry.cache import MetadataCache
 from aam_cli.registry.factory import create_registry
 from aam_cli.utils.checksum import calculate_sha256
+from aam_cli.utils.paths import get_resolve_cache_dir
 
 ################################################################################
 #                                                                              #
@@ -113,6 +115,7 @@ def publish_package(
     # -----
     reg = create_registry(reg_source)
     reg.publish(archive_path)
+    MetadataCache(get_resolve_cache_dir()).invalidate(reg_source.name, manifest.name)
 
     archive_size = archive_path.stat().st_size
 
@@ -14,10 +14,12 @@ Contracts reference: specs/005-improve-search-ux/contracts/search-service.md
 ################################################################################
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 from pydantic import BaseModel, Field
 
-from aam_cli.core.config import AamConfig
+from aam_cli.core.config import AamConfig, RegistrySource
+from aam_cli.registry.base import PackageIndexEntry
 from aam_cli.registry.factory import create_registry
 from aam_cli.services.source_service import build_source_index
 
@@ -47,6 +49,10 @@ SCORE_NAME_CONTAINS: int = 60
 SCORE_KEYWORD_MATCH: int = 50
 SCORE_DESCRIPTION_CONTAINS: int = 30
 
+# --- Registry fan-out ---
+# Registries are searched concurrently; each search is mostly index I/O.
+MAX_REGISTRY_SEARCH_WORKERS: int = 8
+
 # --- Validation constants ---
 VALID_ARTIFACT_TYPES: list[str] = ["skill", "agent", "prompt", "instruction"]
 VALID_SORT_OPTIONS: list[str] = ["relevance", "name", "recent"]
@@ -203,6 +209,20 @@ def compute_relevance_score(
 ################################################################################
 
 
+def _search_registry(reg_source: RegistrySource, query: str) -> list[PackageIndexEntry]:
+    """Search one configured registry (run on a worker thread).
+
+    Args:
+        reg_source: Registry to search.
+        query: Search terms.
+
+    Returns:
+        Index entries returned by the registry.
+    """
+    logger.debug(f"Searching registry: name='{reg_source.name}'")
+    return create_registry(reg_source).search(query)
+
+
 def search_packages(
     query: str,
     config: AamConfig,
@@ -318,6 +338,7 @@ def search_packages(
     # index (Step 7) with richer metadata (commit SHA, real source name).
     # ------------------------------------------------------------------
     if not source_filter:
+        searched: list[RegistrySource] = []
         for reg_source in config.registries:
             # -----
             # If a registry_filter is set, skip non-matching registries
@@ -339,10 +360,28 @@ def search_packages(
                 )
                 continue
 
-            try:
-                logger.debug(f"Searching registry: name='{reg_source.name}'")
-                reg = create_registry(reg_source)
-                entries = reg.search(query)
+            searched.append(reg_source)
+
+        # -----
+        # Query registries concurrently; results are consumed in config order
+        # -----
+        workers = min(MAX_REGISTRY_SEARCH_WORKERS, len(searched))
+        with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+            futures = [
+                executor.submit(_search_registry, reg_source, query)
+                for reg_source in searched
+            ]
+
+            for reg_source, future in zip(searched, futures, strict=True):
+                try:
+                    entries = future.result()
+                except (ValueError, OSError, KeyError) as exc:
+                    warning_msg = (
+                        f"Could not search registry '{reg_source.name}': {exc}"
+                    )
+                    warnings.append(warning_msg)
+                    logger.warning(warning_msg, exc_info=True)
+                    continue
 
                 for entry in entries:
                     score = compute_relevance_score(
@@ -374,13 +413,6 @@ def search_packages(
                         )
                     )
 
-            except (ValueError, OSError, KeyError) as exc:
-                warning_msg = (
-                    f"Could not search registry '{reg_source.name}': {exc}"
-                )
-                warnings.append(warning_msg)
-                logger.warning(warning_msg, exc_info=True)
-
     # ------------------------------------------------------------------
     # Step 7: Search sources (skip when registry_filter is set)
     # ------------------------------------------------------------------
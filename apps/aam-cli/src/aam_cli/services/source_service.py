@@ -1199,9 +1199,11 @@ def _publish_virtual_package_to_registry(
 ) -> None:
     """Create an .aam archive from a VirtualPackage and publish it.
 
-    Stages the artifact files in a temp directory, writes an
-    ``aam.yaml`` manifest, creates a ``.aam`` archive, and publishes
-    it to the given local registry.
+    Stages the artifact files in a temp directory inside *registry_dir*
+    (so files are reflinked where the filesystem supports it and the
+    archive is published within one filesystem), writes an ``aam.yaml``
+    manifest, creates a ``.aam`` archive, and publishes it to the given
+    local registry.
 
     Args:
         registry: Target local registry instance.
@@ -1212,9 +1214,11 @@ def _publish_virtual_package_to_registry(
         ValueError: If the artifact cannot be packaged.
         FileNotFoundError: If the source path does not exist.
     """
+    import shutil
     import tempfile
 
     from aam_cli.utils.archive import create_archive
+    from aam_cli.utils.paths import copytree_reflink
     from aam_cli.utils.yaml_utils import dump_yaml
 
     logger.debug(f"Publishing virtual package: name='{vp.name}', type='{vp.type}'")
@@ -1233,7 +1237,7 @@ def _publish_virtual_package_to_registry(
             f"Source path not found in cache: {source_path}"
         )
 
-    with tempfile.TemporaryDirectory() as tmp_str:
+    with tempfile.TemporaryDirectory(prefix=".stage-", dir=registry_dir) as tmp_str:
         tmp_dir = Path(tmp_str)
         pkg_dir = tmp_dir / "package"
         pkg_dir.mkdir()
@@ -1245,13 +1249,11 @@ def _publish_virtual_package_to_registry(
         if source_path.is_dir():
             dest = pkg_dir / type_plural / vp.name
             dest.parent.mkdir(parents=True, exist_ok=True)
-            import shutil
-            shutil.copytree(source_path, dest)
+            copytree_reflink(source_path, dest)
             artifact_path = f"{type_plural}/{vp.name}/"
         else:
             dest = pkg_dir / type_plural
             dest.mkdir(parents=True, exist_ok=True)
-            import shutil
             shutil.copy2(source_path, dest / source_path.name)
             artifact_path = f"{type_plural}/{source_path.name}"
 
@@ -15,10 +15,19 @@ Decision reference: R-002 in research.md.
 #                                                                              #
 ################################################################################
 
+import hashlib
+import io
 import logging
 import os
+import queue
 import tarfile
+import threading
+import time
+from collections.abc import Iterator
 from pathlib import Path
+from typing import BinaryIO
+
+from aam_cli.utils.checksum import CHECKSUM_PREFIX
 
 ################################################################################
 #                                                                              #
@@ -41,6 +50,23 @@ MAX_ARCHIVE_SIZE_BYTES: int = 50 * 1024 * 1024
 # Archive file extension
 ARCHIVE_EXTENSION: str = ".aam"
 
+# Block size used to drain unread archive bytes into a hasher (64 KB)
+_HASH_BLOCK_SIZE: int = 65536
+
+# Stand-in extraction root for member checks when nothing is extracted
+_VIRTUAL_ROOT: str = os.path.join(os.path.abspath(os.sep), "aam-archive", "")
+
+# Read buffer for the compressed archive stream (32 KB). gzip pulls the
+# file in small chunks; a larger buffer batches them into fewer syscalls.
+_READ_BUFFER_SIZE: int = 32768
+
+# Archives at least this large (1 MB) are hashed on a worker thread while
+# the main thread decompresses and writes members; both release the GIL.
+_PIPELINE_MIN_BYTES: int = 1024 * 1024
+
+# Chunks buffered between the reader and the hashing thread
+_PIPELINE_QUEUE_DEPTH: int = 64
+
 ################################################################################
 #                                                                              #
 # FUNCTIONS                                                                    #
@@ -48,7 +74,12 @@ ARCHIVE_EXTENSION: str = ".aam"
 ################################################################################
 
 
-def create_archive(source_dir: Path, output_path: Path) -> Path:
+def create_archive(
+    source_dir: Path,
+    output_path: Path,
+    hasher: "hashlib._Hash | None" = None,
+    overrides: dict[str, bytes] | None = None,
+) -> Path:
     """Create a gzipped tar archive from a package directory.
 
     The archive includes all files under *source_dir* relative to
@@ -57,6 +88,13 @@ def create_archive(source_dir: Path, output_path: Path) -> Path:
     Args:
         source_dir: Directory containing the package (must contain ``aam.yaml``).
         output_path: Target path for the ``.aam`` file.
+        hasher: Optional ``hashlib`` object updated with the compressed
+            bytes as they are written, so callers get the archive
+            checksum without reading the file back.
+        overrides: Optional archive-name to content mapping. Each entry
+            is stored in place of the file of that name under
+            *source_dir* (or added if there is none), leaving the file on
+            disk untouched.
 
     Returns:
         The path to the created archive.
@@ -140,9 +178,17 @@ def create_archive(source_dir: Path, output_path: Path) -> Path:
     # -----
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with tarfile.open(output_path, "w:gz") as tar:
-        for full_path, arcname in files_to_add:
-            tar.add(full_path, arcname=arcname)
+    with output_path.open("wb") as fh:
+        sink = _HashingWriter(fh, hasher) if hasher is not None else fh
+        with tarfile.open(str(output_path), "w:gz", fileobj=sink) as tar:  # type: ignore[call-overload]
+            pending = dict(overrides or {})
+            for full_path, arcname in files_to_add:
+                if arcname in pending:
+                    _add_bytes(tar, arcname, pending.pop(arcname))
+                else:
+                    tar.add(full_path, arcname=arcname)
+            for arcname, data in pending.items():
+                _add_bytes(tar, arcname, data)
 
     # -----
     # Step 4: Enforce 50 MB size limit (FR-012)
@@ -166,16 +212,142 @@ def create_archive(source_dir: Path, output_path: Path) -> Path:
     return output_path
 
 
-def extract_archive(archive_path: Path, dest_dir: Path) -> Path:
+def _add_bytes(tar: tarfile.TarFile, arcname: str, data: bytes) -> None:
+    """Add an in-memory regular file to *tar*."""
+    info = tarfile.TarInfo(arcname)
+    info.size = len(data)
+    info.mode = 0o644
+    info.mtime = int(time.time())
+    tar.addfile(info, io.BytesIO(data))
+
+
+def create_archive_with_digest(
+    source_dir: Path,
+    output_path: Path,
+    overrides: dict[str, bytes] | None = None,
+) -> str:
+    """Create a ``.aam`` archive and return its SHA-256 checksum.
+
+    The digest is taken from the compressed bytes as they are written.
+
+    Args:
+        source_dir: Directory containing the package (must contain ``aam.yaml``).
+        output_path: Target path for the ``.aam`` file.
+        overrides: Archive-name to content mapping, as for
+            :func:`create_archive`.
+
+    Returns:
+        The archive checksum in ``sha256:<hex>`` format, matching
+        :func:`~aam_cli.utils.checksum.calculate_sha256`.
+
+    Raises:
+        FileNotFoundError: If *source_dir* does not exist or has no ``aam.yaml``.
+        ValueError: If the archive exceeds the 50 MB limit or contains
+            unsafe entries.
+    """
+    hasher = hashlib.sha256()
+    create_archive(source_dir, output_path, hasher=hasher, overrides=overrides)
+    return f"{CHECKSUM_PREFIX}{hasher.hexdigest()}"
+
+
+class _HashingWriter:
+    """Write-only file wrapper that feeds every written byte to a hasher."""
+
+    def __init__(self, fh: BinaryIO, hasher: "hashlib._Hash") -> None:
+        self._fh = fh
+        self._hasher = hasher
+
+    def write(self, data: bytes) -> int:
+        self._hasher.update(data)
+        return self._fh.write(data)
+
+    def flush(self) -> None:
+        self._fh.flush()
+
+
+class _HashingReader:
+    """Read-only file wrapper that feeds each archive byte to a hasher once.
+
+    The wrapper tracks a high-water mark and only hashes bytes beyond it,
+    so the result equals hashing the file front to back even if the
+    reader seeks backwards.
+    """
+
+    def __init__(self, fh: BinaryIO, hasher: "hashlib._Hash") -> None:
+        self._fh = fh
+        self._hasher = hasher
+        self._hashed = 0
+
+    def read(self, size: int = -1) -> bytes:
+        pos = self._fh.tell()
+        data = self._fh.read(size)
+        end = pos + len(data)
+        if end > self._hashed:
+            self._hasher.update(data[max(0, self._hashed - pos) :])
+            self._hashed = end
+        return data
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        return self._fh.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._fh.tell()
+
+    def finish(self) -> None:
+        """Hash any trailing bytes ``tarfile`` never needed to read."""
+        self._fh.seek(self._hashed)
+        while self.read(_HASH_BLOCK_SIZE):
+            pass
+
+
+class _PipelinedHasher:
+    """Hasher front end that runs ``update`` on a worker thread.
+
+    Chunks pass through a bounded queue, so hashing overlaps with
+    decompression and file writes and the reader is throttled if the
+    worker falls behind. Call :meth:`close` before reading the digest.
+    """
+
+    def __init__(self, hasher: "hashlib._Hash") -> None:
+        self._hasher = hasher
+        self._queue: queue.Queue[bytes | None] = queue.Queue(_PIPELINE_QUEUE_DEPTH)
+        self._thread = threading.Thread(target=self._run, name="aam-archive-hash", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while (chunk := self._queue.get()) is not None:
+            self._hasher.update(chunk)
+
+    def update(self, data: bytes) -> None:
+        self._queue.put(data)
+
+    def close(self) -> None:
+        """Wait until every queued chunk has been hashed."""
+        self._queue.put(None)
+        self._thread.join()
+
+
+def extract_archive(
+    archive_path: Path,
+    dest_dir: Path,
+    hasher: "hashlib._Hash | None" = None,
+) -> Path:
     """Extract a ``.aam`` archive to a destination directory.
 
-    Validates archive entries for security before extraction:
+    Validates each archive entry for security before it is extracted:
       - No absolute paths
       - No path traversal (``..``)
 
+    On error *dest_dir* may hold a partial extraction; extract into a
+    scratch directory and discard it on failure.
+
     Args:
         archive_path: Path to the ``.aam`` archive file.
         dest_dir: Directory to extract into (created if missing).
+        hasher: Optional ``hashlib`` object updated with the raw archive
+            bytes as they are read, so callers get the archive checksum
+            without a second pass over the file. Archives of
+            ``_PIPELINE_MIN_BYTES`` or more are hashed on a worker thread.
 
     Returns:
         Path to the extraction directory.
@@ -193,29 +365,162 @@ def extract_archive(archive_path: Path, dest_dir: Path) -> Path:
     dest_dir.mkdir(parents=True, exist_ok=True)
     resolved_dest = dest_dir.resolve()
 
-    with tarfile.open(archive_path, "r:gz") as tar:
-        # -----
-        # Security: validate all members before extracting
-        # -----
-        for member in tar.getmembers():
-            member_path = (dest_dir / member.name).resolve()
+    with archive_path.open("rb", buffering=_READ_BUFFER_SIZE) as raw:
+        if hasher is None:
+            _extract_validated(raw, dest_dir, resolved_dest)
+        elif os.fstat(raw.fileno()).st_size < _PIPELINE_MIN_BYTES:
+            reader = _HashingReader(raw, hasher)
+            _extract_validated(reader, dest_dir, resolved_dest)
+            reader.finish()
+        else:
+            pipeline = _PipelinedHasher(hasher)
+            try:
+                reader = _HashingReader(raw, pipeline)  # type: ignore[arg-type]
+                _extract_validated(reader, dest_dir, resolved_dest)
+                reader.finish()
+            finally:
+                pipeline.close()
 
-            # Reject path traversal
-            if ".." in member.name.split("/"):
-                raise ValueError(f"Path traversal detected in archive: {member.name}")
+    logger.info(f"Archive extracted successfully: dest='{dest_dir}'")
+    return dest_dir
 
-            # Reject absolute paths
-            if member.name.startswith("/"):
-                raise ValueError(f"Absolute path in archive: {member.name}")
 
-            # Ensure extraction stays within dest_dir
-            if not str(member_path).startswith(str(resolved_dest)):
-                raise ValueError(f"Archive entry escapes destination: {member.name}")
+def extract_archive_with_digest(archive_path: Path, dest_dir: Path) -> str:
+    """Extract a ``.aam`` archive and return its SHA-256 checksum.
 
-        # -----
-        # Extract all members (safe after validation)
-        # -----
-        tar.extractall(path=dest_dir, filter="data")
+    The archive is read once; the digest comes from the same bytes that
+    feed extraction.
 
-    logger.info(f"Archive extracted successfully: dest='{dest_dir}'")
-    return dest_dir
+    Args:
+        archive_path: Path to the ``.aam`` archive file.
+        dest_dir: Directory to extract into (created if missing).
+
+    Returns:
+        The archive checksum in ``sha256:<hex>`` format, matching
+        :func:`~aam_cli.utils.checksum.calculate_sha256`.
+
+    Raises:
+        FileNotFoundError: If the archive does not exist.
+        ValueError: If the archive contains unsafe entries.
+        tarfile.TarError: If the archive is corrupted or not a valid tar.gz.
+    """
+    hasher = hashlib.sha256()
+    extract_archive(archive_path, dest_dir, hasher=hasher)
+    return f"{CHECKSUM_PREFIX}{hasher.hexdigest()}"
+
+
+def read_archive_member_with_digest(archive_path: Path, member_name: str) -> tuple[bytes, str]:
+    """Read one file out of a ``.aam`` archive and checksum the archive.
+
+    Walks the whole archive once, applying the same member checks as
+    :func:`extract_archive`, but writes nothing to disk: only the
+    requested member's bytes are kept.
+
+    Args:
+        archive_path: Path to the ``.aam`` archive file.
+        member_name: Archive path of the file to read, e.g. ``"aam.yaml"``.
+
+    Returns:
+        The member's content and the archive checksum in ``sha256:<hex>``
+        format.
+
+    Raises:
+        FileNotFoundError: If the archive or the member does not exist.
+        ValueError: If the archive contains unsafe entries.
+        tarfile.TarError: If the archive is corrupted or not a valid tar.gz.
+    """
+    logger.info(f"Reading '{member_name}' from archive: archive='{archive_path}'")
+
+    if not archive_path.is_file():
+        raise FileNotFoundError(f"Archive not found: {archive_path}")
+
+    hasher = hashlib.sha256()
+    content: bytes | None = None
+
+    with archive_path.open("rb", buffering=_READ_BUFFER_SIZE) as raw:
+        reader = _HashingReader(raw, hasher)
+        with tarfile.open(fileobj=reader, mode="r:gz") as tar:  # type: ignore[call-overload]
+            for member in _validated_members(tar, _VIRTUAL_ROOT):
+                if (
+                    content is None
+                    and member.isfile()
+                    and os.path.normpath(member.name) == member_name
+                ):
+                    member_file = tar.extractfile(member)
+                    if member_file is None:
+                        raise tarfile.ReadError(
+                            f"Cannot read '{member.name}' from archive {archive_path}"
+                        )
+                    content = member_file.read()
+        reader.finish()
+
+    if content is None:
+        raise FileNotFoundError(f"No {member_name} found in archive {archive_path}")
+
+    return content, f"{CHECKSUM_PREFIX}{hasher.hexdigest()}"
+
+
+def _extract_validated(fileobj: object, dest_dir: Path, resolved_dest: Path) -> None:
+    """Validate and extract a gzipped tar archive in one forward pass.
+
+    Each member is validated as its header is read and extracted right
+    after. Reading the whole member index first and then extracting would
+    rewind the gzip stream, which means decompressing the archive twice.
+
+    Validation runs on each member before it is written, so an unsafe
+    entry can leave earlier members in *dest_dir*; every caller extracts
+    into a scratch directory that is discarded on error.
+
+    Args:
+        fileobj: Binary file object positioned at the archive start.
+        dest_dir: Directory to extract into.
+        resolved_dest: Resolved form of *dest_dir* for containment checks.
+
+    Raises:
+        ValueError: If the archive contains unsafe entries.
+    """
+    with tarfile.open(fileobj=fileobj, mode="r:gz") as tar:  # type: ignore[call-overload]
+        dest_prefix = os.path.join(str(resolved_dest), "")
+        tar.extractall(
+            path=dest_dir,
+            members=_validated_members(tar, dest_prefix),
+            filter="data",
+        )
+
+
+def _validated_members(
+    tar: tarfile.TarFile, dest_prefix: str
+) -> Iterator[tarfile.TarInfo]:
+    """Yield the members of *tar*, rejecting unsafe entries.
+
+    Containment is checked on normalized strings: resolving every member
+    path would lstat each component of each entry. Links inside the
+    archive are policed at extraction time by the "data" filter.
+
+    Args:
+        tar: Open archive; members are loaded as they are iterated.
+        dest_prefix: Resolved destination directory with a trailing
+            separator.
+
+    Yields:
+        Each member once it has passed the checks.
+
+    Raises:
+        ValueError: If a member is unsafe.
+    """
+    for member in tar:
+        member_path = os.path.normpath(os.path.join(dest_prefix, member.name))
+
+        # Reject path traversal
+        if ".." in member.name.split("/"):
+            raise ValueError(f"Path traversal detected in archive: {member.name}")
+
+        # Reject absolute paths
+        if member.name.startswith("/"):
+            raise ValueError(f"Absolute path in archive: {member.name}")
+
+        # Ensure extraction stays within dest_dir
+        if not os.path.join(member_path, "").startswith(dest_prefix):
+            raise ValueError(f"Archive entry escapes destination: {member.name}")
+
+        yield member
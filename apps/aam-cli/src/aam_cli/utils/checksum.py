@@ -15,6 +15,7 @@ Decision reference: R-002 in research.md.
 
 import hashlib
 import logging
+import threading
 from pathlib import Path
 
 ################################################################################
@@ -32,12 +33,15 @@ logger = logging.getLogger(__name__)
 #                                                                              #
 ################################################################################
 
-# Buffer size for streaming hash computation (64 KB)
-_HASH_BUFFER_SIZE: int = 65536
-
 # Prefix used in checksum strings
 CHECKSUM_PREFIX: str = "sha256:"
 
+# Size of the per-thread read buffer used for hashing (256 KB)
+_HASH_BUFFER_SIZE: int = 1 << 18
+
+# Per-thread hash buffer, allocated on first use and reused afterwards
+_buffers = threading.local()
+
 ################################################################################
 #                                                                              #
 # FUNCTIONS                                                                    #
@@ -48,8 +52,10 @@ CHECKSUM_PREFIX: str = "sha256:"
 def calculate_sha256(file_path: Path) -> str:
     """Calculate the SHA-256 hash of a file.
 
-    Reads the file in chunks to support large archives without loading
-    the entire file into memory.
+    Reads the file with ``readinto`` into a buffer that is allocated once
+    per thread and reused, so hashing many small package files does not
+    allocate and zero a fresh buffer per file. Large archives are still
+    streamed rather than loaded into memory.
 
     Args:
         file_path: Path to the file to hash.
@@ -64,20 +70,34 @@ def calculate_sha256(file_path: Path) -> str:
     """
     logger.debug(f"Calculating SHA-256 checksum: path='{file_path}'")
 
+    buf, view = _hash_buffer()
     sha256 = hashlib.sha256()
 
-    with file_path.open("rb") as fh:
-        while True:
-            chunk = fh.read(_HASH_BUFFER_SIZE)
-            if not chunk:
-                break
-            sha256.update(chunk)
+    # Unbuffered: readinto fills our buffer directly, with no extra copy
+    with file_path.open("rb", buffering=0) as fh:
+        while size := fh.readinto(buf):
+            sha256.update(view[:size])
 
     digest = f"{CHECKSUM_PREFIX}{sha256.hexdigest()}"
     logger.debug(f"SHA-256 computed: path='{file_path}', checksum='{digest[:30]}...'")
     return digest
 
 
+def _hash_buffer() -> tuple[bytearray, memoryview]:
+    """Return this thread's reusable hash buffer and a view over it.
+
+    Returns:
+        The buffer and a :class:`memoryview` of it, created on the
+        thread's first call.
+    """
+    try:
+        return _buffers.buf, _buffers.view
+    except AttributeError:
+        _buffers.buf = bytearray(_HASH_BUFFER_SIZE)
+        _buffers.view = memoryview(_buffers.buf)
+        return _buffers.buf, _buffers.view
+
+
 def verify_sha256(file_path: Path, expected: str) -> bool:
     """Verify a file's SHA-256 checksum against an expected value.
 
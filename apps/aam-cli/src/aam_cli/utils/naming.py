@@ -19,6 +19,7 @@ Scope format: ``@scope/name`` where
 
 import logging
 import re
+from functools import lru_cache
 
 ################################################################################
 #                                                                              #
@@ -47,7 +48,8 @@ NAME_REGEX: str = r"^[a-z0-9][a-z0-9-]{0,63}$"
 # Full name: optional @scope/ prefix followed by the name
 FULL_NAME_REGEX: str = r"^(@[a-z0-9][a-z0-9_-]{0,63}/)?[a-z0-9][a-z0-9-]{0,63}$"
 
-# Pre-compiled patterns for performance
+# Pre-compiled patterns for performance.  Always use ``fullmatch``: a
+# ``$`` anchor with ``match`` also accepts a trailing newline.
 _SCOPE_PATTERN: re.Pattern[str] = re.compile(SCOPE_REGEX)
 _NAME_PATTERN: re.Pattern[str] = re.compile(NAME_REGEX)
 _FULL_NAME_PATTERN: re.Pattern[str] = re.compile(FULL_NAME_REGEX)
@@ -89,7 +91,7 @@ def suggest_package_name(invalid_name: str) -> str | None:
             return None
         scope = invalid_name[1:slash]
         name_part = invalid_name[slash + 1 :]
-        if "_" in name_part and _SCOPE_PATTERN.match(scope):
+        if "_" in name_part and _SCOPE_PATTERN.fullmatch(scope):
             suggested = f"@{scope}/{name_part.replace('_', '-')}"
             if validate_package_name(suggested):
                 return suggested
@@ -125,9 +127,13 @@ def format_invalid_package_name_message(invalid_name: str) -> str:
 ################################################################################
 
 
+@lru_cache(maxsize=2048)
 def parse_package_name(full_name: str) -> tuple[str, str]:
     """Parse a full package name into ``(scope, name)`` components.
 
+    Results are memoized: one install parses the same few names from the
+    resolver, installer, caches and lock file many times over.
+
     Args:
         full_name: The full package name, e.g. ``"@author/my-pkg"`` or
             ``"my-pkg"``.
@@ -159,13 +165,13 @@ def parse_package_name(full_name: str) -> tuple[str, str]:
         # Validate scope
         if not scope:
             raise ValueError("Scope must not be empty in scoped package name")
-        if not _SCOPE_PATTERN.match(scope):
+        if not _SCOPE_PATTERN.fullmatch(scope):
             raise ValueError(f"Invalid scope '{scope}': must match {SCOPE_REGEX}")
 
         # Validate name
         if not name:
             raise ValueError("Name must not be empty in scoped package name")
-        if not _NAME_PATTERN.match(name):
+        if not _NAME_PATTERN.fullmatch(name):
             raise ValueError(f"Invalid name '{name}': must match {NAME_REGEX}")
 
         logger.debug(f"Parsed scoped package: scope='{scope}', name='{name}'")
@@ -174,7 +180,7 @@ def parse_package_name(full_name: str) -> tuple[str, str]:
     # -----
     # Step 2: Unscoped name — validate directly
     # -----
-    if not _NAME_PATTERN.match(full_name):
+    if not _NAME_PATTERN.fullmatch(full_name):
         raise ValueError(f"Invalid package name '{full_name}': must match {NAME_REGEX}")
 
     logger.debug(f"Parsed unscoped package: name='{full_name}'")
@@ -190,7 +196,7 @@ def validate_package_name(full_name: str) -> bool:
     Returns:
         ``True`` if the name is valid, ``False`` otherwise.
     """
-    return bool(_FULL_NAME_PATTERN.match(full_name))
+    return bool(_FULL_NAME_PATTERN.fullmatch(full_name))
 
 
 def format_package_name(scope: str, name: str) -> str:
@@ -226,6 +232,27 @@ def to_filesystem_name(scope: str, name: str) -> str:
     return name
 
 
+@lru_cache(maxsize=2048)
+def package_fs_name(full_name: str) -> str:
+    """Return the filesystem name for a full package name.
+
+    Combines :func:`parse_package_name` and :func:`to_filesystem_name`.
+    Memoized because the mapping never changes and commands such as
+    ``aam list`` look it up for every installed package.
+
+    Args:
+        full_name: Package name, scoped (``@scope/name``) or unscoped.
+
+    Returns:
+        A filesystem-safe name string (``scope--name`` or ``name``).
+
+    Raises:
+        ValueError: If the name format is invalid.
+    """
+    return to_filesystem_name(*parse_package_name(full_name))
+
+
+@lru_cache(maxsize=2048)
 def parse_package_spec(spec: str) -> tuple[str, str | None]:
     """Parse a CLI package spec into ``(full_name, version)``.
 
@@ -252,51 +279,28 @@ def parse_package_spec(spec: str) -> tuple[str, str | None]:
         raise ValueError("Package spec must not be empty")
 
     # -----
-    # Step 1: No '@' at all — unscoped, no version
+    # Step 1: The version follows the last '@' — unless that '@' is the
+    # scope marker at index 0 (or there is none), in which case there is
+    # no version
     # -----
-    if "@" not in spec:
-        # Validate the name
-        parse_package_name(spec)
-        return spec, None
+    at_idx = spec.rfind("@")
+    if at_idx <= 0:
+        full_name, version = spec, None
+    else:
+        full_name, version = spec[:at_idx], spec[at_idx + 1 :]
+        if not version:
+            raise ValueError(f"Empty version in package spec '{spec}'")
 
     # -----
-    # Step 2: Scoped package — starts with '@'
+    # Step 2: A scoped name needs its '/' separator
     # -----
-    if spec.startswith("@"):
-        # Find the '/' that separates scope from name
-        slash_idx = spec.find("/")
-        if slash_idx == -1:
-            raise ValueError(f"Scoped package spec '{spec}' missing '/' separator")
-
-        # Everything after the slash may contain a version after the last '@'
-        remainder = spec[slash_idx + 1 :]
-
-        # Check if there's a version after the name
-        if "@" in remainder:
-            # Split on the last '@' to separate name from version
-            name_part, version = remainder.rsplit("@", 1)
-            if not version:
-                raise ValueError(f"Empty version in package spec '{spec}'")
-            full_name = spec[: slash_idx + 1] + name_part
-        else:
-            full_name = spec
-            version = None
-
-        # Validate the full name
-        parse_package_name(full_name)
-
-        logger.debug(f"Parsed scoped spec: full_name='{full_name}', version='{version}'")
-        return full_name, version
+    if full_name.startswith("@") and "/" not in full_name:
+        raise ValueError(f"Scoped package spec '{spec}' missing '/' separator")
 
     # -----
-    # Step 3: Unscoped with version — contains '@' but doesn't start with '@'
+    # Step 3: Validate the name
     # -----
-    name_part, version = spec.rsplit("@", 1)
-    if not version:
-        raise ValueError(f"Empty version in package spec '{spec}'")
-
-    # Validate the name
-    parse_package_name(name_part)
+    parse_package_name(full_name)
 
-    logger.debug(f"Parsed unscoped spec: full_name='{name_part}', version='{version}'")
-    return name_part, version
+    logger.debug(f"Parsed package spec: full_name='{full_name}', version='{version}'")
+    return full_name, version
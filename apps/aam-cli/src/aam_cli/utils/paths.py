@@ -1,7 +1,8 @@
 """Path resolution helpers for AAM CLI.
 
 Provides consistent resolution of global (``~/.aam/``), project (``.aam/``),
-and platform-specific directories, plus ``file://`` URL parsing.
+and platform-specific directories, plus ``file://`` URL parsing and a
+tree copy that uses copy-on-write clones where the filesystem allows.
 """
 
 ################################################################################
@@ -10,10 +11,21 @@ and platform-specific directories, plus ``file://`` URL parsing.
 #                                                                              #
 ################################################################################
 
+import errno
 import logging
+import os
+import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import urlparse
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None  # type: ignore[assignment]
+
 ################################################################################
 #                                                                              #
 # LOGGING                                                                      #
@@ -44,9 +56,33 @@ LOCK_FILE_NAME: str = "aam-lock.yaml"
 # Packages directory within workspace
 PACKAGES_DIR_NAME: str = "packages"
 
+# Resolver metadata cache within workspace (``.aam/cache/resolve/``)
+RESOLVE_CACHE_DIR_NAME: str = "cache/resolve"
+
+# Parsed lock file cache within workspace (``.aam/cache/lock.json``)
+LOCK_CACHE_FILE_NAME: str = "cache/lock.json"
+
+# Parsed installed-manifest cache within workspace (``.aam/cache/manifests.json``)
+MANIFEST_CACHE_FILE_NAME: str = "cache/manifests.json"
+
 # Sources registry directory name (auto-created by `aam source update`)
 SOURCES_REGISTRY_DIR_NAME: str = "sources-registry"
 
+# Linux ``FICLONE`` ioctl request (``_IOW(0x94, 9, int)``)
+FICLONE: int = 0x40049409
+
+# Errors meaning "this filesystem/pair cannot be cloned", not real failures
+_CLONE_UNSUPPORTED_ERRNOS: frozenset[int] = frozenset(
+    {errno.EOPNOTSUPP, errno.ENOTSUP, errno.EXDEV, errno.EINVAL, errno.ENOTTY}
+)
+
+# Worker threads for copying package files. The clone ioctl and
+# sendfile release the GIL, so small-file copies overlap across cores.
+MAX_COPY_WORKERS: int = min(16, os.cpu_count() or 1)
+
+# Below this many files, copy serially; pool startup would dominate
+PARALLEL_COPY_MIN_FILES: int = 32
+
 ################################################################################
 #                                                                              #
 # FUNCTIONS                                                                    #
@@ -104,6 +140,18 @@ def get_global_config_path() -> Path:
     return get_global_aam_dir() / GLOBAL_CONFIG_FILE
 
 
+@lru_cache(maxsize=8)
+def _resolve_root(root: Path) -> Path:
+    """Resolve an absolute project root once per distinct path.
+
+    Workspace, lock file and packages lookups all resolve the same root
+    repeatedly within a command; caching keeps that to one
+    ``resolve()``.  Callers must pass an absolute path so a later change
+    of working directory can never hit a stale entry.
+    """
+    return root.resolve()
+
+
 def get_project_workspace(project_dir: Path | None = None) -> Path:
     """Return the project-level workspace directory (``.aam/``).
 
@@ -113,7 +161,10 @@ def get_project_workspace(project_dir: Path | None = None) -> Path:
     Returns:
         Absolute path to the project workspace directory.
     """
-    root = (project_dir or Path.cwd()).resolve()
+    root = project_dir or Path.cwd()
+    if not root.is_absolute():
+        root = Path.cwd() / root
+    root = _resolve_root(root)
     workspace = root / PROJECT_WORKSPACE_DIR_NAME
     logger.debug(f"Project workspace: path='{workspace}'")
     return workspace
@@ -155,6 +206,42 @@ def get_packages_dir(project_dir: Path | None = None) -> Path:
     return get_project_workspace(project_dir) / PACKAGES_DIR_NAME
 
 
+def get_lock_cache_path(project_dir: Path | None = None) -> Path:
+    """Return the parsed lock file cache path (``.aam/cache/lock.json``).
+
+    Args:
+        project_dir: Project root directory.
+
+    Returns:
+        Absolute path to the lock cache file (may not exist yet).
+    """
+    return get_project_workspace(project_dir) / LOCK_CACHE_FILE_NAME
+
+
+def get_manifest_cache_path(project_dir: Path | None = None) -> Path:
+    """Return the installed manifest cache path (``.aam/cache/manifests.json``).
+
+    Args:
+        project_dir: Project root directory.
+
+    Returns:
+        Absolute path to the manifest cache file (may not exist yet).
+    """
+    return get_project_workspace(project_dir) / MANIFEST_CACHE_FILE_NAME
+
+
+def get_resolve_cache_dir(project_dir: Path | None = None) -> Path:
+    """Return the resolver metadata cache directory (``.aam/cache/resolve/``).
+
+    Args:
+        project_dir: Project root directory.
+
+    Returns:
+        Absolute path to the cache directory (may not exist yet).
+    """
+    return get_project_workspace(project_dir) / RESOLVE_CACHE_DIR_NAME
+
+
 def ensure_project_workspace(project_dir: Path | None = None) -> Path:
     """Create the project workspace directory if it does not exist.
 
@@ -221,3 +308,103 @@ def to_file_url(path: Path) -> str:
     """
     resolved = path.resolve()
     return f"file://{resolved}"
+
+
+def _clone_or_copy(src: str, dst: str) -> str:
+    """Copy one file, sharing extents via ``FICLONE`` when possible.
+
+    On copy-on-write filesystems (btrfs, XFS with reflink) the clone moves
+    no file data. Anywhere else, or when the clone is refused, this falls
+    back to :func:`shutil.copy2`.
+
+    Args:
+        src: Source file path.
+        dst: Destination file path.
+
+    Returns:
+        The destination path, as ``copy_function`` callbacks must.
+    """
+    if fcntl is not None and sys.platform.startswith("linux"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+        except OSError as exc:
+            if exc.errno not in _CLONE_UNSUPPORTED_ERRNOS:
+                raise
+        else:
+            shutil.copystat(src, dst)
+            return dst
+
+    return shutil.copy2(src, dst)
+
+
+def copytree_reflink(src: Path, dst: Path) -> Path:
+    """Copy a directory tree, cloning file contents where supported.
+
+    Behaves like :func:`shutil.copytree` (``dst`` must not exist) but
+    copies each file with a reflink first, so installing a package from a
+    directory on a CoW filesystem costs metadata only. The directories
+    are laid out first; the files are then copied across a thread pool
+    when there are enough of them, and directory metadata is applied
+    last so a read-only source directory cannot block its own contents.
+
+    Args:
+        src: Source directory.
+        dst: Destination directory.
+
+    Returns:
+        The destination directory.
+
+    Raises:
+        FileExistsError: If *dst* already exists.
+    """
+    logger.debug(f"Copying tree (reflink when possible): src='{src}', dst='{dst}'")
+
+    # -----
+    # Create every directory and collect the file copies to run
+    # -----
+    dirs: list[tuple[str, str]] = []
+    files: list[tuple[str, str]] = []
+    for root, _, filenames in os.walk(src, followlinks=True):
+        target = os.path.normpath(os.path.join(dst, os.path.relpath(root, src)))
+        os.makedirs(target)
+        dirs.append((root, target))
+        files.extend((os.path.join(root, n), os.path.join(target, n)) for n in filenames)
+
+    # -----
+    # Copy the files, in parallel for larger trees
+    # -----
+    workers = min(MAX_COPY_WORKERS, len(files))
+    if workers < 2 or len(files) < PARALLEL_COPY_MIN_FILES:
+        results = [_copy_file_or_error(pair) for pair in files]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_copy_file_or_error, files))
+
+    for dir_src, dir_dst in reversed(dirs):
+        shutil.copystat(dir_src, dir_dst)
+
+    # Report failures together, as shutil.copytree does
+    errors = [error for error in results if error is not None]
+    if errors:
+        raise shutil.Error(errors)
+
+    return dst
+
+
+def _copy_file_or_error(pair: tuple[str, str]) -> tuple[str, str, str] | None:
+    """Copy one file for :func:`copytree_reflink`, capturing any failure.
+
+    Args:
+        pair: Source and destination file paths.
+
+    Returns:
+        ``None`` on success, else ``(src, dst, message)`` in the form
+        :class:`shutil.Error` collects.
+    """
+    file_src, file_dst = pair
+    try:
+        _clone_or_copy(file_src, file_dst)
+    except OSError as exc:
+        return (file_src, file_dst, str(exc))
+    return None
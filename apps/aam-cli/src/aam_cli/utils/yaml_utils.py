@@ -1,8 +1,9 @@
 """Safe YAML loading and dumping utilities.
 
-Wraps PyYAML's ``safe_load`` / ``safe_dump`` with consistent error handling
-and file I/O.  All AAM modules that read or write YAML must go through these
-helpers — never call ``yaml.load()`` directly.
+Wraps PyYAML's safe loader (libyaml's ``CSafeLoader`` when available) and
+``safe_dump`` with consistent error handling and file I/O.  All AAM modules
+that read or write YAML must go through these helpers — never call
+``yaml.load()`` directly outside this module.
 
 Decision reference: R-001 in research.md.
 """
@@ -13,12 +14,24 @@ Decision reference: R-001 in research.md.
 #                                                                              #
 ################################################################################
 
+import contextlib
 import logging
+import os
+import re
+import stat
+import threading
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+# libyaml's C loader is several times faster and equally safe; fall back to
+# the pure-Python loader when PyYAML was built without libyaml.
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 ################################################################################
 #                                                                              #
 # LOGGING                                                                      #
@@ -28,6 +41,22 @@ import yaml
 # Initialize logger for this module
 logger = logging.getLogger(__name__)
 
+################################################################################
+#                                                                              #
+# CONSTANTS                                                                    #
+#                                                                              #
+################################################################################
+
+# Start of a line that begins a new top-level mapping entry
+_TOP_LEVEL_LINE: re.Pattern[str] = re.compile(r"^[^\s#\-.]", re.MULTILINE)
+
+# Human-readable output options shared by the dump helpers
+_DUMP_OPTIONS: dict[str, Any] = {
+    "default_flow_style": False,
+    "allow_unicode": True,
+    "sort_keys": False,
+}
+
 ################################################################################
 #                                                                              #
 # FUNCTIONS                                                                    #
@@ -38,7 +67,8 @@ logger = logging.getLogger(__name__)
 def load_yaml(path: Path) -> dict[str, Any]:
     """Load a YAML file and return its contents as a dictionary.
 
-    Uses ``yaml.safe_load`` exclusively to prevent arbitrary code execution.
+    Uses PyYAML's safe loader exclusively to prevent arbitrary code
+    execution (the libyaml-backed ``CSafeLoader`` when available).
 
     Args:
         path: Absolute or relative path to the YAML file.
@@ -62,17 +92,34 @@ def load_yaml(path: Path) -> dict[str, Any]:
         logger.error(f"YAML file not found: path='{path}'")
         raise
 
+    return parse_yaml_text(text, path)
+
+
+def parse_yaml_text(text: str, path: Path) -> dict[str, Any]:
+    """Parse YAML text read from *path* into a dictionary.
+
+    Args:
+        text: File content.
+        path: Source path, used only in log messages.
+
+    Returns:
+        Parsed mapping; ``{}`` for empty documents and ``{"_root": ...}``
+        for non-mapping documents.
+
+    Raises:
+        yaml.YAMLError: If the text is not valid YAML.
+    """
     # -----
     # Step 2: Parse YAML safely
     # -----
     try:
-        data = yaml.safe_load(text)
+        data = yaml.load(text, Loader=_SafeLoader)
     except yaml.YAMLError as exc:
         logger.error(f"Invalid YAML in '{path}': {exc}")
         raise
 
     # -----
-    # Step 3: Handle empty files (safe_load returns None)
+    # Step 3: Handle empty files (the loader returns None)
     # -----
     if data is None:
         logger.debug(f"YAML file is empty or null: path='{path}'")
@@ -88,44 +135,118 @@ def load_yaml(path: Path) -> dict[str, Any]:
     return data
 
 
-def dump_yaml(data: dict[str, Any], path: Path) -> None:
+def dump_yaml(data: dict[str, Any], path: Path, *, atomic: bool = False) -> None:
     """Dump a dictionary to a YAML file.
 
     Uses ``yaml.safe_dump`` with sensible defaults for human-readable output.
+    The document is streamed into a sibling temporary file that is
+    ``os.replace``-d over *path*, so no full-size string is built and a
+    serialization error or an interrupted write only discards the
+    temporary file. The replaced file keeps its permission bits, and a
+    symlinked *path* is written through to its target.
 
     Args:
         data: Dictionary to serialize.
         path: Target file path (parent directories must exist).
+        atomic: Also ``fsync`` the new content before it replaces *path*,
+            so it survives a crash as well as a failed write.
 
     Raises:
+        yaml.YAMLError: If *data* cannot be represented; *path* is untouched.
         OSError: If the file cannot be written.
     """
-    logger.debug(f"Dumping YAML to file: path='{path}'")
+    logger.debug(f"Dumping YAML to file: path='{path}', atomic={atomic}")
 
     # -----
     # Ensure parent directory exists
     # -----
     path.parent.mkdir(parents=True, exist_ok=True)
 
+    target = path.resolve() if path.is_symlink() else path
+    tmp_path = target.with_name(f".{target.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+
+    try:
+        with tmp_path.open("w", encoding="utf-8") as f:
+            yaml.safe_dump(data, f, **_DUMP_OPTIONS)
+            if atomic:
+                f.flush()
+                os.fsync(f.fileno())
+
+        # -----
+        # Keep the permissions of the file being replaced
+        # -----
+        with contextlib.suppress(FileNotFoundError):
+            os.chmod(tmp_path, stat.S_IMODE(target.stat().st_mode))
+
+        os.replace(tmp_path, target)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    logger.debug(f"YAML dumped successfully: path='{path}'")
+
+
+def dump_yaml_text(data: dict[str, Any]) -> str:
+    """Serialize a dictionary to YAML text, formatted like :func:`dump_yaml`.
+
+    Args:
+        data: Dictionary to serialize.
+
+    Returns:
+        The YAML document as a string.
+    """
+    return str(yaml.safe_dump(data, **_DUMP_OPTIONS))
+
+
+def load_yaml_key(path: Path, key: str) -> Any:
+    """Load a single top-level key from a YAML mapping file.
+
+    Only the text of that key's block is parsed, so large unrelated
+    sections (long descriptions, artifact lists) are skipped. If the
+    block cannot be isolated cleanly the whole file is parsed instead.
+
+    Args:
+        path: Path to the YAML file.
+        key: Top-level key to read.
+
+    Returns:
+        The value stored under *key*, or ``None`` if it is absent.
+
+    Raises:
+        FileNotFoundError: If *path* does not exist.
+        yaml.YAMLError: If the file contains invalid YAML.
+    """
+    text = path.read_text(encoding="utf-8")
+    if key not in text:
+        return None
+
     # -----
-    # Serialize and write
+    # Fast path: slice out the last "key:" block (PyYAML keeps the last
+    # duplicate) up to the next top-level entry and parse just that
     # -----
-    content = yaml.safe_dump(
-        data,
-        default_flow_style=False,
-        allow_unicode=True,
-        sort_keys=False,
-    )
-
-    path.write_text(content, encoding="utf-8")
-    logger.debug(f"YAML dumped successfully: path='{path}'")
+    starts = list(re.finditer(rf"^{re.escape(key)}:", text, re.MULTILINE))
+    if starts:
+        begin = starts[-1].start()
+        nxt = _TOP_LEVEL_LINE.search(text, starts[-1].end())
+        block = text[begin : nxt.start() if nxt else len(text)]
+        try:
+            data = yaml.load(block, Loader=_SafeLoader)
+        except yaml.YAMLError:
+            data = None
+        if isinstance(data, dict) and key in data:
+            return data[key]
+
+    logger.debug(f"Falling back to full parse for key '{key}': path='{path}'")
+    return parse_yaml_text(text, path).get(key)
 
 
 def load_yaml_optional(path: Path) -> dict[str, Any]:
     """Load a YAML file, returning an empty dict if the file does not exist.
 
     Convenience wrapper around :func:`load_yaml` that silently handles
-    missing files — useful for optional config files.
+    missing files — useful for optional config files. The file is opened
+    directly rather than checked for existence first, so a hit costs one
+    open and a miss one failed open.
 
     Args:
         path: Path to the YAML file.
@@ -133,7 +254,10 @@ def load_yaml_optional(path: Path) -> dict[str, Any]:
     Returns:
         Parsed content or empty dict.
     """
-    if not path.exists():
+    logger.debug(f"Loading optional YAML file: path='{path}'")
+    try:
+        text = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
         logger.debug(f"Optional YAML file not found (ok): path='{path}'")
         return {}
-    return load_yaml(path)
+    return parse_yaml_text(text, path)
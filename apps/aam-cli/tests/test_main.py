@@ -15,12 +15,16 @@ import logging
 from pathlib import Path
 
 import pytest
+import yaml
 from click.testing import CliRunner
 
+from aam_cli.core.manifest import PackageManifest
 from aam_cli.main import cli
+from aam_cli.utils.archive import read_archive_member_with_digest
 from aam_cli.utils.naming import (
     format_invalid_package_name_message,
     format_package_name,
+    package_fs_name,
     parse_package_name,
     parse_package_spec,
     suggest_package_name,
@@ -472,6 +476,61 @@ class TestPackCommand:
             # Archive file should be created on disk
             assert Path("test-pkg-1.0.0.aam").exists()
 
+    def test_unit_pack_missing_artifact_path(self) -> None:
+        """Every missing artifact path is reported and nothing is built."""
+        with self.runner.isolated_filesystem():
+            Path("aam.yaml").write_text(
+                "name: test-pkg\n"
+                "version: 1.0.0\n"
+                "description: A test package\n"
+                "artifacts:\n"
+                "  skills:\n"
+                "    - name: present\n"
+                "      path: skills/present\n"
+                "      description: Present\n"
+                "    - name: absent\n"
+                "      path: skills/absent\n"
+                "      description: Absent\n",
+                encoding="utf-8",
+            )
+            Path("skills/present").mkdir(parents=True)
+
+            result = self.runner.invoke(cli, ["pack"])
+
+            assert result.exit_code != 0
+            assert "Missing: skills/absent" in result.output
+            assert "skills/present" not in result.output.split("Missing:", 1)[1]
+            assert not Path("test-pkg-1.0.0.aam").exists()
+
+    def test_unit_pack_leaves_manifest_untouched(self) -> None:
+        """Checksums go into the archived aam.yaml, not the project's."""
+        with self.runner.isolated_filesystem():
+            manifest_text = (
+                "# my package\n"
+                "name: test-pkg\n"
+                "version: 1.0.0\n"
+                "description: A test package\n"
+                "artifacts:\n"
+                "  skills:\n"
+                "    - name: test-skill\n"
+                "      path: skills/test\n"
+                "      description: A test skill\n"
+            )
+            Path("aam.yaml").write_text(manifest_text, encoding="utf-8")
+            Path("skills/test").mkdir(parents=True)
+            Path("skills/test/SKILL.md").write_text("# Test Skill\n", encoding="utf-8")
+
+            result = self.runner.invoke(cli, ["pack"])
+
+            assert result.exit_code == 0
+            assert Path("aam.yaml").read_text(encoding="utf-8") == manifest_text
+            content, _ = read_archive_member_with_digest(
+                Path("test-pkg-1.0.0.aam"), "aam.yaml"
+            )
+            packed = yaml.safe_load(content)
+            assert packed["name"] == "test-pkg"
+            assert "skills/test/SKILL.md" in packed["file_checksums"]["files"]
+
 
 ################################################################################
 #                                                                              #
@@ -526,6 +585,18 @@ class TestNamingParseName:
         with pytest.raises(ValueError, match="missing '/' separator"):
             parse_package_name("@scopename")
 
+    def test_unit_parse_memoized(self) -> None:
+        """Repeated names are served from the cache; errors are not cached."""
+        parse_package_name.cache_clear()
+
+        first = parse_package_name("@author/my-package")
+        assert parse_package_name("@author/my-package") is first
+        assert parse_package_name.cache_info().hits == 1
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                parse_package_name("@@bad/pkg")
+
 
 class TestNamingParseSpec:
     """Test parse_package_spec utility."""
@@ -574,6 +645,12 @@ class TestNamingParseSpec:
         with pytest.raises(ValueError, match="Empty version"):
             parse_package_spec("pkg@")
 
+    @pytest.mark.parametrize("spec", ["@author", "@author@1.0.0"])
+    def test_unit_rejects_scope_without_slash(self, spec: str) -> None:
+        """Test: @author / @author@1.0.0 -> rejected (missing '/')."""
+        with pytest.raises(ValueError, match="missing '/' separator"):
+            parse_package_spec(spec)
+
 
 class TestNamingValidate:
     """Test validate_package_name utility."""
@@ -596,6 +673,58 @@ class TestNamingValidate:
         assert validate_package_name("-starts-with-hyphen") is False
         assert validate_package_name("@/name") is False
 
+    def test_unit_trailing_newline_rejected(self) -> None:
+        """Test that a trailing newline does not slip past the ``$`` anchor."""
+        assert validate_package_name("my-pkg\n") is False
+        with pytest.raises(ValueError, match="Invalid package name"):
+            parse_package_name("my-pkg\n")
+        with pytest.raises(ValueError, match="Invalid name"):
+            parse_package_name("@author/my-pkg\n")
+
+
+class TestManifestNameValidation:
+    """Test name checks in the PackageManifest model."""
+
+    @staticmethod
+    def _manifest(**overrides: object) -> dict[str, object]:
+        """Return minimal manifest data with *overrides* applied."""
+        data: dict[str, object] = {
+            "name": "my-pkg",
+            "version": "1.0.0",
+            "description": "A test package",
+            "artifacts": {
+                "skills": [{"name": "my-skill", "path": "skills/s", "description": "S"}]
+            },
+        }
+        data.update(overrides)
+        return data
+
+    def test_unit_valid_manifest(self) -> None:
+        """Test that a manifest with valid names passes."""
+        manifest = PackageManifest.model_validate(
+            self._manifest(dependencies={"@author/dep": ">=1.0.0"})
+        )
+        assert manifest.name == "my-pkg"
+
+    def test_unit_trailing_newline_rejected(self) -> None:
+        """Test that package, dependency and artifact names reject a trailing newline."""
+        with pytest.raises(ValueError, match="Invalid package name"):
+            PackageManifest.model_validate(self._manifest(name="my-pkg\n"))
+        with pytest.raises(ValueError, match="Invalid dependency name"):
+            PackageManifest.model_validate(
+                self._manifest(dependencies={"@author/dep\n": ">=1.0.0"})
+            )
+        with pytest.raises(ValueError, match="Invalid artifact name"):
+            PackageManifest.model_validate(
+                self._manifest(
+                    artifacts={
+                        "skills": [
+                            {"name": "my-skill\n", "path": "skills/s", "description": "S"}
+                        ]
+                    }
+                )
+            )
+
 
 class TestNamingSuggest:
     """Test suggest_package_name and format_invalid_package_name_message."""
@@ -643,3 +772,13 @@ class TestNamingFormat:
     def test_unit_filesystem_unscoped(self) -> None:
         """Test filesystem name for unscoped packages."""
         assert to_filesystem_name("", "asvc-report") == "asvc-report"
+
+    def test_unit_package_fs_name(self) -> None:
+        """Test filesystem name from a full package name."""
+        assert package_fs_name("@author/asvc-report") == "author--asvc-report"
+        assert package_fs_name("asvc-report") == "asvc-report"
+
+    def test_unit_package_fs_name_invalid(self) -> None:
+        """Test invalid full names are rejected."""
+        with pytest.raises(ValueError):
+            package_fs_name("@Bad/Name")
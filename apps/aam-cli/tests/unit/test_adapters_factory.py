@@ -443,3 +443,27 @@ class TestCodexAdapter:
 
         assert dest == fake_home / ".codex" / "prompts" / "my-prompt.md"
         assert dest.is_file()
+
+
+################################################################################
+#                                                                              #
+# ARTIFACT NAME TESTS                                                          #
+#                                                                              #
+################################################################################
+
+
+class TestArtifactFsName:
+    """Tests for the adapters' ``_artifact_fs_name`` helper."""
+
+    @pytest.mark.parametrize(
+        "adapter_cls", [ClaudeAdapter, CodexAdapter, CopilotAdapter, CursorAdapter]
+    )
+    @pytest.mark.parametrize(
+        ("artifact_name", "expected"),
+        [("@author/my-skill", "author--my-skill"), ("my-skill", "my-skill")],
+    )
+    def test_unit_artifact_fs_name(
+        self, adapter_cls: type, artifact_name: str, expected: str, tmp_path: Path
+    ) -> None:
+        """Scoped artifact names map to ``scope--name``; others are unchanged."""
+        assert adapter_cls(tmp_path)._artifact_fs_name(artifact_name) == expected
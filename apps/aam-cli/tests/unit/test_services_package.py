@@ -12,7 +12,9 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from aam_cli.detection.scanner import DetectedArtifact
 from aam_cli.services.package_service import (
+    create_package,
     get_package_info,
     list_installed_packages,
 )
@@ -82,3 +84,20 @@ class TestPackageService:
             return_value=mock_lock,
         ), pytest.raises(ValueError, match="AAM_PACKAGE_NOT_FOUND"):
             get_package_info("nonexistent")
+
+    def test_unit_create_package_counts_artifacts_by_type(self, tmp_path: Path) -> None:
+        """``artifacts_included`` counts selected artifacts per plural type."""
+        detected = [
+            DetectedArtifact(
+                name=name, type=atype, source_path=Path(f"{atype}s/{name}"), description=name
+            )
+            for name, atype in [("a", "skill"), ("b", "agent"), ("c", "skill")]
+        ]
+
+        with patch(
+            "aam_cli.services.package_service.scan_project", return_value=detected
+        ):
+            result = create_package(tmp_path, name="my-pkg")
+
+        assert result["artifacts_included"] == {"skills": 2, "agents": 1}
+        assert type(result["artifacts_included"]) is dict
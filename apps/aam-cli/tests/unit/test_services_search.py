@@ -12,6 +12,7 @@ Tests cover:
 ################################################################################
 
 import logging
+import threading
 import time
 from unittest.mock import MagicMock, patch
 
@@ -1235,6 +1236,62 @@ class TestSearchPackagesNew:
         assert len(versions) == 2
 
 
+class TestSearchRegistryFanOut:
+    """Tests for searching several registries concurrently."""
+
+    @patch("aam_cli.services.search_service.create_registry")
+    def test_unit_registries_searched_concurrently(
+        self,
+        mock_create_reg: MagicMock,
+    ) -> None:
+        """Both registry searches are in flight at the same time."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def _registry(source: MagicMock) -> MagicMock:
+            reg = MagicMock()
+
+            def _search(_query: str) -> list[MagicMock]:
+                barrier.wait()
+                return [_make_registry_entry(f"{source.name}-pkg")]
+
+            reg.search.side_effect = _search
+            return reg
+
+        mock_create_reg.side_effect = _registry
+        config = _make_config(registries=[_make_source("reg-a"), _make_source("reg-b")])
+
+        response = search_packages("", config, sort_by="relevance")
+
+        assert {r.name for r in response.results} == {"reg-a-pkg", "reg-b-pkg"}
+
+    @patch("aam_cli.services.search_service.create_registry")
+    def test_unit_failing_registry_only_warns(
+        self,
+        mock_create_reg: MagicMock,
+    ) -> None:
+        """A registry that fails adds a warning; the others still return results."""
+
+        def _registry(source: MagicMock) -> MagicMock:
+            reg = MagicMock()
+            if source.name == "broken":
+                reg.search.side_effect = OSError("unreadable index")
+            else:
+                reg.search.return_value = [_make_registry_entry(f"{source.name}-pkg")]
+            return reg
+
+        mock_create_reg.side_effect = _registry
+        config = _make_config(
+            registries=[_make_source("slow"), _make_source("broken"), _make_source("fast")]
+        )
+
+        response = search_packages("", config, sort_by="name")
+
+        assert [r.origin for r in response.results] == ["fast", "slow"]
+        assert response.warnings == [
+            "Could not search registry 'broken': unreadable index"
+        ]
+
+
 ################################################################################
 #                                                                              #
 # TESTS: Performance benchmark (T024 / SC-007)                                 #
@@ -0,0 +1,282 @@
+"""Unit tests for ``.aam`` archive extraction.
+
+Covers the optional single-pass checksum computed while extracting and
+the member validation that precedes extraction.
+"""
+
+################################################################################
+#                                                                              #
+# IMPORTS & DEPENDENCIES                                                       #
+#                                                                              #
+################################################################################
+
+import hashlib
+import io
+import logging
+import os
+import tarfile
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from aam_cli.utils.archive import (
+    _HashingReader,
+    _PipelinedHasher,
+    create_archive,
+    create_archive_with_digest,
+    extract_archive,
+    extract_archive_with_digest,
+    read_archive_member_with_digest,
+)
+from aam_cli.utils.checksum import calculate_sha256
+
+################################################################################
+#                                                                              #
+# LOGGING                                                                      #
+#                                                                              #
+################################################################################
+
+logger = logging.getLogger(__name__)
+
+################################################################################
+#                                                                              #
+# FIXTURES                                                                     #
+#                                                                              #
+################################################################################
+
+
+@pytest.fixture()
+def archive(tmp_path: Path) -> Path:
+    """Create an archive large enough to span several read blocks."""
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "aam.yaml").write_text("name: pkg\n")
+    for i in range(8):
+        (src / f"blob-{i}.bin").write_bytes(os.urandom(40_000))
+    return create_archive(src, tmp_path / "pkg.aam")
+
+
+################################################################################
+#                                                                              #
+# CREATE TESTS                                                                 #
+#                                                                              #
+################################################################################
+
+
+class TestCreateArchiveDigest:
+    """Tests for hashing an archive while it is written."""
+
+    def test_unit_digest_matches_file_checksum(self, tmp_path: Path) -> None:
+        """The write-side digest equals hashing the finished file."""
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "aam.yaml").write_text("name: pkg\n")
+        (src / "blob.bin").write_bytes(os.urandom(200_000))
+        output = tmp_path / "pkg.aam"
+
+        with patch(
+            "aam_cli.utils.checksum.calculate_sha256", side_effect=AssertionError("re-read")
+        ):
+            checksum = create_archive_with_digest(src, output)
+
+        assert checksum == calculate_sha256(output)
+        assert extract_archive_with_digest(output, tmp_path / "out") == checksum
+        assert (tmp_path / "out" / "blob.bin").read_bytes() == (src / "blob.bin").read_bytes()
+
+    def test_unit_overrides_replace_member(self, tmp_path: Path) -> None:
+        """An override is archived in place of the file, which stays as-is."""
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "aam.yaml").write_text("name: pkg\n")
+        output = tmp_path / "pkg.aam"
+
+        create_archive(
+            src, output, overrides={"aam.yaml": b"name: other\n", "extra.txt": b"x"}
+        )
+
+        with tarfile.open(output, "r:gz") as tar:
+            names = tar.getnames()
+        content, _ = read_archive_member_with_digest(output, "aam.yaml")
+        assert sorted(names) == ["aam.yaml", "extra.txt"]
+        assert content == b"name: other\n"
+        assert (src / "aam.yaml").read_text() == "name: pkg\n"
+
+
+################################################################################
+#                                                                              #
+# HASHING TESTS                                                                #
+#                                                                              #
+################################################################################
+
+
+class TestExtractHashing:
+    """Tests for the ``hasher`` argument of ``extract_archive``."""
+
+    def test_unit_hash_matches_file_checksum(self, archive: Path, tmp_path: Path) -> None:
+        """The streamed digest equals hashing the archive file directly."""
+        hasher = hashlib.sha256()
+
+        extract_archive(archive, tmp_path / "out", hasher=hasher)
+
+        assert f"sha256:{hasher.hexdigest()}" == calculate_sha256(archive)
+        assert (tmp_path / "out" / "aam.yaml").read_text() == "name: pkg\n"
+
+    def test_unit_without_hasher(self, archive: Path, tmp_path: Path) -> None:
+        """Extraction without a hasher behaves as before."""
+        extract_archive(archive, tmp_path / "out")
+
+        assert len(list((tmp_path / "out").iterdir())) == 9
+
+    def test_unit_unsafe_entry_still_rejected(self, tmp_path: Path) -> None:
+        """Path traversal is rejected when hashing too."""
+        bad = tmp_path / "bad.aam"
+        with tarfile.open(bad, "w:gz") as tar:
+            info = tarfile.TarInfo("../escape.txt")
+            info.size = 1
+            tar.addfile(info, io.BytesIO(b"x"))
+
+        with pytest.raises(ValueError, match="Path traversal"):
+            extract_archive(bad, tmp_path / "out", hasher=hashlib.sha256())
+
+    def test_unit_pipelined_hash_matches(self, archive: Path, tmp_path: Path) -> None:
+        """Large archives are hashed on a worker thread to the same digest."""
+        with (
+            patch("aam_cli.utils.archive._PIPELINE_MIN_BYTES", 0),
+            patch.object(
+                _PipelinedHasher, "close", autospec=True, side_effect=_PipelinedHasher.close
+            ) as mock_close,
+        ):
+            checksum = extract_archive_with_digest(archive, tmp_path / "out")
+
+        mock_close.assert_called_once()
+        assert checksum == calculate_sha256(archive)
+        assert len(list((tmp_path / "out").iterdir())) == 9
+
+    def test_unit_pipelined_hash_stops_on_error(self, tmp_path: Path) -> None:
+        """The worker thread is shut down when extraction fails."""
+        bad = tmp_path / "bad.aam"
+        with tarfile.open(bad, "w:gz") as tar:
+            info = tarfile.TarInfo("../escape.txt")
+            info.size = 1
+            tar.addfile(info, io.BytesIO(b"x"))
+
+        with (
+            patch("aam_cli.utils.archive._PIPELINE_MIN_BYTES", 0),
+            pytest.raises(ValueError, match="Path traversal"),
+        ):
+            extract_archive(bad, tmp_path / "out", hasher=hashlib.sha256())
+
+        assert not any(t.name == "aam-archive-hash" for t in threading.enumerate())
+
+    def test_unit_extract_with_digest(self, archive: Path, tmp_path: Path) -> None:
+        """The convenience wrapper returns a ``sha256:``-prefixed checksum."""
+        checksum = extract_archive_with_digest(archive, tmp_path / "out")
+
+        assert checksum == calculate_sha256(archive)
+        assert (tmp_path / "out" / "aam.yaml").is_file()
+
+
+################################################################################
+#                                                                              #
+# VALIDATION TESTS                                                             #
+#                                                                              #
+################################################################################
+
+
+class TestExtractValidation:
+    """Tests for the member checks run before extraction."""
+
+    def test_unit_validation_does_not_resolve_members(
+        self, archive: Path, tmp_path: Path
+    ) -> None:
+        """Containment is checked without a ``resolve()`` per member."""
+        with patch.object(Path, "resolve", wraps=Path.resolve, autospec=True) as mock:
+            extract_archive(archive, tmp_path / "out")
+
+        assert mock.call_count == 1
+
+    def test_unit_escaping_symlink_rejected(self, tmp_path: Path) -> None:
+        """A link pointing outside the destination is refused on extract."""
+        bad = tmp_path / "link.aam"
+        with tarfile.open(bad, "w:gz") as tar:
+            info = tarfile.TarInfo("skills/evil")
+            info.type = tarfile.SYMTYPE
+            info.linkname = "../../outside"
+            tar.addfile(info)
+
+        with pytest.raises(tarfile.FilterError):
+            extract_archive(bad, tmp_path / "out")
+
+    def test_unit_archive_read_in_one_pass(self, archive: Path, tmp_path: Path) -> None:
+        """Extraction never rewinds (and so never re-decompresses) the archive."""
+        backward: list[int] = []
+        real_seek = _HashingReader.seek
+
+        def _seek(self: _HashingReader, offset: int, whence: int = os.SEEK_SET) -> int:
+            if whence == os.SEEK_SET and offset < self.tell():
+                backward.append(offset)
+            return real_seek(self, offset, whence)
+
+        with patch.object(_HashingReader, "seek", _seek):
+            extract_archive(archive, tmp_path / "out", hasher=hashlib.sha256())
+
+        assert backward == []
+        assert (tmp_path / "out" / "aam.yaml").is_file()
+
+    def test_unit_late_bad_entry_rejected(self, tmp_path: Path) -> None:
+        """An unsafe entry after valid ones is still refused before it is written."""
+        bad = tmp_path / "late.aam"
+        with tarfile.open(bad, "w:gz") as tar:
+            for name in ("ok.txt", "../escape.txt"):
+                info = tarfile.TarInfo(name)
+                info.size = 1
+                tar.addfile(info, io.BytesIO(b"x"))
+
+        with pytest.raises(ValueError, match="Path traversal"):
+            extract_archive(bad, tmp_path / "out")
+
+        assert not (tmp_path / "escape.txt").exists()
+
+
+################################################################################
+#                                                                              #
+# MEMBER READ TESTS                                                            #
+#                                                                              #
+################################################################################
+
+
+class TestReadArchiveMember:
+    """Tests for ``read_archive_member_with_digest``."""
+
+    def test_unit_reads_member_and_checksum(self, archive: Path) -> None:
+        """The member's bytes and the whole-archive checksum are returned."""
+        content, checksum = read_archive_member_with_digest(archive, "aam.yaml")
+
+        assert content == b"name: pkg\n"
+        assert checksum == calculate_sha256(archive)
+
+    def test_unit_nothing_extracted(self, archive: Path) -> None:
+        """No member is written to disk."""
+        with patch.object(tarfile.TarFile, "extractall") as mock_extract:
+            read_archive_member_with_digest(archive, "aam.yaml")
+
+        mock_extract.assert_not_called()
+
+    def test_unit_missing_member(self, archive: Path) -> None:
+        """An absent member raises ``FileNotFoundError``."""
+        with pytest.raises(FileNotFoundError, match="missing.yaml"):
+            read_archive_member_with_digest(archive, "missing.yaml")
+
+    def test_unit_unsafe_entry_rejected(self, tmp_path: Path) -> None:
+        """Member checks apply even though nothing is extracted."""
+        bad = tmp_path / "bad.aam"
+        with tarfile.open(bad, "w:gz") as tar:
+            for name in ("aam.yaml", "../escape.txt"):
+                info = tarfile.TarInfo(name)
+                info.size = 1
+                tar.addfile(info, io.BytesIO(b"x"))
+
+        with pytest.raises(ValueError, match="Path traversal"):
+            read_archive_member_with_digest(bad, "aam.yaml")
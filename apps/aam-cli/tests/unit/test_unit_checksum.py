@@ -0,0 +1,64 @@
+"""Unit tests for the SHA-256 checksum helpers."""
+
+################################################################################
+#                                                                              #
+# IMPORTS & DEPENDENCIES                                                       #
+#                                                                              #
+################################################################################
+
+import hashlib
+import logging
+import os
+from pathlib import Path
+
+import pytest
+
+from aam_cli.utils import checksum
+from aam_cli.utils.checksum import calculate_sha256, verify_sha256
+
+################################################################################
+#                                                                              #
+# LOGGING                                                                      #
+#                                                                              #
+################################################################################
+
+logger = logging.getLogger(__name__)
+
+################################################################################
+#                                                                              #
+# CALCULATE TESTS                                                              #
+#                                                                              #
+################################################################################
+
+
+class TestCalculateSha256:
+    """Tests for ``calculate_sha256``."""
+
+    @pytest.mark.parametrize(
+        "size",
+        [0, 1, checksum._HASH_BUFFER_SIZE, checksum._HASH_BUFFER_SIZE * 3 + 7],
+    )
+    def test_unit_matches_hashlib(self, tmp_path: Path, size: int) -> None:
+        """Digests match hashlib across buffer boundaries."""
+        data = os.urandom(size)
+        path = tmp_path / "blob"
+        path.write_bytes(data)
+
+        assert calculate_sha256(path) == f"sha256:{hashlib.sha256(data).hexdigest()}"
+        assert verify_sha256(path, calculate_sha256(path))
+
+    def test_unit_buffer_reused_across_calls(self, tmp_path: Path) -> None:
+        """One buffer serves every call on a thread."""
+        (tmp_path / "a").write_bytes(b"a")
+        (tmp_path / "b").write_bytes(b"b")
+
+        calculate_sha256(tmp_path / "a")
+        first = checksum._hash_buffer()[0]
+        calculate_sha256(tmp_path / "b")
+
+        assert checksum._hash_buffer()[0] is first
+
+    def test_unit_missing_file_raises(self, tmp_path: Path) -> None:
+        """A missing file raises ``FileNotFoundError``."""
+        with pytest.raises(FileNotFoundError):
+            calculate_sha256(tmp_path / "missing")
@@ -18,10 +18,12 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from aam_cli.core.workspace import FileChecksums, LockedPackage
+from aam_cli.core.workspace import FileChecksums, LockedPackage, LockFile
 from aam_cli.services.checksum_service import (
+    PARALLEL_HASH_MIN_FILES,
     check_modifications,
     compute_file_checksums,
+    compute_stat_fingerprint,
     create_backup,
     verify_all,
     verify_package,
@@ -272,6 +274,54 @@ class TestComputeFileChecksums:
         assert "file3.md" in checksums
         assert "file2.md" not in checksums
 
+    def test_unit_compute_checksums_many_files(self, tmp_path: Path) -> None:
+        """Large file sets hashed on the pool match serial digests."""
+        names = [f"file{i}.md" for i in range(PARALLEL_HASH_MIN_FILES * 2)]
+        for name in names:
+            (tmp_path / name).write_text(name)
+
+        checksums = compute_file_checksums(tmp_path, files=[*names, "missing.md"])
+
+        assert checksums == {name: _compute_hex_digest(name) for name in names}
+
+    def test_unit_directory_walk_skips_hidden(self, tmp_path: Path) -> None:
+        """Nested files are listed; hidden entries and their subtrees are not."""
+        (tmp_path / "skills" / "s").mkdir(parents=True)
+        (tmp_path / "skills" / "s" / "SKILL.md").write_text("skill")
+        (tmp_path / "skills" / ".cache").mkdir()
+        (tmp_path / "skills" / ".cache" / "x.md").write_text("x")
+        (tmp_path / ".hidden.md").write_text("h")
+        (tmp_path / "aam.yaml").write_text("name: pkg")
+        (tmp_path / "linked").symlink_to(tmp_path / "skills", target_is_directory=True)
+
+        checksums = compute_file_checksums(tmp_path)
+
+        assert list(checksums) == ["aam.yaml", str(Path("skills", "s", "SKILL.md"))]
+
+
+################################################################################
+#                                                                              #
+# STAT FINGERPRINT TESTS                                                       #
+#                                                                              #
+################################################################################
+
+
+class TestComputeStatFingerprint:
+    """Tests for compute_stat_fingerprint."""
+
+    def test_unit_symlinked_directory_not_followed(self, tmp_path: Path) -> None:
+        """Symlinked directories, including cycles, are not descended into."""
+        (tmp_path / "skills").mkdir()
+        (tmp_path / "skills" / "SKILL.md").write_text("skill")
+        (tmp_path / "aam.yaml").write_text("name: pkg")
+        (tmp_path / "linked").symlink_to(tmp_path / "skills", target_is_directory=True)
+        (tmp_path / "skills" / "loop").symlink_to(tmp_path, target_is_directory=True)
+
+        _, files = compute_stat_fingerprint(tmp_path, [])
+
+        assert files == ["aam.yaml", str(Path("skills", "SKILL.md"))]
+        assert files == sorted(compute_file_checksums(tmp_path))
+
 
 ################################################################################
 #                                                                              #
@@ -327,6 +377,24 @@ class TestCreateBackup:
 class TestCheckModifications:
     """Tests for checksum_service.check_modifications()."""
 
+    @patch("aam_cli.services.checksum_service.get_installed_packages")
+    def test_unit_check_mods_uses_given_lock(
+        self, mock_installed: MagicMock
+    ) -> None:
+        """A passed-in lock is used instead of reading the lock file."""
+        lock = LockFile(
+            packages={
+                "test-pkg": LockedPackage(
+                    version="1.0.0", source="local", checksum="sha256:abc"
+                ),
+            },
+        )
+
+        result = check_modifications("test-pkg", lock=lock)
+
+        mock_installed.assert_not_called()
+        assert result["has_checksums"] is False
+
     @patch("aam_cli.services.checksum_service.get_installed_packages")
     def test_unit_check_mods_not_installed(
         self, mock_installed: MagicMock
@@ -0,0 +1,317 @@
+"""Unit tests for the local create-package flow.
+
+Tests project scanning, filtering, and manifest generation for
+``aam create-package`` run against a local project directory.
+"""
+
+################################################################################
+#                                                                              #
+# IMPORTS & DEPENDENCIES                                                       #
+#                                                                              #
+################################################################################
+
+import logging
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from click.testing import CliRunner
+
+from aam_cli.commands.create_package import (
+    _interactive_select,
+    _read_existing_manifest,
+    create_package,
+)
+from aam_cli.detection.scanner import DetectedArtifact
+from aam_cli.main import cli
+from aam_cli.utils.yaml_utils import load_yaml
+
+################################################################################
+#                                                                              #
+# LOGGING                                                                      #
+#                                                                              #
+################################################################################
+
+logger = logging.getLogger(__name__)
+
+################################################################################
+#                                                                              #
+# FIXTURES                                                                     #
+#                                                                              #
+################################################################################
+
+
+@pytest.fixture()
+def project(tmp_path: Path) -> Path:
+    """Create a project with two skills and a prompt."""
+    root = tmp_path / "project"
+    for skill in ("alpha", "beta"):
+        skill_dir = root / "skills" / skill
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text(f"# {skill}\n")
+
+    (root / "prompts").mkdir()
+    (root / "prompts" / "review.md").write_text("Review this.\n")
+
+    return root
+
+
+def _invoke(project: Path, output_dir: Path | None = None) -> object:
+    """Run create-package non-interactively against *project*."""
+    out_args = ["--output-dir", str(output_dir)] if output_dir else []
+    return CliRunner().invoke(
+        create_package,
+        [
+            str(project),
+            "--all",
+            "--name",
+            "my-pkg",
+            "--version",
+            "1.0.0",
+            "--description",
+            "Test",
+            "--organize",
+            "reference",
+            *out_args,
+            "--yes",
+        ],
+        obj={"console": MagicMock()},
+    )
+
+
+################################################################################
+#                                                                              #
+# EXISTING MANIFEST TESTS                                                      #
+#                                                                              #
+################################################################################
+
+
+class TestExistingManifest:
+    """Tests for keeping artifacts already declared in aam.yaml."""
+
+    def test_unit_no_manifest_returns_empty(self, project: Path) -> None:
+        """A project without aam.yaml declares no artifacts."""
+        assert _read_existing_manifest(project) == {}
+
+    def test_unit_reads_declared_sections(self, project: Path) -> None:
+        """Declared artifact entries are returned per section."""
+        (project / "aam.yaml").write_text(
+            "name: my-pkg\n"
+            "artifacts:\n"
+            "  skills:\n"
+            "    - name: alpha\n"
+            "      path: skills/alpha/\n"
+            "      description: Alpha\n"
+        )
+
+        assert _read_existing_manifest(project) == {
+            "skills": [{"name": "alpha", "path": "skills/alpha/", "description": "Alpha"}]
+        }
+
+    def test_unit_invalid_manifest_returns_empty(self, project: Path) -> None:
+        """An unparsable aam.yaml is treated as declaring nothing."""
+        (project / "aam.yaml").write_text("artifacts: [unclosed\n")
+
+        assert _read_existing_manifest(project) == {}
+
+    def test_unit_rerun_keeps_earlier_artifacts(self, project: Path) -> None:
+        """Re-running after adding a skill keeps the skills declared before."""
+        assert _invoke(project).exit_code == 0
+
+        (project / "skills" / "gamma").mkdir()
+        (project / "skills" / "gamma" / "SKILL.md").write_text("# gamma\n")
+        result = _invoke(project)
+
+        assert result.exit_code == 0, result.output
+        manifest = load_yaml(project / "aam.yaml")
+        skill_names = [s["name"] for s in manifest["artifacts"]["skills"]]
+        assert skill_names == ["alpha", "beta", "gamma"]
+        assert [p["name"] for p in manifest["artifacts"]["prompts"]] == ["review"]
+
+    def test_unit_declared_entries_are_preserved(self, project: Path) -> None:
+        """Hand-edited entries survive and are not duplicated by the scan."""
+        (project / "aam.yaml").write_text(
+            "name: my-pkg\n"
+            "artifacts:\n"
+            "  skills:\n"
+            "    - name: alpha\n"
+            "      path: skills/alpha/\n"
+            "      description: Hand-written\n"
+        )
+
+        result = _invoke(project)
+
+        assert result.exit_code == 0, result.output
+        skills = load_yaml(project / "aam.yaml")["artifacts"]["skills"]
+        assert [s["name"] for s in skills] == ["alpha", "beta"]
+        assert skills[0]["description"] == "Hand-written"
+
+    def test_unit_other_output_dir_gets_all_artifacts(
+        self, project: Path, tmp_path: Path
+    ) -> None:
+        """Writing elsewhere packages every detected artifact."""
+        (project / "aam.yaml").write_text(
+            "name: my-pkg\n"
+            "artifacts:\n"
+            "  skills:\n"
+            "    - name: alpha\n"
+            "      path: skills/alpha\n"
+            "      description: Alpha\n"
+        )
+        out_dir = tmp_path / "out"
+
+        result = _invoke(project, out_dir)
+
+        assert result.exit_code == 0, result.output
+        manifest = load_yaml(out_dir / "aam.yaml")
+        skill_names = [s["name"] for s in manifest["artifacts"]["skills"]]
+        assert skill_names == ["alpha", "beta"]
+
+
+################################################################################
+#                                                                              #
+# INTERACTIVE SELECTION TESTS                                                  #
+#                                                                              #
+################################################################################
+
+
+class TestInteractiveSelect:
+    """Tests for the toggle-based artifact selection loop."""
+
+    def test_unit_toggle_redraws_only_changed_rows(self) -> None:
+        """Toggling one item prints that row, not the whole list again."""
+        artifacts = [
+            DetectedArtifact(name="alpha", type="skill", source_path=Path("skills/alpha")),
+            DetectedArtifact(name="beta", type="skill", source_path=Path("skills/beta")),
+            DetectedArtifact(name="review", type="prompt", source_path=Path("prompts/r.md")),
+        ]
+        console = MagicMock()
+
+        with patch(
+            "rich.prompt.Prompt.ask", side_effect=["2", ""]
+        ):
+            selected = _interactive_select(console, artifacts)
+
+        assert [a.name for a in selected] == ["alpha", "review"]
+
+        printed = [str(c.args[0]) for c in console.print.call_args_list if c.args]
+        beta_rows = [line for line in printed if "beta" in line]
+        alpha_rows = [line for line in printed if "alpha" in line]
+        assert len(beta_rows) == 2  # initial list + redrawn row
+        assert beta_rows[-1].startswith("    [ ]")
+        assert len(alpha_rows) == 1  # unchanged rows are not redrawn
+
+    def test_unit_select_none(self) -> None:
+        """``n`` deselects every artifact."""
+        artifacts = [
+            DetectedArtifact(name="alpha", type="skill", source_path=Path("skills/alpha")),
+        ]
+
+        with patch(
+            "rich.prompt.Prompt.ask", side_effect=["n", ""]
+        ):
+            selected = _interactive_select(MagicMock(), artifacts)
+
+        assert selected == []
+
+
+################################################################################
+#                                                                              #
+# MANUAL INCLUDE TESTS                                                         #
+#                                                                              #
+################################################################################
+
+
+class TestManualInclude:
+    """Tests for ``--include`` artifact naming."""
+
+    def test_unit_include_names(
+        self, project: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Files are named by stem, directories (even with a slash) by name."""
+        (project / "extra").mkdir()
+        (project / "extra" / "guide.md").write_text("Guide\n")
+        (project / "tools").mkdir()
+        monkeypatch.chdir(project)
+        out_dir = tmp_path / "out"
+
+        result = CliRunner().invoke(
+            create_package,
+            [
+                str(project),
+                "--all",
+                "--type",
+                "prompt",
+                "--include",
+                "extra/guide.md",
+                "--include",
+                "tools/",
+                "--include-as",
+                "instruction",
+                "--name",
+                "my-pkg",
+                "--version",
+                "1.0.0",
+                "--description",
+                "Test",
+                "--organize",
+                "reference",
+                "--output-dir",
+                str(out_dir),
+                "--yes",
+            ],
+            obj={"console": MagicMock()},
+        )
+
+        assert result.exit_code == 0, result.output
+        manifest = load_yaml(out_dir / "aam.yaml")
+        names = [i["name"] for i in manifest["artifacts"]["instructions"]]
+        assert names == ["guide", "tools"]
+
+
+################################################################################
+#                                                                              #
+# TYPE FILTER TESTS                                                            #
+#                                                                              #
+################################################################################
+
+
+class TestTypeFilter:
+    """Tests for ``--type`` value normalization."""
+
+    @pytest.mark.parametrize("value", ["prompt", "prompts", "Prompts"])
+    def test_unit_type_aliases(self, project: Path, tmp_path: Path, value: str) -> None:
+        """Singular, plural, and mixed-case names select the same type.
+
+        The deprecated ``aam create-package`` alias forwards ``--type``
+        values without choice validation, so normalization happens in the
+        command itself.
+        """
+        out_dir = tmp_path / "out"
+
+        result = CliRunner().invoke(
+            cli,
+            [
+                "create-package",
+                str(project),
+                "--all",
+                "--type",
+                value,
+                "--name",
+                "my-pkg",
+                "--version",
+                "1.0.0",
+                "--description",
+                "Test",
+                "--organize",
+                "reference",
+                "--output-dir",
+                str(out_dir),
+                "--yes",
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        manifest = load_yaml(out_dir / "aam.yaml")
+        assert [p["name"] for p in manifest["artifacts"]["prompts"]] == ["review"]
+        assert manifest["artifacts"]["skills"] == []
@@ -0,0 +1,473 @@
+"""Unit tests for ``aam diff`` computation.
+
+Covers unified diff formatting and diffing installed files against the
+original contents recorded in the lock file.
+"""
+
+################################################################################
+#                                                                              #
+# IMPORTS & DEPENDENCIES                                                       #
+#                                                                              #
+################################################################################
+
+import difflib
+import json
+import logging
+import subprocess
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from click.testing import CliRunner
+
+from aam_cli.commands import diff as diff_module
+from aam_cli.commands.diff import (
+    _diff_file,
+    _trimmed_opcodes,
+    _unified_diff,
+    diff_package,
+)
+from aam_cli.core.workspace import (
+    FileChecksums,
+    LockedPackage,
+    LockFile,
+    write_lock_file,
+)
+from aam_cli.services.checksum_service import (
+    compute_file_checksums,
+    compute_file_originals,
+    compute_stat_fingerprint,
+    decode_original,
+    encode_original,
+    verify_package,
+)
+
+################################################################################
+#                                                                              #
+# LOGGING                                                                      #
+#                                                                              #
+################################################################################
+
+logger = logging.getLogger(__name__)
+
+################################################################################
+#                                                                              #
+# FIXTURES                                                                     #
+#                                                                              #
+################################################################################
+
+SKILL_TEXT = "".join(f"line {i}\n" for i in range(1, 21))
+
+
+def _install(
+    project_dir: Path,
+    with_originals: bool,
+    with_fingerprint: bool = False,
+) -> Path:
+    """Create an installed ``test-pkg`` with lock file checksums."""
+    pkg_dir = project_dir / ".aam" / "packages" / "test-pkg"
+    skill_dir = pkg_dir / "skills" / "my-skill"
+    skill_dir.mkdir(parents=True)
+    (skill_dir / "SKILL.md").write_text(SKILL_TEXT)
+
+    checksums = compute_file_checksums(pkg_dir)
+    originals = compute_file_originals(pkg_dir, list(checksums)) if with_originals else {}
+    fingerprint = compute_stat_fingerprint(pkg_dir, checksums)[0] if with_fingerprint else None
+
+    write_lock_file(
+        LockFile(
+            packages={
+                "test-pkg": LockedPackage(
+                    version="1.0.0",
+                    source="local",
+                    checksum="sha256:dummy",
+                    file_checksums=FileChecksums(
+                        files=checksums,
+                        originals=originals,
+                        stat_fingerprint=fingerprint,
+                    ),
+                ),
+            },
+        ),
+        project_dir,
+    )
+    return skill_dir / "SKILL.md"
+
+
+################################################################################
+#                                                                              #
+# FORMATTING TESTS                                                             #
+#                                                                              #
+################################################################################
+
+
+class TestUnifiedDiff:
+    """Tests for ``_unified_diff`` parity with ``difflib.unified_diff``."""
+
+    @pytest.mark.parametrize(
+        ("original", "current"),
+        [
+            (["a\n", "b\n", "c\n"], ["a\n", "B\n", "c\n"]),
+            ([], ["new\n", "file\n"]),
+            (["gone\n"], []),
+            ([f"{i}\n" for i in range(30)], [f"{i}\n" for i in range(30) if i != 15]),
+            (["same\n"], ["same\n"]),
+        ],
+    )
+    def test_unit_matches_difflib(self, original: list[str], current: list[str]) -> None:
+        """Output is identical to the standard library formatter."""
+        expected = list(
+            difflib.unified_diff(original, current, fromfile="a", tofile="b", lineterm="")
+        )
+
+        actual = _unified_diff(
+            [line.encode() for line in original],
+            [line.encode() for line in current],
+            "a",
+            "b",
+        )
+
+        assert list(actual) == expected
+
+    def test_unit_matcher_sees_only_changed_region(self) -> None:
+        """Common prefix/suffix lines are never passed to the matcher."""
+        original = [f"{i}\n".encode() for i in range(1000)]
+        current = list(original)
+        current[500] = b"changed\n"
+
+        with patch.object(
+            diff_module, "SequenceMatcher", wraps=diff_module.SequenceMatcher
+        ) as matcher:
+            codes = _trimmed_opcodes(original, current)
+
+        _, a, b = matcher.call_args.args
+        assert a == [0]  # interned id of b"500\n"
+        assert b == [1]  # interned id of b"changed\n"
+        assert codes == [
+            ("equal", 0, 500, 0, 500),
+            ("replace", 500, 501, 500, 501),
+            ("equal", 501, 1000, 501, 1000),
+        ]
+
+    def test_unit_repeated_lines_share_ids(self) -> None:
+        """Equal lines map to the same id on both sides."""
+        original = [b"{\n", b"x\n", b"}\n", b"{\n", b"y\n", b"}\n"]
+        current = [b"{\n", b"y\n", b"}\n", b"{\n", b"x\n", b"}\n"]
+
+        with patch.object(
+            diff_module, "SequenceMatcher", wraps=diff_module.SequenceMatcher
+        ) as matcher:
+            _trimmed_opcodes(original, current)
+
+        _, a, b = matcher.call_args.args
+        # Shared "{" prefix and "}" suffix are trimmed first
+        assert a == [0, 1, 2, 3]  # x } { y
+        assert b == [3, 1, 2, 0]  # y } { x
+
+    def test_unit_pygit2_backend_used_when_available(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """libgit2 hunks are kept and its git header is replaced."""
+        fake_patch = SimpleNamespace(
+            text=(
+                "diff --git a/f.md b/f.md\n"
+                "index 1..2 100644\n"
+                "--- a/f.md\n"
+                "+++ b/f.md\n"
+                "@@ -1 +1 @@\n"
+                "-old\n"
+                "+new\n"
+            )
+        )
+        fake = MagicMock()
+        fake.Patch.create_from.return_value = fake_patch
+        monkeypatch.setattr(diff_module, "pygit2", fake)
+
+        lines = _diff_file(b"old\n", b"new\n", "f.md")
+
+        assert lines == [
+            "--- a/f.md (original)",
+            "+++ b/f.md (modified)",
+            "@@ -1 +1 @@",
+            "-old",
+            "+new",
+        ]
+        fake.Patch.create_from.assert_called_once_with(
+            b"old\n", b"new\n", old_as_path="f.md", new_as_path="f.md"
+        )
+
+    def test_unit_fallback_without_pygit2(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Without pygit2 the pure-Python formatter is used."""
+        monkeypatch.setattr(diff_module, "pygit2", None)
+
+        lines = _diff_file(b"old\n", b"new\n", "f.md")
+
+        assert lines[2:] == ["@@ -1 +1 @@", "-old", "+new"]
+
+    def test_unit_blob_roundtrip(self) -> None:
+        """Encoded originals decode back to the same bytes."""
+        data = "# Título\nUnicode ✓\n".encode()
+
+        assert decode_original(encode_original(data)) == data
+
+
+################################################################################
+#                                                                              #
+# DIFF PACKAGE TESTS                                                           #
+#                                                                              #
+################################################################################
+
+
+class TestDiffPackage:
+    """Tests for diffing installed files against recorded originals."""
+
+    def test_unit_real_diff_from_originals(self, tmp_path: Path) -> None:
+        """Only the changed line and its context appear in the diff."""
+        skill_path = _install(tmp_path, with_originals=True)
+        skill_path.write_text(SKILL_TEXT.replace("line 10\n", "line ten\n"))
+
+        result = diff_package("test-pkg", tmp_path)
+
+        diff = result["diffs"][0]["diff"]
+        assert result["modified_count"] == 1
+        assert "-line 10" in diff
+        assert "+line ten" in diff
+        assert "line 1\n" not in diff
+        assert "@@ -7,7 +7,7 @@" in diff
+
+    def test_unit_missing_originals_diff_against_empty(self, tmp_path: Path) -> None:
+        """Older lock entries without originals show the whole file as added."""
+        skill_path = _install(tmp_path, with_originals=False)
+        skill_path.write_text("changed\n")
+
+        result = diff_package("test-pkg", tmp_path)
+
+        diff = result["diffs"][0]["diff"]
+        assert "@@ -0,0 +1 @@" in diff
+        assert "+changed" in diff
+
+    def test_unit_many_files_keep_order(self, tmp_path: Path) -> None:
+        """Concurrent diffing returns entries in verification order."""
+        pkg_dir = tmp_path / ".aam" / "packages" / "test-pkg"
+        pkg_dir.mkdir(parents=True)
+        for i in range(8):
+            (pkg_dir / f"f{i}.md").write_text(f"original {i}\n")
+
+        checksums = compute_file_checksums(pkg_dir)
+        write_lock_file(
+            LockFile(
+                packages={
+                    "test-pkg": LockedPackage(
+                        version="1.0.0",
+                        source="local",
+                        checksum="sha256:dummy",
+                        file_checksums=FileChecksums(
+                            files=checksums,
+                            originals=compute_file_originals(pkg_dir, list(checksums)),
+                        ),
+                    ),
+                },
+            ),
+            tmp_path,
+        )
+        for i in range(8):
+            (pkg_dir / f"f{i}.md").write_text(f"changed {i}\n")
+
+        result = diff_package("test-pkg", tmp_path)
+
+        assert [d["file"] for d in result["diffs"]] == [f"f{i}.md" for i in range(8)]
+        for i, entry in enumerate(result["diffs"]):
+            assert f"-original {i}" in entry["diff"]
+            assert f"+changed {i}" in entry["diff"]
+
+    def test_unit_non_utf8_file_is_diffed(self, tmp_path: Path) -> None:
+        """Invalid UTF-8 no longer skips the file; bad bytes are replaced."""
+        skill_path = _install(tmp_path, with_originals=True)
+        skill_path.write_bytes(SKILL_TEXT.encode().replace(b"line 10", b"line \xff"))
+
+        result = diff_package("test-pkg", tmp_path)
+
+        assert "+line �" in result["diffs"][0]["diff"]
+
+
+    def test_unit_file_removed_after_verify(self, tmp_path: Path) -> None:
+        """A modified file deleted before diffing is skipped, not an error."""
+        skill_path = _install(tmp_path, with_originals=True)
+        skill_path.write_text("changed\n")
+        verify = diff_module.verify_package
+
+        def verify_then_delete(*args: object) -> dict:
+            result = verify(*args)
+            skill_path.unlink()
+            return result
+
+        with patch.object(diff_module, "verify_package", side_effect=verify_then_delete):
+            result = diff_package("test-pkg", tmp_path)
+
+        assert result["modified_count"] == 1
+        assert result["diffs"] == []
+
+    def test_unit_streaming_window_is_bounded(self) -> None:
+        """Lazy iteration only diffs a bounded window ahead of the consumer."""
+        calls: list[str] = []
+
+        def diff_one(rel_path: str) -> dict:
+            calls.append(rel_path)
+            return {"file": rel_path, "diff": "", "status": "modified"}
+
+        files = [f"f{i}.md" for i in range(200)]
+        stream = diff_module._iter_diffs(files, diff_one)
+
+        first = next(stream)
+        workers = min(diff_module.MAX_DIFF_WORKERS, len(files))
+
+        assert first["file"] == "f0.md"
+        assert len(calls) <= workers * 2 + 1
+        assert [e["file"] for e in stream] == files[1:]
+
+    def test_unit_summary_skips_file_reads(self, tmp_path: Path) -> None:
+        """compute_diffs=False lists modified files without diffing them."""
+        skill_path = _install(tmp_path, with_originals=True)
+        skill_path.write_text("changed\n")
+
+        with patch.object(diff_module, "_diff_one") as diff_one:
+            result = diff_package("test-pkg", tmp_path, compute_diffs=False)
+
+        diff_one.assert_not_called()
+        assert result["diffs"] == [
+            {"file": "skills/my-skill/SKILL.md", "diff": "", "status": "modified"}
+        ]
+
+    def test_unit_fingerprint_fast_path(self, tmp_path: Path) -> None:
+        """An untouched package is reported clean without verification."""
+        skill_path = _install(tmp_path, with_originals=True, with_fingerprint=True)
+        (skill_path.parent / ".hidden").write_text("ignored\n")
+
+        with patch.object(diff_module, "verify_package") as verify:
+            result = diff_package("test-pkg", tmp_path)
+
+        verify.assert_not_called()
+        assert result["modified_count"] == 0
+        assert result["missing_files"] == []
+        assert result["untracked_files"] == []
+
+    def test_unit_fingerprint_covers_tracked_hidden_files(self, tmp_path: Path) -> None:
+        """Editing a recorded hidden file defeats the fast path."""
+        pkg_dir = tmp_path / ".aam" / "packages" / "test-pkg"
+        hidden = pkg_dir / "skills" / "s" / ".hidden.md"
+        hidden.parent.mkdir(parents=True)
+        hidden.write_text("before\n")
+        rel = str(Path("skills", "s", ".hidden.md"))
+        checksums = compute_file_checksums(pkg_dir, files=[rel])
+        write_lock_file(
+            LockFile(
+                packages={
+                    "test-pkg": LockedPackage(
+                        version="1.0.0",
+                        source="local",
+                        checksum="sha256:dummy",
+                        file_checksums=FileChecksums(
+                            files=checksums,
+                            stat_fingerprint=compute_stat_fingerprint(pkg_dir, checksums)[0],
+                        ),
+                    ),
+                },
+            ),
+            tmp_path,
+        )
+        hidden.write_text("after the edit\n")
+
+        result = diff_package("test-pkg", tmp_path, compute_diffs=False)
+
+        assert result["modified_count"] == 1
+        assert verify_package("test-pkg", tmp_path)["modified_files"] == [rel]
+
+    def test_unit_fingerprint_mismatch_runs_verify(self, tmp_path: Path) -> None:
+        """Any metadata change falls back to the full verify-and-diff path."""
+        skill_path = _install(tmp_path, with_originals=True, with_fingerprint=True)
+        skill_path.write_text(SKILL_TEXT + "appended\n")
+
+        result = diff_package("test-pkg", tmp_path)
+
+        assert result["modified_count"] == 1
+        assert "+appended" in result["diffs"][0]["diff"]
+
+
+################################################################################
+#                                                                              #
+# RENDERING TESTS                                                              #
+#                                                                              #
+################################################################################
+
+
+class TestDiffRendering:
+    """Tests for ``aam diff`` Rich output."""
+
+    def test_unit_cli_import_skips_pygments(self) -> None:
+        """Loading the CLI does not import rich.syntax / Pygments."""
+        code = (
+            "import sys, aam_cli.main; "
+            "print('rich.syntax' in sys.modules or 'pygments' in sys.modules)"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert out.stdout.strip() == "False"
+
+    def test_unit_highlighting_built_once(self) -> None:
+        """The lexer and theme are shared across calls."""
+        assert diff_module._diff_highlighting() is diff_module._diff_highlighting()
+
+    def test_unit_renders_each_file(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Every modified file gets a header and its diff body."""
+        skill_path = _install(tmp_path, with_originals=True)
+        skill_path.write_text(SKILL_TEXT.replace("line 10\n", "line ten\n"))
+        monkeypatch.chdir(tmp_path)
+
+        result = CliRunner().invoke(diff_module.diff_cmd, ["test-pkg"])
+
+        assert result.exit_code == 0, result.output
+        assert "skills/my-skill/SKILL.md" in result.output
+        assert "+line ten" in result.output
+
+    def test_unit_renders_missing_and_untracked(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Missing and untracked files are listed after the diffs."""
+        skill_path = _install(tmp_path, with_originals=True)
+        skill_path.unlink()
+        (skill_path.parent / "extra.md").write_text("new\n")
+        monkeypatch.chdir(tmp_path)
+
+        result = CliRunner().invoke(diff_module.diff_cmd, ["test-pkg"])
+
+        assert result.exit_code == 0, result.output
+        assert "Missing files (1):" in result.output
+        assert "- skills/my-skill/SKILL.md" in result.output
+        assert "Untracked files (1):" in result.output
+        assert "+ skills/my-skill/extra.md" in result.output
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_unit_json_output(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+    ) -> None:
+        """``--json`` output parses the same with either encoder."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(diff_module, "orjson", None)
+        skill_path = _install(tmp_path, with_originals=True)
+        skill_path.write_text(SKILL_TEXT.replace("line 10\n", "línea diez\n"))
+        monkeypatch.chdir(tmp_path)
+
+        result = CliRunner().invoke(diff_module.diff_cmd, ["test-pkg", "--json"])
+
+        assert result.exit_code == 0, result.output
+        data = json.loads(result.output)
+        assert data["modified_count"] == 1
+        assert "+línea diez" in data["diffs"][0]["diff"]
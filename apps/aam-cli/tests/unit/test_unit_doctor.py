@@ -0,0 +1,68 @@
+"""Unit tests for the ``aam doctor`` command output."""
+
+################################################################################
+#                                                                              #
+# IMPORTS & DEPENDENCIES                                                       #
+#                                                                              #
+################################################################################
+
+import logging
+from unittest.mock import patch
+
+from click.testing import CliRunner
+from rich.console import Console
+
+from aam_cli.commands.doctor import doctor
+
+################################################################################
+#                                                                              #
+# LOGGING                                                                      #
+#                                                                              #
+################################################################################
+
+logger = logging.getLogger(__name__)
+
+################################################################################
+#                                                                              #
+# DOCTOR COMMAND TESTS                                                         #
+#                                                                              #
+################################################################################
+
+
+class TestDoctorCommand:
+    """Tests for rendering diagnostics results."""
+
+    def test_unit_unhealthy_report(self) -> None:
+        """Checks, suggestions and summary are shown; failure exits 1."""
+        report = {
+            "checks": [
+                {"status": "pass", "message": "Python 3.11"},
+                {
+                    "status": "fail",
+                    "message": "Config invalid [line 3]",
+                    "suggestion": "Run aam config",
+                },
+            ],
+            "healthy": False,
+            "summary": "1 issue found",
+        }
+
+        with patch("aam_cli.commands.doctor.run_diagnostics", return_value=report):
+            result = CliRunner().invoke(doctor, obj={"console": Console()})
+
+        assert result.exit_code == 1
+        lines = [line.rstrip() for line in result.output.splitlines()]
+        assert "  ✓ Python 3.11" in lines
+        assert "  ✗ Config invalid [line 3]" in lines  # not eaten as markup
+        assert "      Run aam config" in lines
+        assert lines[-1] == "✗ 1 issue found"
+
+    def test_unit_healthy_report(self) -> None:
+        """A healthy report exits 0."""
+        report = {"checks": [], "healthy": True, "summary": "All good"}
+
+        with patch("aam_cli.commands.doctor.run_diagnostics", return_value=report):
+            result = CliRunner().invoke(doctor, obj={"console": Console()})
+
+        assert result.exit_code == 0
+        assert result.output.splitlines()[-1].rstrip() == "✓ All good"
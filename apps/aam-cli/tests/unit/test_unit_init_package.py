@@ -0,0 +1,159 @@
+"""Unit tests for the interactive ``aam pkg init`` scaffold.
+
+Drives the command through its prompts with Click's test runner and
+checks the generated directories and ``aam.yaml``.
+"""
+
+################################################################################
+#                                                                              #
+# IMPORTS & DEPENDENCIES                                                       #
+#                                                                              #
+################################################################################
+
+import logging
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+from rich.console import Console
+
+from aam_cli.commands.init_package import _emit_scaffold_yaml, init_package
+from aam_cli.utils.yaml_utils import load_yaml
+
+################################################################################
+#                                                                              #
+# LOGGING                                                                      #
+#                                                                              #
+################################################################################
+
+logger = logging.getLogger(__name__)
+
+################################################################################
+#                                                                              #
+# FIXTURES                                                                     #
+#                                                                              #
+################################################################################
+
+
+@pytest.fixture(autouse=True)
+def no_default_sources():
+    """Keep init from touching the user's global source config."""
+    with patch(
+        "aam_cli.services.source_service.register_default_sources",
+        return_value={"registered": []},
+    ):
+        yield
+
+
+def _run(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, answers: list[str]) -> object:
+    """Run ``init my-pkg`` in *tmp_path* with the given prompt answers."""
+    monkeypatch.chdir(tmp_path)
+    return CliRunner().invoke(
+        init_package,
+        ["my-pkg"],
+        input="\n".join(answers) + "\n",
+        obj={"console": Console()},
+    )
+
+
+################################################################################
+#                                                                              #
+# SCAFFOLD TESTS                                                               #
+#                                                                              #
+################################################################################
+
+
+class TestInitPackage:
+    """Tests for prompt handling and scaffold output."""
+
+    def test_unit_defaults(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Accepting every default selects all types and cursor only."""
+        result = _run(tmp_path, monkeypatch, [""] * 7)
+
+        assert result.exit_code == 0, result.output
+        pkg_dir = tmp_path / "my-pkg"
+        for atype in ("skills", "agents", "prompts", "instructions"):
+            assert (pkg_dir / atype).is_dir()
+
+        manifest = load_yaml(pkg_dir / "aam.yaml")
+        assert manifest["name"] == "my-pkg"
+        assert list(manifest["platforms"]) == ["cursor"]
+
+    def test_unit_existing_type_dirs_kept(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Re-running init over existing directories keeps their contents."""
+        skills = tmp_path / "my-pkg" / "skills"
+        skills.mkdir(parents=True)
+        (skills / "keep.md").write_text("keep\n")
+
+        result = _run(tmp_path, monkeypatch, [""] * 7)
+
+        assert result.exit_code == 0, result.output
+        assert (skills / "keep.md").read_text() == "keep\n"
+
+    def test_unit_batched_choices(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """One answer per group selects several options; unknowns re-prompt."""
+        answers = ["", "", "", "", "", "Skills, prompts", "vim", "claude,codex"]
+
+        result = _run(tmp_path, monkeypatch, answers)
+
+        assert result.exit_code == 0, result.output
+        assert "Unknown choice(s): vim" in result.output
+        pkg_dir = tmp_path / "my-pkg"
+        assert sorted(p.name for p in pkg_dir.iterdir() if p.is_dir()) == [
+            "prompts",
+            "skills",
+        ]
+        manifest = load_yaml(pkg_dir / "aam.yaml")
+        assert list(manifest["platforms"]) == ["claude", "codex"]
+
+    def test_unit_none_selects_nothing(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """``none`` selects no platforms."""
+        result = _run(tmp_path, monkeypatch, ["", "", "", "", "", "", "none"])
+
+        assert result.exit_code == 0, result.output
+        manifest = load_yaml(tmp_path / "my-pkg" / "aam.yaml")
+        assert manifest["platforms"] == {}
+
+    def test_unit_platform_templates(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Each selected platform gets its template config."""
+        answers = ["", "", "", "", "", "", "cursor,claude,copilot,codex"]
+
+        result = _run(tmp_path, monkeypatch, answers)
+
+        assert result.exit_code == 0, result.output
+        manifest = load_yaml(tmp_path / "my-pkg" / "aam.yaml")
+        assert manifest["platforms"] == {
+            "cursor": {"skill_scope": "project", "deploy_instructions_as": "rules"},
+            "claude": {"merge_instructions": True},
+            "copilot": {"merge_instructions": True},
+            "codex": {"skill_scope": "project"},
+        }
+
+    def test_unit_scaffold_yaml_roundtrip(self, tmp_path: Path) -> None:
+        """The direct emitter produces YAML that loads back unchanged."""
+        data = {
+            "name": "@scope/my-pkg",
+            "version": "1.0.0",
+            "description": 'Quotes " and: colons # and ünïcode',
+            "author": "yes",
+            "artifacts": {"skills": [], "agents": []},
+            "dependencies": {},
+            "platforms": {
+                "cursor": {"skill_scope": "project"},
+                "claude": {"merge_instructions": True},
+            },
+        }
+        path = tmp_path / "aam.yaml"
+
+        _emit_scaffold_yaml(data, path)
+
+        assert load_yaml(path) == data
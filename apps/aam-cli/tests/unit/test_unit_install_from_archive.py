@@ -0,0 +1,406 @@
+"""Unit tests for installing a package from a ``.aam`` archive.
+
+Covers the extract-then-rename flow of ``_install_from_archive``: the
+``.partial`` staging directory lives in ``.aam/`` and is always cleaned up.
+Also covers reading the packed ``file_checksums`` from the installed manifest
+and keeping the install backend out of CLI startup.
+"""
+
+################################################################################
+#                                                                              #
+# IMPORTS & DEPENDENCIES                                                       #
+#                                                                              #
+################################################################################
+
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from click.testing import CliRunner
+
+from aam_cli.commands import install
+from aam_cli.commands.install import _install_from_archive, _install_from_directory
+from aam_cli.core.workspace import (
+    LockedPackage,
+    LockFile,
+    get_packages_dir,
+    read_lock_file,
+)
+from aam_cli.main import cli
+from aam_cli.utils.archive import create_archive
+from aam_cli.utils.checksum import calculate_sha256
+
+################################################################################
+#                                                                              #
+# LOGGING                                                                      #
+#                                                                              #
+################################################################################
+
+logger = logging.getLogger(__name__)
+
+################################################################################
+#                                                                              #
+# FIXTURES                                                                     #
+#                                                                              #
+################################################################################
+
+
+def _package_dir(tmp_path: Path) -> Path:
+    """Create a one-skill package source directory."""
+    src = tmp_path / "src"
+    (src / "skills" / "s").mkdir(parents=True)
+    (src / "skills" / "s" / "SKILL.md").write_text("# S\n")
+    (src / "aam.yaml").write_text(
+        "name: my-pkg\nversion: 1.0.0\ndescription: Test\n"
+        "artifacts:\n  skills:\n    - name: s\n      path: skills/s\n"
+        "      description: S\n"
+    )
+    return src
+
+
+@pytest.fixture()
+def archive(tmp_path: Path) -> Path:
+    """Create a one-skill package archive."""
+    return create_archive(_package_dir(tmp_path), tmp_path / "my-pkg-1.0.0.aam")
+
+
+def _install(archive: Path, project: Path) -> MagicMock:
+    """Install *archive* into *project* without deploying."""
+    ctx = MagicMock()
+    _install_from_archive(
+        ctx, MagicMock(), archive, project, "cursor",
+        no_deploy=True, force=False, dry_run=False, lock=read_lock_file(project),
+    )
+    return ctx
+
+
+def _leftover_temp_dirs(project: Path) -> list[str]:
+    """Names of staging or swapped-out dirs left in ``.aam/``."""
+    return [
+        p.name
+        for p in (project / ".aam").iterdir()
+        if p.name.endswith((".partial", ".old"))
+    ]
+
+
+################################################################################
+#                                                                              #
+# ARCHIVE INSTALL TESTS                                                        #
+#                                                                              #
+################################################################################
+
+
+class TestInstallFromArchive:
+    """Tests for moving the extracted tree into ``.aam/packages/``."""
+
+    def test_unit_renamed_into_place(self, archive: Path, tmp_path: Path) -> None:
+        """The package lands in ``.aam/packages`` and the temp dir is gone."""
+        project = tmp_path / "project"
+        project.mkdir()
+
+        _install(archive, project)
+
+        dest = get_packages_dir(project) / "my-pkg"
+        assert (dest / "skills" / "s" / "SKILL.md").read_text() == "# S\n"
+        assert _leftover_temp_dirs(project) == []
+        locked = read_lock_file(project).packages["my-pkg"]
+        assert locked.checksum == calculate_sha256(archive)
+
+    def test_unit_reinstall_replaces_old_tree(
+        self, archive: Path, tmp_path: Path
+    ) -> None:
+        """Stale files from a previous install do not survive a reinstall."""
+        project = tmp_path / "project"
+        project.mkdir()
+        _install(archive, project)
+        stale = get_packages_dir(project) / "my-pkg" / "stale.txt"
+        stale.write_text("old")
+
+        with patch(
+            "aam_cli.commands.install._handle_upgrade_warning", return_value=True
+        ):
+            _install(archive, project)
+
+        assert not stale.exists()
+        assert (stale.parent / "aam.yaml").is_file()
+        assert _leftover_temp_dirs(project) == []
+
+    def test_unit_failed_rename_restores_old_tree(
+        self, archive: Path, tmp_path: Path
+    ) -> None:
+        """If the final rename fails the previous install is put back."""
+        project = tmp_path / "project"
+        project.mkdir()
+        _install(archive, project)
+        dest = get_packages_dir(project) / "my-pkg"
+        real_replace = os.replace
+
+        def _replace(src: str | Path, dst: str | Path) -> None:
+            if Path(src).suffix == ".partial":
+                raise OSError("rename failed")
+            real_replace(src, dst)
+
+        with (
+            patch("aam_cli.commands.install._handle_upgrade_warning", return_value=True),
+            patch("aam_cli.commands.install.os.replace", side_effect=_replace),
+            pytest.raises(OSError, match="rename failed"),
+        ):
+            _install(archive, project)
+
+        assert (dest / "skills" / "s" / "SKILL.md").is_file()
+        assert _leftover_temp_dirs(project) == []
+
+    def test_unit_old_tree_removed_off_main_thread(
+        self, archive: Path, tmp_path: Path
+    ) -> None:
+        """The replaced tree is deleted by a background thread."""
+        project = tmp_path / "project"
+        project.mkdir()
+        _install(archive, project)
+        removed_by: list[str] = []
+        real_rmtree = shutil.rmtree
+
+        def _rmtree(path: str | Path, *args: object, **kwargs: object) -> None:
+            if str(path).endswith(".old"):
+                removed_by.append(threading.current_thread().name)
+            real_rmtree(path, *args, **kwargs)  # type: ignore[arg-type]
+
+        with (
+            patch("aam_cli.commands.install._handle_upgrade_warning", return_value=True),
+            patch("aam_cli.commands.install.shutil.rmtree", side_effect=_rmtree),
+        ):
+            _install(archive, project)
+
+        assert removed_by == ["aam-rmtree-my-pkg"]
+        assert _leftover_temp_dirs(project) == []
+
+    def test_unit_invalid_archive_cleans_temp_dir(self, tmp_path: Path) -> None:
+        """A manifest error exits without leaving the temp dir behind."""
+        src = tmp_path / "bad"
+        src.mkdir()
+        (src / "aam.yaml").write_text("name: [unclosed\n")
+        bad = create_archive(src, tmp_path / "bad.aam")
+        project = tmp_path / "project"
+        project.mkdir()
+
+        ctx = _install(bad, project)
+
+        ctx.exit.assert_called_once_with(1)
+        assert _leftover_temp_dirs(project) == []
+
+
+################################################################################
+#                                                                              #
+# DIRECTORY INSTALL TESTS                                                      #
+#                                                                              #
+################################################################################
+
+
+class TestInstallFromDirectory:
+    """Tests for copying a package directory into ``.aam/packages/``."""
+
+    def test_unit_reinstall_replaces_old_tree(self, tmp_path: Path) -> None:
+        """A reinstall swaps in a fresh copy and leaves no temp dirs."""
+        src = _package_dir(tmp_path)
+        project = tmp_path / "project"
+        project.mkdir()
+
+        def _install_dir() -> None:
+            _install_from_directory(
+                MagicMock(), MagicMock(), src, project, "cursor",
+                no_deploy=True, force=True, dry_run=False,
+                lock=read_lock_file(project),
+            )
+
+        _install_dir()
+        stale = get_packages_dir(project) / "my-pkg" / "stale.txt"
+        stale.write_text("old")
+
+        with patch(
+            "aam_cli.commands.install._handle_upgrade_warning", return_value=True
+        ):
+            _install_dir()
+
+        assert not stale.exists()
+        assert (stale.parent / "skills" / "s" / "SKILL.md").read_text() == "# S\n"
+        assert _leftover_temp_dirs(project) == []
+
+
+################################################################################
+#                                                                              #
+# FILE CHECKSUM READ TESTS                                                     #
+#                                                                              #
+################################################################################
+
+
+class TestReadFileChecksums:
+    """Tests for the stat-keyed parse of ``file_checksums``."""
+
+    @staticmethod
+    def _write(pkg: Path, digest: str) -> None:
+        (pkg / "aam.yaml").write_text(
+            "name: my-pkg\nfile_checksums:\n  algorithm: sha256\n"
+            f"  files:\n    aam.yaml: {digest}\n"
+        )
+
+    def test_unit_unchanged_manifest_parsed_once(self, tmp_path: Path) -> None:
+        """A second read of the same manifest skips the YAML parse."""
+        install._read_checksums_section.cache_clear()
+        self._write(tmp_path, "a" * 64)
+
+        with patch(
+            "aam_cli.commands.install.load_yaml_key", wraps=install.load_yaml_key
+        ) as mock_load:
+            first = install._read_file_checksums_from_package(tmp_path)
+            second = install._read_file_checksums_from_package(tmp_path)
+
+        assert mock_load.call_count == 1
+        assert first is not None and second is not None
+        assert first.files == second.files == {"aam.yaml": "a" * 64}
+
+    def test_unit_edited_manifest_reparsed(self, tmp_path: Path) -> None:
+        """Changing the manifest changes the key and is seen immediately."""
+        install._read_checksums_section.cache_clear()
+        self._write(tmp_path, "a" * 64)
+        install._read_file_checksums_from_package(tmp_path)
+
+        self._write(tmp_path, "b" * 64)
+        st = (tmp_path / "aam.yaml").stat()
+        os.utime(tmp_path / "aam.yaml", ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+        result = install._read_file_checksums_from_package(tmp_path)
+
+        assert result is not None
+        assert result.files == {"aam.yaml": "b" * 64}
+
+    def test_unit_missing_manifest(self, tmp_path: Path) -> None:
+        """No ``aam.yaml`` means no checksums."""
+        assert install._read_file_checksums_from_package(tmp_path) is None
+
+
+################################################################################
+#                                                                              #
+# IMPORT COST TESTS                                                            #
+#                                                                              #
+################################################################################
+
+
+class TestInstallImports:
+    """Tests for keeping the install backend off the CLI startup path."""
+
+    def test_unit_cli_import_skips_resolver(self) -> None:
+        """Loading the CLI does not import the resolver or installer."""
+        code = (
+            "import sys, aam_cli.main; "
+            "print('aam_cli.core.resolver' in sys.modules "
+            "or 'aam_cli.core.installer' in sys.modules)"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert out.stdout.strip() == "False"
+
+
+################################################################################
+#                                                                              #
+# SOURCE DETECTION TESTS                                                       #
+#                                                                              #
+################################################################################
+
+
+class TestSourceDetection:
+    """Tests for routing the ``aam install`` argument to an install path."""
+
+    @pytest.mark.parametrize(
+        ("make", "arg", "target"),
+        [
+            ("file", "pkg.aam", "_install_from_archive"),
+            ("dir", "./pkg", "_install_from_directory"),
+            ("dir", "pkg.aam", "_install_from_registry_or_source"),
+            (None, "./missing", "_install_from_registry_or_source"),
+            (None, "my-pkg", "_install_from_registry_or_source"),
+        ],
+    )
+    def test_unit_routes_by_path_type(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        make: str | None,
+        arg: str,
+        target: str,
+    ) -> None:
+        """Existing ``.aam`` files and ``./`` directories take the local paths."""
+        name = arg.removeprefix("./")
+        if make == "file":
+            (tmp_path / name).write_bytes(b"")
+        elif make == "dir":
+            (tmp_path / name).mkdir()
+        monkeypatch.chdir(tmp_path)
+
+        with patch(f"aam_cli.commands.install.{target}") as mock_target:
+            result = CliRunner().invoke(cli, ["install", arg, "--no-deploy"])
+
+        assert result.exit_code == 0, result.output
+        mock_target.assert_called_once()
+
+
+################################################################################
+#                                                                              #
+# UPGRADE WARNING TESTS                                                        #
+#                                                                              #
+################################################################################
+
+
+class TestUpgradeWarning:
+    """Tests for ``_handle_upgrade_warning``."""
+
+    def test_unit_no_checksums_skips_scan(self, tmp_path: Path) -> None:
+        """Without recorded checksums nothing is hashed or re-read."""
+        lock = LockFile(
+            packages={
+                "my-pkg": LockedPackage(
+                    version="1.0.0", source="local", checksum="sha256:abc"
+                ),
+            },
+        )
+
+        with patch(
+            "aam_cli.services.checksum_service.check_modifications",
+            side_effect=AssertionError("scanned"),
+        ):
+            proceed = install._handle_upgrade_warning(
+                MagicMock(), "my-pkg", tmp_path, force=False, lock=lock
+            )
+
+        assert proceed is True
+
+    def test_unit_listing_printed_in_one_call(self, tmp_path: Path) -> None:
+        """The modified/missing listing is rendered by a single print."""
+        console = MagicMock()
+        mod_result = {
+            "has_checksums": True,
+            "has_modifications": True,
+            "modified_files": [f"m{i}.md" for i in range(7)],
+            "missing_files": ["gone.md"],
+        }
+
+        with patch(
+            "aam_cli.services.checksum_service.check_modifications",
+            return_value=mod_result,
+        ):
+            proceed = install._handle_upgrade_warning(
+                console, "my-pkg", tmp_path, force=True
+            )
+
+        assert proceed is True
+        listing = console.print.call_args_list[0].args[0]
+        assert "m4.md" in listing and "m5.md" not in listing
+        assert "... and 2 more" in listing
+        assert "gone.md" in listing
@@ -13,10 +13,15 @@ Reference: spec 004 US2; tasks.md T024.
 #                                                                              #
 ################################################################################
 
+import hashlib
 import logging
+from pathlib import Path
 
 import pytest
 
+from aam_cli.core.config import AamConfig
+from aam_cli.core.workspace import read_lock_file
+from aam_cli.services.install_service import install_from_source
 from aam_cli.services.source_service import (
     ArtifactIndex,
     VirtualPackage,
@@ -231,3 +236,47 @@ class TestVirtualPackage:
         assert vp.type == "skill"
         assert vp.commit_sha == "abc123"
         assert vp.has_vendor_agent is False
+
+
+################################################################################
+#                                                                              #
+# TEST: install_from_source — FILE CHECKSUMS                                   #
+#                                                                              #
+################################################################################
+
+
+class TestInstallFromSourceChecksums:
+    """Verify the per-file checksums recorded by install_from_source."""
+
+    def test_unit_records_every_staged_file(self, tmp_path: Path) -> None:
+        """Each staged file, hidden ones included, is hashed into the lock."""
+        cache_dir = tmp_path / "cache"
+        skill_dir = cache_dir / "skills" / "review"
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text("# Review\n")
+        (skill_dir / ".gitkeep").write_text("")
+        project = tmp_path / "project"
+        project.mkdir()
+
+        install_from_source(
+            VirtualPackage(
+                name="review",
+                qualified_name="src/review",
+                source_name="src",
+                type="skill",
+                path="skills/review",
+                commit_sha="a" * 40,
+                cache_dir=str(cache_dir),
+            ),
+            project,
+            "cursor",
+            AamConfig(),
+            no_deploy=True,
+        )
+
+        locked = read_lock_file(project).packages["review"]
+        assert locked.file_checksums is not None
+        files = locked.file_checksums.files
+        assert files["skills/review/SKILL.md"] == hashlib.sha256(b"# Review\n").hexdigest()
+        assert files["skills/review/.gitkeep"] == hashlib.sha256(b"").hexdigest()
+        assert "aam.yaml" in files
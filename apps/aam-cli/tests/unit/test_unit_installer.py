@@ -0,0 +1,306 @@
+"""Unit tests for the registry package installer.
+
+Covers the concurrent download / extract phase of ``install_packages``
+and the serialized move / lock-file phase that follows it.
+"""
+
+################################################################################
+#                                                                              #
+# IMPORTS & DEPENDENCIES                                                       #
+#                                                                              #
+################################################################################
+
+import logging
+import shutil
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from aam_cli.core import installer
+from aam_cli.core.config import AamConfig
+from aam_cli.core.installer import install_packages
+from aam_cli.core.resolver import ResolvedPackage
+from aam_cli.core.workspace import (
+    LockedPackage,
+    LockFile,
+    get_packages_dir,
+    is_package_installed,
+    read_lock_file,
+    write_lock_file,
+)
+from aam_cli.utils.archive import create_archive
+from aam_cli.utils.checksum import calculate_sha256
+
+################################################################################
+#                                                                              #
+# LOGGING                                                                      #
+#                                                                              #
+################################################################################
+
+logger = logging.getLogger(__name__)
+
+################################################################################
+#                                                                              #
+# FIXTURES                                                                     #
+#                                                                              #
+################################################################################
+
+
+class _FakeRegistry:
+    """Registry stub that builds a fresh archive on each download."""
+
+    def __init__(self, tmp_path: Path, on_download=None) -> None:
+        self.tmp_path = tmp_path
+        self.on_download = on_download
+        self.calls: list[str] = []
+
+    def download(self, name: str, version: str, dest: Path) -> Path:
+        self.calls.append(name)
+        if self.on_download is not None:
+            self.on_download(name)
+
+        src = self.tmp_path / "src" / name
+        src.mkdir(parents=True, exist_ok=True)
+        (src / "skills" / "s").mkdir(parents=True, exist_ok=True)
+        (src / "skills" / "s" / "SKILL.md").write_text("# S\n")
+        (src / "aam.yaml").write_text(
+            f"name: {name}\nversion: {version}\ndescription: Test\n"
+            "artifacts:\n  skills:\n    - name: s\n      path: skills/s\n"
+            "      description: S\n"
+        )
+        return create_archive(src, dest / f"{name}-{version}.aam")
+
+
+def _resolved(*names: str) -> list[ResolvedPackage]:
+    """Build unchecksummed resolved packages from the ``local`` registry."""
+    return [
+        ResolvedPackage(name=name, version="1.0.0", source="local", checksum="")
+        for name in names
+    ]
+
+
+def _install(
+    tmp_path: Path, registry: _FakeRegistry, names: tuple[str, ...], workers: int = 5
+) -> list[str]:
+    """Run ``install_packages`` with every registry lookup returning *registry*."""
+    config = AamConfig(parallel_downloads=workers)
+    with patch("aam_cli.core.installer._get_registry", return_value=registry):
+        return install_packages(
+            _resolved(*names), None, config, tmp_path, no_deploy=True
+        )
+
+
+################################################################################
+#                                                                              #
+# DOWNLOAD PHASE TESTS                                                         #
+#                                                                              #
+################################################################################
+
+
+class TestParallelDownloads:
+    """Tests for the threaded download and extract phase."""
+
+    def test_unit_installs_in_resolved_order(self, tmp_path: Path) -> None:
+        """Packages are committed in resolver order and scratch files removed."""
+        registry = _FakeRegistry(tmp_path)
+
+        installed = _install(tmp_path, registry, ("alpha", "beta", "gamma"))
+
+        assert installed == ["alpha@1.0.0", "beta@1.0.0", "gamma@1.0.0"]
+        packages_dir = get_packages_dir(tmp_path)
+        for name in ("alpha", "beta", "gamma"):
+            assert (packages_dir / name / "aam.yaml").is_file()
+        assert not (packages_dir / ".downloads").exists()
+        assert sorted(read_lock_file(tmp_path).packages) == ["alpha", "beta", "gamma"]
+
+    def test_unit_downloads_run_concurrently(self, tmp_path: Path) -> None:
+        """With two workers, two downloads are in flight at the same time."""
+        barrier = threading.Barrier(2, timeout=5)
+        registry = _FakeRegistry(tmp_path, on_download=lambda _name: barrier.wait())
+
+        installed = _install(tmp_path, registry, ("alpha", "beta"), workers=2)
+
+        assert len(installed) == 2
+
+    def test_unit_failure_cancels_queued_downloads(self, tmp_path: Path) -> None:
+        """The first failure stops queued work and leaves the lock untouched."""
+
+        def fail_alpha(name: str) -> None:
+            if name == "alpha":
+                raise KeyError("alpha not found")
+
+        registry = _FakeRegistry(tmp_path, on_download=fail_alpha)
+
+        with pytest.raises(KeyError):
+            _install(tmp_path, registry, ("alpha", "beta", "gamma"), workers=1)
+
+        assert registry.calls == ["alpha"]
+        packages_dir = get_packages_dir(tmp_path)
+        assert not (packages_dir / ".downloads").exists()
+        assert read_lock_file(tmp_path).packages == {}
+
+    def test_unit_extraction_runs_in_workers(self, tmp_path: Path) -> None:
+        """Archives are extracted on worker threads, two at a time."""
+        barrier = threading.Barrier(2, timeout=5)
+        real_extract = installer.extract_archive
+
+        def extract(archive: Path, dest: Path) -> None:
+            barrier.wait()
+            real_extract(archive, dest)
+
+        with patch("aam_cli.core.installer.extract_archive", side_effect=extract):
+            installed = _install(tmp_path, _FakeRegistry(tmp_path), ("alpha", "beta"), 2)
+
+        assert installed == ["alpha@1.0.0", "beta@1.0.0"]
+
+    def test_unit_checksum_hashed_during_extraction(self, tmp_path: Path) -> None:
+        """A checksummed archive is read once: hashed while it is extracted."""
+        archive = _FakeRegistry(tmp_path).download("alpha", "1.0.0", tmp_path / "probe")
+        package = ResolvedPackage(
+            name="alpha", version="1.0.0", source="local",
+            checksum=calculate_sha256(archive),
+        )
+        # Serve the same bytes; rebuilding would change the gzip timestamp
+        def download(_name: str, _version: str, dest: Path) -> Path:
+            dest.mkdir(parents=True, exist_ok=True)
+            return Path(shutil.copy(archive, dest))
+
+        registry = MagicMock()
+        registry.download.side_effect = download
+
+        with (
+            patch("aam_cli.core.installer._get_registry", return_value=registry),
+            patch(
+                "aam_cli.utils.checksum.calculate_sha256",
+                side_effect=AssertionError("archive read twice"),
+            ),
+        ):
+            installed = install_packages([package], None, AamConfig(), tmp_path, no_deploy=True)
+
+        assert installed == ["alpha@1.0.0"]
+
+    def test_unit_checksum_mismatch_rejected(self, tmp_path: Path) -> None:
+        """A wrong checksum fails the install and leaves nothing in place."""
+        package = ResolvedPackage(
+            name="alpha", version="1.0.0", source="local", checksum="sha256:" + "0" * 64
+        )
+
+        with (
+            patch("aam_cli.core.installer._get_registry", return_value=_FakeRegistry(tmp_path)),
+            pytest.raises(ValueError, match="Checksum verification failed"),
+        ):
+            install_packages([package], None, AamConfig(), tmp_path, no_deploy=True)
+
+        assert not (get_packages_dir(tmp_path) / "alpha").exists()
+        assert not (get_packages_dir(tmp_path) / ".downloads").exists()
+
+    def test_unit_late_failure_leaves_packages_untouched(self, tmp_path: Path) -> None:
+        """A failing fetch keeps already-extracted siblings out of place."""
+
+        def fail_beta(name: str) -> None:
+            if name == "beta":
+                raise KeyError("beta not found")
+
+        registry = _FakeRegistry(tmp_path, on_download=fail_beta)
+
+        with pytest.raises(KeyError):
+            _install(tmp_path, registry, ("alpha", "beta"), workers=1)
+
+        assert not (get_packages_dir(tmp_path) / "alpha").exists()
+
+    def test_unit_already_installed_not_downloaded(self, tmp_path: Path) -> None:
+        """Packages already locked at the same version are not fetched again."""
+        registry = _FakeRegistry(tmp_path)
+        _install(tmp_path, registry, ("alpha",))
+        registry.calls.clear()
+
+        installed = _install(tmp_path, registry, ("alpha", "beta"))
+
+        assert installed == ["beta@1.0.0"]
+        assert registry.calls == ["beta"]
+
+    def test_unit_reinstall_replaces_existing_dir(self, tmp_path: Path) -> None:
+        """A forced reinstall swaps out the old tree, dropping stale files."""
+        registry = _FakeRegistry(tmp_path)
+        _install(tmp_path, registry, ("alpha",))
+        stale = get_packages_dir(tmp_path) / "alpha" / "stale.txt"
+        stale.write_text("old")
+
+        with patch("aam_cli.core.installer._get_registry", return_value=registry):
+            install_packages(
+                _resolved("alpha"), None, AamConfig(), tmp_path, no_deploy=True, force=True
+            )
+
+        assert not stale.exists()
+        assert (stale.parent / "aam.yaml").is_file()
+
+    def test_unit_manifest_parsed_once_per_package(self, tmp_path: Path) -> None:
+        """Deployment and the lock entry share one manifest parse."""
+        registry = _FakeRegistry(tmp_path)
+
+        with (
+            patch("aam_cli.core.installer._get_registry", return_value=registry),
+            patch(
+                "aam_cli.core.installer.load_manifest", wraps=installer.load_manifest
+            ) as mock_load,
+        ):
+            install_packages(_resolved("alpha", "beta"), MagicMock(), AamConfig(), tmp_path)
+
+        assert mock_load.call_count == 2
+
+
+################################################################################
+#                                                                              #
+# LOCK FILE REUSE TESTS                                                        #
+#                                                                              #
+################################################################################
+
+
+class TestPreloadedLock:
+    """Tests for passing an already-loaded lock file through the install."""
+
+    def test_unit_lock_updated_in_place(self, tmp_path: Path) -> None:
+        """A caller-supplied lock is updated in place, not re-read."""
+        lock = LockFile()
+        config = AamConfig()
+
+        with (
+            patch(
+                "aam_cli.core.installer._get_registry",
+                return_value=_FakeRegistry(tmp_path),
+            ),
+            patch(
+                "aam_cli.core.installer.read_lock_file",
+                side_effect=AssertionError("lock re-read"),
+            ),
+        ):
+            install_packages(
+                _resolved("alpha"), None, config, tmp_path, no_deploy=True, lock=lock
+            )
+
+        assert "alpha" in lock.packages
+        assert "alpha" in read_lock_file(tmp_path).packages
+
+    def test_unit_is_installed_uses_given_lock(self) -> None:
+        """``is_package_installed`` answers from the given lock without disk I/O."""
+        lock = LockFile()
+        lock.packages["alpha"] = LockedPackage(version="1.0.0", source="local", checksum="")
+
+        with patch(
+            "aam_cli.core.workspace.read_lock_file",
+            side_effect=AssertionError("lock re-read"),
+        ):
+            assert is_package_installed("alpha", lock=lock)
+            assert not is_package_installed("beta", lock=lock)
+
+    def test_unit_is_installed_ignores_package_dir(self, tmp_path: Path) -> None:
+        """The lock decides; the package directory is not checked."""
+        lock = LockFile()
+        lock.packages["alpha"] = LockedPackage(version="1.0.0", source="local", checksum="")
+        write_lock_file(lock, tmp_path)
+
+        assert not (get_packages_dir(tmp_path) / "alpha").exists()
+        assert is_package_installed("alpha", tmp_path)
+        assert not is_package_installed("beta", tmp_path)
@@ -0,0 +1,156 @@
+"""Unit tests for the ``aam list --tree`` dependency rendering."""
+
+################################################################################
+#                                                                              #
+# IMPORTS & DEPENDENCIES                                                       #
+#                                                                              #
+################################################################################
+
+import logging
+from pathlib import Path
+
+from rich.console import Console
+from rich.tree import Tree
+
+from aam_cli.commands.list_packages import _add_deps_to_tree, _show_tree
+from aam_cli.core.manifest import ArtifactRef, ArtifactsDeclaration, PackageManifest
+from aam_cli.core.workspace import LockedPackage, LockFile
+
+################################################################################
+#                                                                              #
+# LOGGING                                                                      #
+#                                                                              #
+################################################################################
+
+logger = logging.getLogger(__name__)
+
+################################################################################
+#                                                                              #
+# HELPERS                                                                      #
+#                                                                              #
+################################################################################
+
+
+def _lock(graph: dict[str, list[str]]) -> LockFile:
+    """Build a lock file from a ``name -> dependencies`` mapping."""
+    return LockFile(
+        packages={
+            name: LockedPackage(
+                version="1.0.0",
+                source="local",
+                checksum="",
+                dependencies=dict.fromkeys(deps, "*"),
+            )
+            for name, deps in graph.items()
+        }
+    )
+
+
+def _labels(tree: Tree) -> list[str]:
+    """Flatten a tree into depth-prefixed labels in display order."""
+    out: list[str] = []
+    stack = [(child, 0) for child in reversed(tree.children)]
+    while stack:
+        node, depth = stack.pop()
+        out.append("  " * depth + str(node.label))
+        stack.extend((child, depth + 1) for child in reversed(node.children))
+    return out
+
+
+################################################################################
+#                                                                              #
+# TREE TESTS                                                                   #
+#                                                                              #
+################################################################################
+
+
+class TestAddDepsToTree:
+    """Tests for ``_add_deps_to_tree``."""
+
+    def test_unit_depth_first_order(self) -> None:
+        """Dependencies appear depth-first in declaration order."""
+        lock = _lock({"root": ["a", "b"], "a": ["c"], "b": [], "c": []})
+        tree = Tree("root")
+
+        _add_deps_to_tree(tree, lock.packages["root"], lock, {"root"})
+
+        assert _labels(tree) == ["a@1.0.0", "  c@1.0.0", "b@1.0.0"]
+
+    def test_unit_shared_dependency_expanded_once(self) -> None:
+        """A diamond's shared node is expanded once, then referenced."""
+        lock = _lock({"root": ["a", "b"], "a": ["d"], "b": ["d"], "d": ["e"], "e": []})
+        tree = Tree("root")
+
+        _add_deps_to_tree(tree, lock.packages["root"], lock, {"root"})
+
+        assert _labels(tree) == [
+            "a@1.0.0",
+            "  d@1.0.0",
+            "    e@1.0.0",
+            "b@1.0.0",
+            "  d@1.0.0 [dim](see above)[/dim]",
+        ]
+
+    def test_unit_cycle_terminates(self) -> None:
+        """A dependency cycle is cut at the repeated package."""
+        lock = _lock({"root": ["a"], "a": ["b"], "b": ["a"]})
+        tree = Tree("root")
+
+        _add_deps_to_tree(tree, lock.packages["root"], lock, {"root"})
+
+        assert _labels(tree)[-1] == "    a@1.0.0 [dim](see above)[/dim]"
+
+    def test_unit_missing_dependency(self) -> None:
+        """A dependency absent from the lock is marked not installed."""
+        lock = _lock({"root": ["ghost"]})
+        tree = Tree("root")
+
+        _add_deps_to_tree(tree, lock.packages["root"], lock, {"root"})
+
+        assert _labels(tree) == ["ghost [dim](not installed)[/dim]"]
+
+
+class TestShowTree:
+    """Tests for ``_show_tree``."""
+
+    def test_unit_shared_dependency_expanded_once_across_roots(self, tmp_path: Path) -> None:
+        """A subtree printed under one root is only referenced under the next."""
+        lock = _lock({"app": ["core"], "cli": ["core"], "core": ["util"], "util": []})
+        console = Console(record=True, width=120, color_system=None)
+
+        _show_tree(console, lock, tmp_path)
+
+        text = console.export_text()
+        assert text.count("util@1.0.0") == 1
+        assert text.count("core@1.0.0 (see above)") == 1
+
+
+################################################################################
+#                                                                              #
+# ARTIFACT COUNT TESTS                                                         #
+#                                                                              #
+################################################################################
+
+
+def _ref(name: str) -> ArtifactRef:
+    """Build an artifact reference."""
+    return ArtifactRef(name=name, path=f"x/{name}", description=name)
+
+
+class TestArtifactCounts:
+    """Tests for ``PackageManifest.artifact_counts``."""
+
+    def test_unit_counts_match_all_artifacts(self) -> None:
+        """Per-type counts agree with the flat artifact list."""
+        manifest = PackageManifest(
+            name="pkg",
+            version="1.0.0",
+            description="Package",
+            artifacts=ArtifactsDeclaration(
+                skills=[_ref("a"), _ref("b")],
+                instructions=[_ref("c")],
+            ),
+        )
+
+        assert manifest.artifact_counts == {"skill": 2, "instruction": 1}
+        assert manifest.artifact_count == len(manifest.all_artifacts) == 3
@@ -13,10 +13,15 @@ Reference: spec 004 US4; tasks.md T027.
 ################################################################################
 
 import logging
+import threading
+from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-from aam_cli.core.workspace import LockedPackage
+from aam_cli.commands.outdated import check_outdated
+from aam_cli.core.config import AamConfig, SourceEntry
+from aam_cli.core.workspace import LockedPackage, LockFile
 from aam_cli.services.upgrade_service import OutdatedPackage, OutdatedResult
 
 ################################################################################
@@ -117,3 +122,74 @@ class TestLockedPackageSourceFields:
         result.no_source.append("registry-pkg")
 
         assert "registry-pkg" in result.no_source
+
+
+################################################################################
+#                                                                              #
+# TEST: SOURCE HEAD READS                                                      #
+#                                                                              #
+################################################################################
+
+
+class TestCheckOutdatedSourceHeads:
+    """Tests for the per-source HEAD reads in ``check_outdated``."""
+
+    def _config(self, count: int) -> AamConfig:
+        return AamConfig(
+            sources=[
+                SourceEntry(
+                    name=f"org/repo{i}",
+                    url=f"https://github.com/org/repo{i}",
+                    last_fetched="2000-01-01T00:00:00+00:00",
+                )
+                for i in range(count)
+            ]
+        )
+
+    def _lock(self, count: int) -> LockFile:
+        return LockFile(
+            packages={
+                f"pkg{i}": LockedPackage(
+                    version="0.0.0",
+                    source="source",
+                    checksum="",
+                    source_name=f"org/repo{i}",
+                    source_commit=f"repo{i}",
+                )
+                for i in range(count)
+            }
+        )
+
+    def test_heads_read_concurrently(self) -> None:
+        """All sources are read at once; results keep config order."""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def _head(cache_dir: Path) -> str:
+            barrier.wait()
+            return cache_dir.name
+
+        with (
+            patch("aam_cli.services.git_service.validate_cache", return_value=True),
+            patch("aam_cli.services.git_service.get_head_sha", side_effect=_head),
+        ):
+            result = check_outdated(self._lock(3), self._config(3))
+
+        assert result.up_to_date == ["pkg0", "pkg1", "pkg2"]
+        assert result.stale_sources == ["org/repo0", "org/repo1", "org/repo2"]
+
+    def test_unreadable_source_skipped(self) -> None:
+        """A source whose cache cannot be read leaves its packages unknown."""
+
+        def _head(cache_dir: Path) -> str:
+            if cache_dir.name == "repo1":
+                raise OSError("unreadable")
+            return cache_dir.name
+
+        with (
+            patch("aam_cli.services.git_service.validate_cache", return_value=True),
+            patch("aam_cli.services.git_service.get_head_sha", side_effect=_head),
+        ):
+            result = check_outdated(self._lock(2), self._config(2))
+
+        assert result.up_to_date == ["pkg0"]
+        assert result.no_source == ["pkg1"]
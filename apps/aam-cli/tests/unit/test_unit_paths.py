@@ -0,0 +1,162 @@
+"""Unit tests for project workspace path resolution."""
+
+################################################################################
+#                                                                              #
+# IMPORTS & DEPENDENCIES                                                       #
+#                                                                              #
+################################################################################
+
+import errno
+import logging
+import shutil
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from aam_cli.utils import paths
+from aam_cli.utils.paths import get_lock_file_path, get_packages_dir
+
+################################################################################
+#                                                                              #
+# LOGGING                                                                      #
+#                                                                              #
+################################################################################
+
+logger = logging.getLogger(__name__)
+
+################################################################################
+#                                                                              #
+# RESOLUTION CACHE TESTS                                                       #
+#                                                                              #
+################################################################################
+
+
+class TestProjectRootCache:
+    """Tests for caching the resolved project root."""
+
+    def test_unit_repeated_lookups_resolve_once(self, tmp_path: Path) -> None:
+        """Workspace lookups for the same root share one resolve()."""
+        paths._resolve_root.cache_clear()
+
+        packages = get_packages_dir(tmp_path)
+        lock = get_lock_file_path(tmp_path)
+
+        assert packages == tmp_path.resolve() / ".aam" / "packages"
+        assert lock == tmp_path.resolve() / ".aam" / "aam-lock.yaml"
+        info = paths._resolve_root.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+
+    def test_unit_relative_and_default_follow_cwd(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Relative and omitted roots are re-anchored after chdir."""
+        first, second = tmp_path / "a", tmp_path / "b"
+        first.mkdir()
+        second.mkdir()
+
+        monkeypatch.chdir(first)
+        assert get_packages_dir(Path(".")).parent.parent == first.resolve()
+        assert get_packages_dir().parent.parent == first.resolve()
+
+        monkeypatch.chdir(second)
+        assert get_packages_dir(Path(".")).parent.parent == second.resolve()
+        assert get_packages_dir().parent.parent == second.resolve()
+
+
+################################################################################
+#                                                                              #
+# REFLINK COPY TESTS                                                           #
+#                                                                              #
+################################################################################
+
+
+class TestCopytreeReflink:
+    """Tests for the clone-first tree copy."""
+
+    @pytest.fixture()
+    def source(self, tmp_path: Path) -> Path:
+        """A small tree with a nested file."""
+        src = tmp_path / "src"
+        (src / "skills" / "s").mkdir(parents=True)
+        (src / "aam.yaml").write_text("name: pkg\n")
+        (src / "skills" / "s" / "SKILL.md").write_text("# S\n")
+        return src
+
+    def test_unit_copies_tree(self, source: Path, tmp_path: Path) -> None:
+        """Contents match the source whatever the filesystem supports."""
+        dst = paths.copytree_reflink(source, tmp_path / "dst")
+
+        assert (dst / "aam.yaml").read_text() == "name: pkg\n"
+        assert (dst / "skills" / "s" / "SKILL.md").read_text() == "# S\n"
+
+    def test_unit_unsupported_clone_falls_back(
+        self, source: Path, tmp_path: Path
+    ) -> None:
+        """A refused clone falls back to a regular copy."""
+        refused = OSError(errno.EOPNOTSUPP, "Operation not supported")
+
+        with patch.object(paths, "fcntl") as mock_fcntl:
+            mock_fcntl.ioctl.side_effect = refused
+            dst = paths.copytree_reflink(source, tmp_path / "dst")
+
+        assert (dst / "skills" / "s" / "SKILL.md").read_text() == "# S\n"
+
+    def test_unit_many_files_copied_in_parallel(self, tmp_path: Path) -> None:
+        """Larger trees are copied on pool threads with identical contents."""
+        src = tmp_path / "src"
+        for i in range(paths.PARALLEL_COPY_MIN_FILES):
+            path = src / f"d{i % 4}" / f"f{i}.md"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(f"file {i}\n")
+        copied_on: set[str] = set()
+        real_copy = paths._clone_or_copy
+
+        def _copy(file_src: str, file_dst: str) -> str:
+            copied_on.add(threading.current_thread().name)
+            return real_copy(file_src, file_dst)
+
+        with (
+            patch.object(paths, "MAX_COPY_WORKERS", 4),
+            patch.object(paths, "_clone_or_copy", side_effect=_copy),
+        ):
+            dst = paths.copytree_reflink(src, tmp_path / "dst")
+
+        assert threading.current_thread().name not in copied_on
+        for i in range(paths.PARALLEL_COPY_MIN_FILES):
+            assert (dst / f"d{i % 4}" / f"f{i}.md").read_text() == f"file {i}\n"
+
+    def test_unit_read_only_source_dir(self, source: Path, tmp_path: Path) -> None:
+        """Directory modes are applied after the files inside are copied."""
+        read_only = source / "skills" / "s"
+        read_only.chmod(0o555)
+        try:
+            dst = paths.copytree_reflink(source, tmp_path / "dst")
+        finally:
+            read_only.chmod(0o755)
+
+        assert (dst / "skills" / "s" / "SKILL.md").read_text() == "# S\n"
+        (dst / "skills" / "s").chmod(0o755)
+
+    def test_unit_existing_destination_rejected(
+        self, source: Path, tmp_path: Path
+    ) -> None:
+        """Like ``shutil.copytree``, an existing destination is an error."""
+        (tmp_path / "dst").mkdir()
+
+        with pytest.raises(FileExistsError):
+            paths.copytree_reflink(source, tmp_path / "dst")
+
+    def test_unit_real_clone_errors_propagate(
+        self, source: Path, tmp_path: Path
+    ) -> None:
+        """Errors other than "unsupported" are not swallowed."""
+        if not sys.platform.startswith("linux"):
+            pytest.skip("FICLONE is only attempted on Linux")
+
+        with patch.object(paths, "fcntl") as mock_fcntl:
+            mock_fcntl.ioctl.side_effect = OSError(errno.ENOSPC, "No space left")
+            with pytest.raises(shutil.Error):
+                paths.copytree_reflink(source, tmp_path / "dst")
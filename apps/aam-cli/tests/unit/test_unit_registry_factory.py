@@ -0,0 +1,118 @@
+"""Unit tests for registry construction from configuration.
+
+Covers memoized ``create_registry`` and the on-demand
+``LazyRegistryList`` used during dependency resolution.
+"""
+
+################################################################################
+#                                                                              #
+# IMPORTS & DEPENDENCIES                                                       #
+#                                                                              #
+################################################################################
+
+import logging
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from aam_cli.core.config import RegistrySource
+from aam_cli.registry.factory import LazyRegistryList, create_registry
+from aam_cli.utils.paths import to_file_url
+
+################################################################################
+#                                                                              #
+# LOGGING                                                                      #
+#                                                                              #
+################################################################################
+
+logger = logging.getLogger(__name__)
+
+################################################################################
+#                                                                              #
+# FIXTURES                                                                     #
+#                                                                              #
+################################################################################
+
+
+def _local(name: str, root: Path) -> RegistrySource:
+    """Build a local registry source rooted at *root*."""
+    return RegistrySource(name=name, url=to_file_url(root), type="local")
+
+
+def _unsupported(name: str) -> RegistrySource:
+    """Build a registry source of a type the factory cannot create."""
+    return RegistrySource(name=name, url="https://example.com", type="http")
+
+
+################################################################################
+#                                                                              #
+# FACTORY TESTS                                                                #
+#                                                                              #
+################################################################################
+
+
+class TestCreateRegistry:
+    """Tests for memoized registry construction."""
+
+    def test_unit_same_source_same_instance(self, tmp_path: Path) -> None:
+        """Equal sources map to one shared registry instance."""
+        first = create_registry(_local("local", tmp_path))
+        second = create_registry(_local("local", tmp_path))
+
+        assert first is second
+
+    def test_unit_different_sources_differ(self, tmp_path: Path) -> None:
+        """Different names or URLs get their own instances."""
+        a = create_registry(_local("a", tmp_path))
+        b = create_registry(_local("b", tmp_path))
+
+        assert a is not b
+        assert (a.name, b.name) == ("a", "b")
+
+    def test_unit_unsupported_type_raises(self) -> None:
+        """Unsupported registry types raise ``ValueError``."""
+        with pytest.raises(ValueError, match="Unsupported registry type"):
+            create_registry(_unsupported("remote"))
+
+
+################################################################################
+#                                                                              #
+# LAZY LIST TESTS                                                              #
+#                                                                              #
+################################################################################
+
+
+class TestLazyRegistryList:
+    """Tests for deferring registry construction until it is reached."""
+
+    def test_unit_unreached_registries_not_built(self, tmp_path: Path) -> None:
+        """Stopping after the first registry never builds the rest."""
+        on_error = MagicMock()
+        registries = LazyRegistryList(
+            [_local("local", tmp_path), _unsupported("remote")], on_error=on_error
+        )
+
+        first = next(iter(registries))
+
+        assert first.name == "local"
+        on_error.assert_not_called()
+
+    def test_unit_failures_reported_once(self, tmp_path: Path) -> None:
+        """Unbuildable sources are skipped and reported a single time."""
+        on_error = MagicMock()
+        registries = LazyRegistryList(
+            [_unsupported("remote"), _local("local", tmp_path)], on_error=on_error
+        )
+
+        assert [r.name for r in registries] == ["local"]
+        assert [r.name for r in registries] == ["local"]
+        on_error.assert_called_once()
+        assert on_error.call_args.args[0].name == "remote"
+
+    def test_unit_failure_propagates_without_handler(self) -> None:
+        """Without ``on_error`` the construction error propagates."""
+        registries = LazyRegistryList([_unsupported("remote")])
+
+        with pytest.raises(ValueError):
+            list(registries)
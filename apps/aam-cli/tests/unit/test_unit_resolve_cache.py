@@ -0,0 +1,180 @@
+"""Unit tests for the resolver's on-disk registry metadata cache.
+
+Covers ``MetadataCache`` itself and its use by ``resolve_dependencies``
+against a real ``LocalRegistry``.
+"""
+
+################################################################################
+#                                                                              #
+# IMPORTS & DEPENDENCIES                                                       #
+#                                                                              #
+################################################################################
+
+import logging
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from aam_cli.core.resolver import resolve_dependencies
+from aam_cli.registry.base import PackageMetadata
+from aam_cli.registry.cache import MetadataCache
+from aam_cli.registry.local import LocalRegistry
+from aam_cli.utils.archive import create_archive
+
+################################################################################
+#                                                                              #
+# LOGGING                                                                      #
+#                                                                              #
+################################################################################
+
+logger = logging.getLogger(__name__)
+
+################################################################################
+#                                                                              #
+# FIXTURES                                                                     #
+#                                                                              #
+################################################################################
+
+
+def _publish(registry: LocalRegistry, tmp_path: Path, version: str) -> None:
+    """Publish version *version* of ``my-pkg`` to *registry*."""
+    src = tmp_path / f"src-{version}"
+    (src / "skills" / "s").mkdir(parents=True)
+    (src / "skills" / "s" / "SKILL.md").write_text("# S\n")
+    (src / "aam.yaml").write_text(
+        f"name: my-pkg\nversion: {version}\ndescription: Test\n"
+        "artifacts:\n  skills:\n    - name: s\n      path: skills/s\n"
+        "      description: S\n"
+    )
+    registry.publish(create_archive(src, tmp_path / f"my-pkg-{version}.aam"))
+
+
+@pytest.fixture()
+def registry(tmp_path: Path) -> LocalRegistry:
+    """A local registry with ``my-pkg@1.0.0`` published."""
+    reg = LocalRegistry.init_registry(tmp_path / "registry")
+    _publish(reg, tmp_path, "1.0.0")
+    return reg
+
+
+def _metadata(name: str = "my-pkg") -> PackageMetadata:
+    return PackageMetadata(name=name, description="")
+
+
+################################################################################
+#                                                                              #
+# CACHE TESTS                                                                  #
+#                                                                              #
+################################################################################
+
+
+class TestMetadataCache:
+    """Tests for validator-keyed storage, invalidation and pruning."""
+
+    def test_unit_hit_requires_same_etag(self, tmp_path: Path) -> None:
+        """Entries are only returned for the validator they were stored under."""
+        cache = MetadataCache(tmp_path / "cache")
+        cache.put("local", "@scope/my-pkg", "v1", _metadata("@scope/my-pkg"))
+
+        assert cache.get("local", "@scope/my-pkg", "v1") == _metadata("@scope/my-pkg")
+        assert cache.get("local", "@scope/my-pkg", "v2") is None
+        assert cache.get("other", "@scope/my-pkg", "v1") is None
+
+    def test_unit_corrupt_entry_is_a_miss(self, tmp_path: Path) -> None:
+        """An unreadable entry behaves like a miss."""
+        cache = MetadataCache(tmp_path / "cache")
+        cache.put("local", "my-pkg", "v1", _metadata())
+        (tmp_path / "cache" / "local" / "my-pkg.json").write_text("{not json")
+
+        assert cache.get("local", "my-pkg", "v1") is None
+
+    def test_unit_invalidate(self, tmp_path: Path) -> None:
+        """Single entries and whole registries can be dropped."""
+        cache = MetadataCache(tmp_path / "cache")
+        cache.put("local", "a", "v1", _metadata("a"))
+        cache.put("local", "b", "v1", _metadata("b"))
+
+        cache.invalidate("local", "a")
+        assert cache.get("local", "a", "v1") is None
+        assert cache.get("local", "b", "v1") is not None
+
+        cache.invalidate("local")
+        assert cache.get("local", "b", "v1") is None
+
+    def test_unit_repeat_lookup_skips_parse(self, tmp_path: Path) -> None:
+        """An unchanged entry is served from memory, even by a new instance."""
+        MetadataCache(tmp_path / "cache").put("local", "my-pkg", "v1", _metadata())
+
+        with patch(
+            "aam_cli.registry.cache.json.loads", side_effect=AssertionError("parsed")
+        ):
+            cached = MetadataCache(tmp_path / "cache").get("local", "my-pkg", "v1")
+
+        assert cached == _metadata()
+
+    def test_unit_prunes_oldest_entries(self, tmp_path: Path) -> None:
+        """Writing past ``max_entries`` drops the least recently written."""
+        cache = MetadataCache(tmp_path / "cache", max_entries=2)
+        for i, name in enumerate(("a", "b")):
+            cache.put("local", name, "v1", _metadata(name))
+            entry = tmp_path / "cache" / "local" / f"{name}.json"
+            os.utime(entry, ns=(i * 10**9, i * 10**9))
+
+        cache.put("local", "c", "v1", _metadata("c"))
+
+        assert cache.get("local", "a", "v1") is None
+        assert cache.get("local", "b", "v1") is not None
+        assert cache.get("local", "c", "v1") is not None
+
+
+################################################################################
+#                                                                              #
+# RESOLVER INTEGRATION TESTS                                                   #
+#                                                                              #
+################################################################################
+
+
+class TestResolverCache:
+    """Tests for cache use during dependency resolution."""
+
+    def test_unit_warm_resolve_skips_yaml_parse(
+        self, registry: LocalRegistry, tmp_path: Path
+    ) -> None:
+        """A second resolve is answered from the cache without parsing YAML."""
+        cache = MetadataCache(tmp_path / "cache")
+        cold = resolve_dependencies([("my-pkg", "*")], [registry], cache=cache)
+
+        with patch(
+            "aam_cli.registry.local.load_yaml",
+            side_effect=AssertionError("metadata re-parsed"),
+        ):
+            warm = resolve_dependencies([("my-pkg", "*")], [registry], cache=cache)
+
+        assert [(p.version, p.checksum) for p in warm] == [
+            (p.version, p.checksum) for p in cold
+        ]
+
+    def test_unit_publish_changes_validator(
+        self, registry: LocalRegistry, tmp_path: Path
+    ) -> None:
+        """Publishing a new version is seen even with a warm cache."""
+        cache = MetadataCache(tmp_path / "cache")
+        resolve_dependencies([("my-pkg", "*")], [registry], cache=cache)
+
+        _publish(registry, tmp_path, "1.1.0")
+        resolved = resolve_dependencies([("my-pkg", "*")], [registry], cache=cache)
+
+        assert resolved[0].version == "1.1.0"
+
+    def test_unit_missing_package_not_cached(
+        self, registry: LocalRegistry, tmp_path: Path
+    ) -> None:
+        """Unknown packages still fail and leave no cache entry."""
+        cache = MetadataCache(tmp_path / "cache")
+
+        with pytest.raises(ValueError, match="not found"):
+            resolve_dependencies([("missing", "*")], [registry], cache=cache)
+
+        assert not (tmp_path / "cache" / registry.name / "missing.json").exists()
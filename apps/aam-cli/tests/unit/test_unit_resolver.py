@@ -0,0 +1,118 @@
+"""Unit tests for registry dependency resolution.
+
+Covers the level-by-level BFS in ``resolve_dependencies``: concurrent
+registry lookups whose results are applied in queue order.
+"""
+
+################################################################################
+#                                                                              #
+# IMPORTS & DEPENDENCIES                                                       #
+#                                                                              #
+################################################################################
+
+import logging
+import threading
+
+import pytest
+
+from aam_cli.core.resolver import resolve_dependencies
+from aam_cli.registry.base import PackageMetadata, VersionInfo
+
+################################################################################
+#                                                                              #
+# LOGGING                                                                      #
+#                                                                              #
+################################################################################
+
+logger = logging.getLogger(__name__)
+
+################################################################################
+#                                                                              #
+# FIXTURES                                                                     #
+#                                                                              #
+################################################################################
+
+
+class _FakeRegistry:
+    """In-memory registry that records metadata lookups."""
+
+    def __init__(self, name: str, packages: dict[str, list[str]], on_lookup=None) -> None:
+        self.name = name
+        self.packages = packages
+        self.on_lookup = on_lookup
+        self.lookups: list[str] = []
+
+    def get_metadata(self, name: str) -> PackageMetadata:
+        self.lookups.append(name)
+        if self.on_lookup is not None:
+            self.on_lookup(name)
+        if name not in self.packages:
+            raise KeyError(name)
+        return PackageMetadata(
+            name=name,
+            description="",
+            versions=[
+                VersionInfo(version=v, published="", checksum=f"sha256:{v}", size=0)
+                for v in self.packages[name]
+            ],
+        )
+
+
+################################################################################
+#                                                                              #
+# RESOLUTION TESTS                                                             #
+#                                                                              #
+################################################################################
+
+
+class TestResolveDependencies:
+    """Tests for concurrent, order-preserving resolution."""
+
+    def test_unit_roots_resolved_in_order(self) -> None:
+        """Results follow the order of the root specs."""
+        registry = _FakeRegistry("local", {"a": ["1.0.0"], "b": ["2.0.0", "1.0.0"]})
+
+        resolved = resolve_dependencies([("b", "*"), ("a", "*")], [registry])
+
+        assert [(p.name, p.version, p.source) for p in resolved] == [
+            ("b", "2.0.0", "local"),
+            ("a", "1.0.0", "local"),
+        ]
+        assert resolved[0].checksum == "sha256:2.0.0"
+
+    def test_unit_lookups_run_concurrently(self) -> None:
+        """Two root packages are looked up at the same time."""
+        barrier = threading.Barrier(2, timeout=5)
+        registry = _FakeRegistry(
+            "local", {"a": ["1.0.0"], "b": ["1.0.0"]}, on_lookup=lambda _n: barrier.wait()
+        )
+
+        resolved = resolve_dependencies([("a", "*"), ("b", "*")], [registry])
+
+        assert [p.name for p in resolved] == ["a", "b"]
+
+    def test_unit_single_metadata_read_per_registry(self) -> None:
+        """Each registry is asked for a package's metadata only once."""
+        first = _FakeRegistry("first", {})
+        second = _FakeRegistry("second", {"a": ["1.0.0"]})
+
+        resolved = resolve_dependencies([("a", "*")], [first, second])
+
+        assert resolved[0].source == "second"
+        assert (first.lookups, second.lookups) == (["a"], ["a"])
+
+    def test_unit_conflict_still_detected(self) -> None:
+        """A second, incompatible constraint on a resolved package fails."""
+        registry = _FakeRegistry("local", {"a": ["2.0.0", "1.0.0"]})
+
+        with pytest.raises(ValueError, match="Dependency conflict"):
+            resolve_dependencies([("a", "*"), ("a", "<2.0.0")], [registry])
+
+        assert registry.lookups == ["a"]
+
+    def test_unit_missing_package_raises(self) -> None:
+        """An unknown package reports a not-found error."""
+        registry = _FakeRegistry("local", {"a": ["1.0.0"]})
+
+        with pytest.raises(ValueError, match="'missing' not found"):
+            resolve_dependencies([("a", "*"), ("missing", "*")], [registry])
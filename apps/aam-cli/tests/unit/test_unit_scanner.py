@@ -0,0 +1,214 @@
+"""Unit tests for local project scanning (scan_project).
+
+Covers platform-convention detection for project directories, such as
+the ``.cursor/rules/*.mdc`` agent / instruction split.
+"""
+
+################################################################################
+#                                                                              #
+# IMPORTS & DEPENDENCIES                                                       #
+#                                                                              #
+################################################################################
+
+import logging
+from pathlib import Path
+
+import pytest
+
+from aam_cli.detection.scanner import scan_project
+
+################################################################################
+#                                                                              #
+# LOGGING                                                                      #
+#                                                                              #
+################################################################################
+
+logger = logging.getLogger(__name__)
+
+################################################################################
+#                                                                              #
+# FIXTURES                                                                     #
+#                                                                              #
+################################################################################
+
+
+@pytest.fixture
+def cursor_project(tmp_path: Path) -> Path:
+    """Create a project with Cursor rules and root-level instructions.
+
+    Structure:
+      .cursor/
+        rules/
+          agent-reviewer.mdc
+          style.mdc
+          notes.txt
+      CLAUDE.md
+    """
+    root = tmp_path / "project"
+    rules = root / ".cursor" / "rules"
+    rules.mkdir(parents=True)
+
+    (rules / "agent-reviewer.mdc").write_text("Review code.\n")
+    (rules / "style.mdc").write_text("Use black.\n")
+    (rules / "notes.txt").write_text("Not a rule.\n")
+    (root / "CLAUDE.md").write_text("# Claude\n")
+
+    return root
+
+
+################################################################################
+#                                                                              #
+# CURSOR RULES TESTS                                                           #
+#                                                                              #
+################################################################################
+
+
+class TestCursorRules:
+    """Tests for ``.cursor/rules/*.mdc`` classification."""
+
+    def test_unit_agent_prefixed_rule_is_agent(self, cursor_project: Path) -> None:
+        """``agent-<name>.mdc`` is detected as an agent named ``<name>``."""
+        result = scan_project(cursor_project)
+
+        agents = [a for a in result if a.type == "agent"]
+        assert [a.name for a in agents] == ["reviewer"]
+        assert agents[0].platform == "cursor"
+        assert agents[0].source_path == Path(".cursor/rules/agent-reviewer.mdc")
+
+    def test_unit_plain_rule_is_instruction(self, cursor_project: Path) -> None:
+        """Non-agent ``.mdc`` files are detected as cursor instructions."""
+        result = scan_project(cursor_project)
+
+        instructions = {a.name: a for a in result if a.type == "instruction"}
+        assert "style" in instructions
+        assert instructions["style"].platform == "cursor"
+        assert "notes" not in instructions
+
+    def test_unit_standalone_instruction_detected(self, cursor_project: Path) -> None:
+        """Root-level ``CLAUDE.md`` is detected as a claude instruction."""
+        result = scan_project(cursor_project)
+
+        names = {a.name for a in result if a.type == "instruction"}
+        assert "claude-instructions" in names
+
+    def test_unit_missing_rules_dir(self, tmp_path: Path) -> None:
+        """A project without ``.cursor/rules`` yields no cursor artifacts."""
+        result = scan_project(tmp_path)
+
+        assert [a for a in result if a.platform == "cursor"] == []
+
+
+################################################################################
+#                                                                              #
+# EXCLUSION TESTS                                                              #
+#                                                                              #
+################################################################################
+
+
+class TestProjectExclusion:
+    """Tests for pruning excluded directories during the project walk."""
+
+    def test_unit_installed_packages_not_detected(self, tmp_path: Path) -> None:
+        """Skills and agents under ``.aam/packages`` are never reported."""
+        installed = tmp_path / ".aam" / "packages" / "dep" / "skills" / "dep-skill"
+        installed.mkdir(parents=True)
+        (installed / "SKILL.md").write_text("# Dep\n")
+        (installed / "agent.yaml").write_text("name: dep\n")
+
+        own = tmp_path / "skills" / "own-skill"
+        own.mkdir(parents=True)
+        (own / "SKILL.md").write_text("# Own\n")
+
+        result = scan_project(tmp_path)
+
+        assert [(a.type, a.name) for a in result] == [("skill", "own-skill")]
+
+    def test_unit_excluded_dirs_pruned(self, tmp_path: Path) -> None:
+        """Markers inside excluded directories like node_modules are skipped."""
+        hidden = tmp_path / "node_modules" / "pkg" / "my-agent"
+        hidden.mkdir(parents=True)
+        (hidden / "agent.yaml").write_text("name: hidden\n")
+
+        agent_dir = tmp_path / "agents" / "visible"
+        agent_dir.mkdir(parents=True)
+        (agent_dir / "agent.yaml").write_text("name: visible\n")
+
+        result = scan_project(tmp_path)
+
+        agents = [a for a in result if a.type == "agent"]
+        assert [a.name for a in agents] == ["visible"]
+        assert agents[0].source_path == Path("agents/visible")
+
+
+################################################################################
+#                                                                              #
+# ORDERING TESTS                                                               #
+#                                                                              #
+################################################################################
+
+
+class TestOrdering:
+    """Tests for deterministic scan output order."""
+
+    def test_unit_sorted_by_type_then_name(self, tmp_path: Path) -> None:
+        """Results are ordered by type rank, then by artifact name."""
+        for skill in ("zeta", "alpha", "mid"):
+            skill_dir = tmp_path / "skills" / skill
+            skill_dir.mkdir(parents=True)
+            (skill_dir / "SKILL.md").write_text(f"# {skill}\n")
+        (tmp_path / "prompts").mkdir()
+        (tmp_path / "prompts" / "b.md").write_text("B\n")
+        (tmp_path / "prompts" / "a.md").write_text("A\n")
+
+        result = scan_project(tmp_path)
+
+        assert [(a.type, a.name) for a in result] == [
+            ("skill", "alpha"),
+            ("skill", "mid"),
+            ("skill", "zeta"),
+            ("prompt", "a"),
+            ("prompt", "b"),
+        ]
+
+
+################################################################################
+#                                                                              #
+# FRONTMATTER TESTS                                                            #
+#                                                                              #
+################################################################################
+
+
+class TestSkillFrontmatter:
+    """Tests for SKILL.md frontmatter description extraction."""
+
+    def test_unit_description_from_frontmatter(self, tmp_path: Path) -> None:
+        """The frontmatter ``description`` becomes the skill description."""
+        skill_dir = tmp_path / "skills" / "pdf"
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text(
+            "---\nname: pdf\ndescription: Work with PDF files\n---\n# PDF\nBody.\n"
+        )
+
+        result = scan_project(tmp_path)
+
+        assert result[0].description == "Work with PDF files"
+
+    def test_unit_no_frontmatter_keeps_default(self, tmp_path: Path) -> None:
+        """Skills without frontmatter keep the location-based description."""
+        skill_dir = tmp_path / "skills" / "plain"
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text("# Plain\nNo frontmatter here.\n")
+
+        result = scan_project(tmp_path)
+
+        assert result[0].description == "Skill at skills/plain"
+
+    def test_unit_empty_skill_md(self, tmp_path: Path) -> None:
+        """An empty SKILL.md is still detected."""
+        skill_dir = tmp_path / "empty"
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_text("")
+
+        result = scan_project(tmp_path)
+
+        assert [a.name for a in result] == ["empty"]
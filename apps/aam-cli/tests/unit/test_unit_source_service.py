@@ -20,13 +20,17 @@ import pytest
 
 from aam_cli.core.config import AamConfig, SourceEntry
 from aam_cli.detection.scanner import DetectedArtifact
+from aam_cli.registry.local import LocalRegistry
 from aam_cli.services.source_service import (
+    VirtualPackage,
+    _publish_virtual_package_to_registry,
     add_source,
     list_sources,
     remove_source,
     scan_source,
     update_source,
 )
+from aam_cli.utils.paths import copytree_reflink
 
 ################################################################################
 #                                                                              #
@@ -338,3 +342,44 @@ class TestRemoveSource:
         remove_source("openai/skills")
 
         assert "openai/skills" in config.removed_defaults
+
+
+################################################################################
+#                                                                              #
+# PUBLISH VIRTUAL PACKAGE TESTS                                                #
+#                                                                              #
+################################################################################
+
+
+class TestPublishVirtualPackage:
+    """Tests for source_service._publish_virtual_package_to_registry()."""
+
+    def test_unit_stages_inside_registry(self, tmp_path: Path) -> None:
+        """Staging happens under the registry root and is cleaned up."""
+        cache_dir = tmp_path / "cache"
+        skill = cache_dir / "skills" / "code-review"
+        skill.mkdir(parents=True)
+        (skill / "SKILL.md").write_text("# Code review\n")
+        registry_dir = tmp_path / "registry"
+        registry = LocalRegistry.init_registry(registry_dir, force=True)
+        vp = VirtualPackage(
+            name="code-review",
+            qualified_name="src/code-review",
+            source_name="src",
+            type="skill",
+            path="skills/code-review",
+            commit_sha="abc123",
+            cache_dir=str(cache_dir),
+        )
+        staged: list[Path] = []
+
+        def _copytree(src: Path, dst: Path) -> Path:
+            staged.append(dst)
+            return copytree_reflink(src, dst)
+
+        with patch("aam_cli.utils.paths.copytree_reflink", side_effect=_copytree):
+            _publish_virtual_package_to_registry(registry, vp, registry_dir)
+
+        assert staged and staged[0].is_relative_to(registry_dir)
+        assert not any(p.name.startswith(".stage-") for p in registry_dir.iterdir())
+        assert registry.get_metadata("code-review") is not None
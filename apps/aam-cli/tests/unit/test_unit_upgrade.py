@@ -1,6 +1,7 @@
 """Unit tests for ``aam upgrade`` command.
 
-Tests upgrade result model, dry-run behavior, and force flag.
+Tests upgrade result model, dry-run behavior, force flag, and that a
+batch upgrade writes the lock file once.
 
 Reference: spec 004 US5; tasks.md T030.
 """
@@ -12,8 +13,21 @@ Reference: spec 004 US5; tasks.md T030.
 ################################################################################
 
 import logging
-
-from aam_cli.services.upgrade_service import UpgradeResult
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from rich.console import Console
+
+from aam_cli.commands.upgrade import upgrade_packages
+from aam_cli.core.config import AamConfig
+from aam_cli.core.workspace import (
+    LockedPackage,
+    LockFile,
+    read_lock_file,
+    write_lock_file,
+)
+from aam_cli.services.upgrade_service import OutdatedPackage, UpgradeResult
 
 ################################################################################
 #                                                                              #
@@ -90,3 +104,68 @@ class TestUpgradeResult:
         assert result.total_upgraded == 1
         assert len(result.skipped) == 1
         assert len(result.failed) == 1
+
+
+################################################################################
+#                                                                              #
+# TEST: LOCK FILE WRITES                                                       #
+#                                                                              #
+################################################################################
+
+
+class TestUpgradeLockWrites:
+    """Verify a batch upgrade reads and writes the lock file once."""
+
+    def test_unit_batch_writes_lock_once(self, tmp_path: Path) -> None:
+        """Upgrading several packages persists one combined lock."""
+        targets = [
+            OutdatedPackage(
+                name=f"pkg-{i}",
+                current_commit="abc1234",
+                latest_commit="def5678",
+                source_name="my-source",
+                has_local_modifications=False,
+            )
+            for i in range(3)
+        ]
+
+        def fake_install(**kwargs: Any) -> dict[str, Any]:
+            lock: LockFile = kwargs["lock"]
+            name = kwargs["virtual_package"].name
+            lock.packages[name] = LockedPackage(
+                version="0.0.0", source="source", checksum="sha256:abc"
+            )
+            return {"status": "installed", "name": name}
+
+        def fake_resolve(name: str, index: Any) -> MagicMock:
+            package = MagicMock()
+            package.name = name
+            return package
+
+        with (
+            patch("aam_cli.services.source_service.build_source_index"),
+            patch(
+                "aam_cli.services.source_service.resolve_artifact",
+                side_effect=fake_resolve,
+            ),
+            patch(
+                "aam_cli.services.install_service.install_from_source",
+                side_effect=fake_install,
+            ),
+            patch(
+                "aam_cli.core.workspace.write_lock_file",
+                wraps=write_lock_file,
+            ) as write_lock,
+        ):
+            result = upgrade_packages(
+                targets=targets,
+                config=AamConfig(),
+                project_dir=tmp_path,
+                force=False,
+                dry_run=False,
+                console=Console(quiet=True),
+            )
+
+        assert result.total_upgraded == 3
+        assert write_lock.call_count == 1
+        assert set(read_lock_file(tmp_path).packages) == {"pkg-0", "pkg-1", "pkg-2"}
@@ -0,0 +1,371 @@
+"""Unit tests for lock file reading and writing.
+
+Covers the JSON cache of the parsed lock (``.aam/cache/lock.json``) that
+lets ``read_lock_file`` skip YAML parsing while ``aam-lock.yaml`` is
+unchanged, the ``edit_lock_file`` read-once/write-once context, and the
+stat-keyed cache behind ``read_installed_manifests``.
+"""
+
+################################################################################
+#                                                                              #
+# IMPORTS & DEPENDENCIES                                                       #
+#                                                                              #
+################################################################################
+
+import logging
+import os
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from aam_cli.core import workspace
+from aam_cli.core.manifest import PackageManifest
+from aam_cli.core.workspace import (
+    FileChecksums,
+    LockedPackage,
+    LockFile,
+    edit_lock_file,
+    get_installed_packages,
+    get_lock_file,
+    read_installed_manifests,
+    read_lock_file,
+    write_lock_file,
+)
+from aam_cli.utils.paths import (
+    get_lock_cache_path,
+    get_lock_file_path,
+    get_manifest_cache_path,
+    get_packages_dir,
+)
+
+################################################################################
+#                                                                              #
+# LOGGING                                                                      #
+#                                                                              #
+################################################################################
+
+logger = logging.getLogger(__name__)
+
+################################################################################
+#                                                                              #
+# FIXTURES                                                                     #
+#                                                                              #
+################################################################################
+
+
+def _lock() -> LockFile:
+    """A lock with one package carrying file checksums."""
+    return LockFile(
+        packages={
+            "@scope/my-pkg": LockedPackage(
+                version="1.0.0",
+                source="local",
+                checksum="sha256:abc",
+                dependencies={"dep": "2.0.0"},
+                file_checksums=FileChecksums(files={"aam.yaml": "d" * 64}),
+            ),
+        },
+    )
+
+
+_NO_YAML = patch(
+    "aam_cli.core.workspace.parse_yaml_text",
+    side_effect=AssertionError("lock YAML re-parsed"),
+)
+
+################################################################################
+#                                                                              #
+# LOCK CACHE TESTS                                                             #
+#                                                                              #
+################################################################################
+
+
+class TestLockCache:
+    """Tests for serving ``read_lock_file`` from the JSON cache."""
+
+    def test_unit_write_then_read_skips_yaml(self, tmp_path: Path) -> None:
+        """A lock written by AAM is read back without parsing YAML."""
+        write_lock_file(_lock(), tmp_path)
+
+        with _NO_YAML:
+            lock = read_lock_file(tmp_path)
+
+        assert lock.packages == _lock().packages
+
+    def test_unit_hand_edit_invalidates(self, tmp_path: Path) -> None:
+        """Editing ``aam-lock.yaml`` by hand is picked up on the next read."""
+        write_lock_file(_lock(), tmp_path)
+        lock_path = get_lock_file_path(tmp_path)
+        lock_path.write_text(lock_path.read_text().replace("1.0.0", "1.1.0"))
+
+        lock = read_lock_file(tmp_path)
+
+        assert lock.packages["@scope/my-pkg"].version == "1.1.0"
+        with _NO_YAML:
+            assert read_lock_file(tmp_path) == lock
+
+    def test_unit_corrupt_cache_falls_back(self, tmp_path: Path) -> None:
+        """An unreadable cache is ignored and rebuilt from YAML."""
+        write_lock_file(_lock(), tmp_path)
+        get_lock_cache_path(tmp_path).write_text("{not json")
+
+        assert read_lock_file(tmp_path).packages == _lock().packages
+
+    def test_unit_yaml_parse_skips_malformed_entries(self, tmp_path: Path) -> None:
+        """Non-mapping package entries and an empty ``packages`` key are ignored."""
+        lock_path = get_lock_file_path(tmp_path)
+        lock_path.parent.mkdir(parents=True)
+        lock_path.write_text(
+            "lockfile_version: 1\npackages:\n  bad: 1.0.0\n"
+            "  good:\n    version: 1.0.0\n    source: local\n    checksum: ''\n"
+        )
+
+        assert list(read_lock_file(tmp_path).packages) == ["good"]
+
+        lock_path.write_text("lockfile_version: 1\npackages:\n")
+        assert read_lock_file(tmp_path) == LockFile()
+
+    def test_unit_parses_the_hashed_bytes(self, tmp_path: Path) -> None:
+        """The lock is read once; the cached digest matches what was parsed."""
+        write_lock_file(_lock(), tmp_path)
+        lock_path = get_lock_file_path(tmp_path)
+        lock_path.write_text(lock_path.read_text().replace("1.0.0", "1.1.0"))
+
+        with patch.object(Path, "read_text", side_effect=AssertionError("re-read")):
+            lock = read_lock_file(tmp_path)
+
+        assert lock.packages["@scope/my-pkg"].version == "1.1.0"
+        with _NO_YAML:
+            assert read_lock_file(tmp_path) == lock
+
+    def test_unit_missing_lock_is_empty(self, tmp_path: Path) -> None:
+        """No lock file yields an empty lock and writes no cache."""
+        assert read_lock_file(tmp_path) == LockFile()
+        assert not get_lock_cache_path(tmp_path).exists()
+
+
+################################################################################
+#                                                                              #
+# EDIT CONTEXT TESTS                                                           #
+#                                                                              #
+################################################################################
+
+
+class TestEditLockFile:
+    """Tests for the ``edit_lock_file`` context manager."""
+
+    def test_unit_changes_written_once(self, tmp_path: Path) -> None:
+        """Several updates inside the block produce a single write."""
+        with (
+            patch("aam_cli.core.workspace.write_lock_file", wraps=write_lock_file) as write,
+            edit_lock_file(tmp_path) as lock,
+        ):
+            for name in ("a", "b", "c"):
+                lock.packages[name] = LockedPackage(version="1.0.0", source="local", checksum="")
+
+        assert write.call_count == 1
+        assert set(read_lock_file(tmp_path).packages) == {"a", "b", "c"}
+
+    def test_unit_unchanged_lock_not_written(self, tmp_path: Path) -> None:
+        """A block that changes nothing leaves ``aam-lock.yaml`` alone."""
+        write_lock_file(_lock(), tmp_path)
+        before = get_lock_file_path(tmp_path).read_bytes()
+
+        with edit_lock_file(tmp_path):
+            pass
+
+        assert get_lock_file_path(tmp_path).read_bytes() == before
+
+    def test_unit_written_when_block_raises(self, tmp_path: Path) -> None:
+        """Entries recorded before an error are still persisted."""
+        with pytest.raises(RuntimeError), edit_lock_file(tmp_path) as lock:
+            lock.packages["a"] = LockedPackage(version="1.0.0", source="local", checksum="")
+            raise RuntimeError("boom")
+
+        assert "a" in read_lock_file(tmp_path).packages
+
+
+################################################################################
+#                                                                              #
+# LOCK SNAPSHOT TESTS                                                          #
+#                                                                              #
+################################################################################
+
+
+class TestGetLockFile:
+    """Tests for the stat-keyed read-only lock snapshot."""
+
+    def test_unit_repeat_reads_skip_parsing(self, tmp_path: Path) -> None:
+        """An unchanged lock file is served from the snapshot."""
+        write_lock_file(_lock(), tmp_path)
+        first = get_lock_file(tmp_path)
+
+        with patch(
+            "aam_cli.core.workspace.read_lock_file", side_effect=AssertionError("read")
+        ):
+            assert get_lock_file(tmp_path) is first
+            assert "@scope/my-pkg" in get_installed_packages(tmp_path)
+
+    def test_unit_write_refreshes_snapshot(self, tmp_path: Path) -> None:
+        """A written lock is visible on the next call."""
+        write_lock_file(_lock(), tmp_path)
+        get_lock_file(tmp_path)
+
+        lock = read_lock_file(tmp_path)
+        lock.packages["other"] = LockedPackage(version="2.0.0", source="local", checksum="")
+        write_lock_file(lock, tmp_path)
+
+        assert set(get_lock_file(tmp_path).packages) == {"@scope/my-pkg", "other"}
+
+    def test_unit_missing_lock_is_empty(self, tmp_path: Path) -> None:
+        """No lock file yields an empty model."""
+        assert get_lock_file(tmp_path).packages == {}
+
+
+################################################################################
+#                                                                              #
+# LOCK GRAPH TESTS                                                             #
+#                                                                              #
+################################################################################
+
+
+class TestLockGraph:
+    """Tests for ``LockFile.root_packages`` and ``LockFile.dependents_of``."""
+
+    def _graph(self) -> LockFile:
+        deps = {"app": ["lib", "util"], "lib": ["util"], "util": [], "tool": ["tool"]}
+        return LockFile(
+            packages={
+                name: LockedPackage(
+                    version="1.0.0",
+                    source="local",
+                    checksum="",
+                    dependencies=dict.fromkeys(names, "*"),
+                )
+                for name, names in deps.items()
+            }
+        )
+
+    def test_unit_root_packages(self) -> None:
+        """Only packages nothing depends on are roots, in lock order."""
+        assert self._graph().root_packages() == ["app"]
+
+    def test_unit_dependents_of(self) -> None:
+        """Dependents are listed in lock order, excluding the package itself."""
+        lock = self._graph()
+
+        assert lock.dependents_of("util") == ["app", "lib"]
+        assert lock.dependents_of("tool") == []
+
+
+################################################################################
+#                                                                              #
+# INSTALLED MANIFEST TESTS                                                     #
+#                                                                              #
+################################################################################
+
+
+class TestReadInstalledManifests:
+    """Tests for the stat-keyed installed manifest cache."""
+
+    def _install(self, project_dir: Path, name: str, version: str = "1.0.0") -> Path:
+        pkg_dir = get_packages_dir(project_dir) / name
+        (pkg_dir / "skills" / "s").mkdir(parents=True, exist_ok=True)
+        (pkg_dir / "aam.yaml").write_text(
+            f"name: {name}\nversion: {version}\ndescription: Test\n"
+            "artifacts:\n  skills:\n  - name: s\n    path: skills/s/\n"
+            "    description: A skill\n"
+        )
+        return pkg_dir
+
+    def _lock_for(self, *names: str) -> LockFile:
+        return LockFile(
+            packages={
+                n: LockedPackage(version="1.0.0", source="local", checksum="") for n in names
+            }
+        )
+
+    def test_unit_second_read_skips_parse(self, tmp_path: Path) -> None:
+        """Unchanged manifests are served from the cache without YAML parsing."""
+        self._install(tmp_path, "pkg")
+        lock = self._lock_for("pkg")
+        first = read_installed_manifests(lock, tmp_path)
+
+        with patch(
+            "aam_cli.core.workspace.load_manifest", side_effect=AssertionError("parsed")
+        ):
+            second = read_installed_manifests(lock, tmp_path)
+
+        assert second == first
+        assert second["pkg"].artifact_count == 1
+        assert get_manifest_cache_path(tmp_path).is_file()
+
+    def test_unit_changed_manifest_reparsed(self, tmp_path: Path) -> None:
+        """A new stat for ``aam.yaml`` invalidates its entry."""
+        pkg_dir = self._install(tmp_path, "pkg")
+        lock = self._lock_for("pkg")
+        read_installed_manifests(lock, tmp_path)
+
+        self._install(tmp_path, "pkg", version="2.0.0")
+        st = (pkg_dir / "aam.yaml").stat()
+        os.utime(pkg_dir / "aam.yaml", ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        assert str(read_installed_manifests(lock, tmp_path)["pkg"].version) == "2.0.0"
+
+    def test_unit_missing_and_invalid_manifests(self, tmp_path: Path) -> None:
+        """Missing manifests are omitted; unparseable ones map to ``None``."""
+        bad_dir = get_packages_dir(tmp_path) / "bad"
+        bad_dir.mkdir(parents=True)
+        (bad_dir / "aam.yaml").write_text("name: [\n")
+
+        manifests = read_installed_manifests(self._lock_for("bad", "gone"), tmp_path)
+
+        assert manifests == {"bad": None}
+
+    def test_unit_directory_without_manifest_is_none(self, tmp_path: Path) -> None:
+        """A package directory lacking ``aam.yaml`` maps to ``None``."""
+        (get_packages_dir(tmp_path) / "empty").mkdir(parents=True)
+
+        assert read_installed_manifests(self._lock_for("empty"), tmp_path) == {"empty": None}
+
+    def test_unit_absent_packages_not_stat(self, tmp_path: Path) -> None:
+        """Packages missing from the directory listing cost no ``stat``."""
+        self._install(tmp_path, "here")
+        lock = self._lock_for("here", *(f"gone-{i}" for i in range(5)))
+
+        with patch.object(Path, "stat", autospec=True, wraps=Path.stat) as mock_stat:
+            manifests = read_installed_manifests(lock, tmp_path)
+
+        stat_paths = [call.args[0] for call in mock_stat.call_args_list]
+        assert set(manifests) == {"here"}
+        assert not any("gone-" in str(path) for path in stat_paths)
+
+    def test_unit_misses_parsed_concurrently(self, tmp_path: Path) -> None:
+        """Cache misses are parsed in parallel and keep lock order."""
+        names = ["c-pkg", "a-pkg", "b-pkg"]
+        for name in names:
+            self._install(tmp_path, name)
+        barrier = threading.Barrier(len(names), timeout=5)
+        real_load = workspace.load_manifest
+
+        def _load(path: Path) -> PackageManifest:
+            barrier.wait()
+            return real_load(path)
+
+        with patch("aam_cli.core.workspace.load_manifest", side_effect=_load):
+            manifests = read_installed_manifests(self._lock_for(*names), tmp_path)
+
+        assert list(manifests) == names
+        assert [m.name for m in manifests.values()] == names
+
+    def test_unit_removed_packages_pruned(self, tmp_path: Path) -> None:
+        """Entries for packages no longer in the lock are dropped."""
+        self._install(tmp_path, "a")
+        self._install(tmp_path, "b")
+        read_installed_manifests(self._lock_for("a", "b"), tmp_path)
+
+        read_installed_manifests(self._lock_for("a"), tmp_path)
+
+        assert '"b"' not in get_manifest_cache_path(tmp_path).read_text()
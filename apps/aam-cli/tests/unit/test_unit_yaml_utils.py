@@ -0,0 +1,239 @@
+"""Unit tests for the safe YAML helpers.
+
+Covers ``load_yaml_optional`` (a single open attempt per call, with a
+missing file reported as an empty mapping), ``load_yaml_key``, the
+choice of safe loader and atomic ``dump_yaml`` writes.
+"""
+
+################################################################################
+#                                                                              #
+# IMPORTS & DEPENDENCIES                                                       #
+#                                                                              #
+################################################################################
+
+import logging
+import stat
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from aam_cli.utils import yaml_utils
+from aam_cli.utils.yaml_utils import (
+    dump_yaml,
+    load_yaml,
+    load_yaml_key,
+    load_yaml_optional,
+    parse_yaml_text,
+)
+
+################################################################################
+#                                                                              #
+# LOGGING                                                                      #
+#                                                                              #
+################################################################################
+
+logger = logging.getLogger(__name__)
+
+################################################################################
+#                                                                              #
+# OPTIONAL LOAD TESTS                                                          #
+#                                                                              #
+################################################################################
+
+
+class TestLoadYamlOptional:
+    """Tests for ``load_yaml_optional``."""
+
+    def test_unit_missing_file_is_empty(self, tmp_path: Path) -> None:
+        """A missing file yields ``{}`` without a separate existence check."""
+        with patch.object(Path, "exists", side_effect=AssertionError("stat")):
+            assert load_yaml_optional(tmp_path / "missing.yaml") == {}
+
+    def test_unit_existing_file_parsed(self, tmp_path: Path) -> None:
+        """An existing file is parsed like ``load_yaml``."""
+        path = tmp_path / "aam-lock.yaml"
+        path.write_text("lockfile_version: 1\npackages: {}\n")
+
+        assert load_yaml_optional(path) == {"lockfile_version": 1, "packages": {}}
+
+    def test_unit_invalid_yaml_still_raises(self, tmp_path: Path) -> None:
+        """Only a missing file is tolerated; malformed YAML still errors."""
+        path = tmp_path / "bad.yaml"
+        path.write_text("key: [unclosed\n")
+
+        with pytest.raises(yaml.YAMLError):
+            load_yaml_optional(path)
+
+
+################################################################################
+#                                                                              #
+# SINGLE KEY LOAD TESTS                                                        #
+#                                                                              #
+################################################################################
+
+
+class TestLoadYamlKey:
+    """Tests for ``load_yaml_key``."""
+
+    def _write(self, tmp_path: Path, text: str) -> Path:
+        path = tmp_path / "aam.yaml"
+        path.write_text(text)
+        return path
+
+    def test_unit_reads_block_without_full_parse(self, tmp_path: Path) -> None:
+        """The key's block is parsed on its own."""
+        path = self._write(
+            tmp_path,
+            "name: pkg\ndescription: |\n  long text\nfile_checksums:\n"
+            "  algorithm: sha256\n  files:\n    a.md: abc\nartifacts:\n- x\n",
+        )
+
+        with patch(
+            "aam_cli.utils.yaml_utils.parse_yaml_text",
+            side_effect=AssertionError("full parse"),
+        ):
+            value = load_yaml_key(path, "file_checksums")
+
+        assert value == {"algorithm": "sha256", "files": {"a.md": "abc"}}
+
+    def test_unit_missing_key_is_none(self, tmp_path: Path) -> None:
+        """An absent key yields ``None``."""
+        path = self._write(tmp_path, "name: pkg\n")
+
+        assert load_yaml_key(path, "file_checksums") is None
+
+    def test_unit_nested_mention_is_not_top_level(self, tmp_path: Path) -> None:
+        """A nested key of the same name is not mistaken for the top level."""
+        path = self._write(tmp_path, "meta:\n  file_checksums: nested\n")
+
+        assert load_yaml_key(path, "file_checksums") is None
+
+    def test_unit_flow_block_falls_back(self, tmp_path: Path) -> None:
+        """A flow mapping wrapped onto column 0 is read via the full parse."""
+        path = self._write(
+            tmp_path, "file_checksums: {files: {a.md: abc,\nb.md: def}}\nname: pkg\n"
+        )
+
+        assert load_yaml_key(path, "file_checksums") == {
+            "files": {"a.md": "abc", "b.md": "def"}
+        }
+
+
+################################################################################
+#                                                                              #
+# LOADER TESTS                                                                 #
+#                                                                              #
+################################################################################
+
+
+class TestSafeLoader:
+    """Tests for the loader used by the YAML helpers."""
+
+    @pytest.mark.skipif(not yaml.__with_libyaml__, reason="PyYAML built without libyaml")
+    def test_unit_uses_libyaml_when_available(self) -> None:
+        """The C-accelerated safe loader is preferred."""
+        assert yaml_utils._SafeLoader is yaml.CSafeLoader
+
+    def test_unit_python_tags_rejected(self, tmp_path: Path) -> None:
+        """The loader stays safe: arbitrary Python objects are refused."""
+        with pytest.raises(yaml.YAMLError):
+            parse_yaml_text("x: !!python/object/apply:os.getcwd []\n", tmp_path / "evil.yaml")
+
+    def test_unit_matches_pure_python_loader(self, tmp_path: Path) -> None:
+        """Parsed data is identical to ``yaml.safe_load``."""
+        text = (
+            "name: pkg\nversion: 1.0.0\ndescription: |\n  multi\n  line\n"
+            "keywords: [a, b]\nenabled: true\ncount: 3\nratio: 0.5\nempty: ~\n"
+        )
+
+        assert parse_yaml_text(text, tmp_path / "aam.yaml") == yaml.safe_load(text)
+
+
+################################################################################
+#                                                                              #
+# ATOMIC DUMP TESTS                                                            #
+#                                                                              #
+################################################################################
+
+
+class TestDumpYamlAtomic:
+    """Tests for ``dump_yaml(..., atomic=True)``."""
+
+    def test_unit_replaces_content(self, tmp_path: Path) -> None:
+        """The new content lands and no temporary file is left behind."""
+        path = tmp_path / "aam-lock.yaml"
+        path.write_text("old: 1\n")
+
+        dump_yaml({"new": 2}, path, atomic=True)
+
+        assert load_yaml(path) == {"new": 2}
+        assert [p.name for p in tmp_path.iterdir()] == ["aam-lock.yaml"]
+
+    def test_unit_failed_dump_keeps_old_content(self, tmp_path: Path) -> None:
+        """A serialization error leaves the original file untouched."""
+        path = tmp_path / "aam-lock.yaml"
+        path.write_text("old: 1\n")
+
+        with pytest.raises(yaml.YAMLError):
+            dump_yaml({"bad": object()}, path, atomic=True)
+
+        assert path.read_text() == "old: 1\n"
+        assert [p.name for p in tmp_path.iterdir()] == ["aam-lock.yaml"]
+
+
+################################################################################
+#                                                                              #
+# DEFAULT DUMP TESTS                                                           #
+#                                                                              #
+################################################################################
+
+
+class TestDumpYaml:
+    """Tests for ``dump_yaml`` without ``atomic``."""
+
+    def test_unit_failed_dump_keeps_old_content(self, tmp_path: Path) -> None:
+        """A serialization error never truncates the existing file."""
+        path = tmp_path / "config.yaml"
+        path.write_text("keep: me\n")
+
+        with pytest.raises(yaml.YAMLError):
+            dump_yaml({"bad": object()}, path)
+
+        assert path.read_text() == "keep: me\n"
+        assert [p.name for p in tmp_path.iterdir()] == ["config.yaml"]
+
+    def test_unit_streams_without_rendering_text(self, tmp_path: Path) -> None:
+        """The document is written straight to the file, not built as a string."""
+        path = tmp_path / "config.yaml"
+
+        with patch.object(
+            yaml_utils, "dump_yaml_text", side_effect=AssertionError("rendered")
+        ):
+            dump_yaml({"new": 2}, path)
+
+        assert load_yaml(path) == {"new": 2}
+
+    def test_unit_preserves_mode(self, tmp_path: Path) -> None:
+        """The rewritten file keeps the permissions of the old one."""
+        path = tmp_path / "config.yaml"
+        path.write_text("old: 1\n")
+        path.chmod(0o600)
+
+        dump_yaml({"new": 2}, path)
+
+        assert load_yaml(path) == {"new": 2}
+        assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+    def test_unit_writes_through_symlink(self, tmp_path: Path) -> None:
+        """A symlinked path stays a symlink; its target gets the content."""
+        real = tmp_path / "real.yaml"
+        real.write_text("old: 1\n")
+        link = tmp_path / "config.yaml"
+        link.symlink_to(real)
+
+        dump_yaml({"new": 2}, link)
+
+        assert link.is_symlink()
+        assert load_yaml(real) == {"new": 2}